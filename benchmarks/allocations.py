@@ -0,0 +1,146 @@
+"""
+Mesure des allocations mémoire de la recherche IA (tracemalloc).
+
+Joue un coup de l'IA sur une série de positions reproductibles and relève, pour
+chaque coup : le pic de mémoire allouée pendant la recherche, le nombre d'objets
+GameState créés and le nombre de nœuds minimax visités.
+
+Par défaut, le moteur quoridor_engine.py est mesuré. Pour comparer deux versions,
+extraire l'ancienne version du moteur (or de "Projet IA.py" pour les révisions qui
+précèdent quoridor_engine.py) puis lancer :
+    git show <revision>:quoridor_engine.py > /tmp/avant.py
+    python benchmarks/allocations.py --module /tmp/avant.py
+    python benchmarks/allocations.py
+"""
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Les anciennes révisions de "Projet IA.py" initialisent pygame à l'import
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MOTEUR = os.path.join(RACINE, "quoridor_engine.py")
+
+
+def charger_module(chemin):
+    """Charge le module du jeu depuis un chemin de fichier ("Projet IA.py" contient un espace)"""
+    spec = importlib.util.spec_from_file_location("quoridor_bench", chemin)
+    module = importlib.util.module_from_spec(spec)
+    # Enregistré sous son nom : les processus de calcul y retrouvent les fonctions à exécuter
+    sys.modules["quoridor_bench"] = module
+    spec.loader.exec_module(module)
+    # Les mesures portent sur la recherche : pas de coups lus dans le livre d'ouvertures
+    if hasattr(module, 'configurer_livre_ouvertures'):
+        module.configurer_livre_ouvertures(None)
+    return module
+
+
+def positions_de_test(jeu, nombre, graine):
+    """Positions tirées de parties Intermédiaire contre Intermédiaire reproductibles"""
+    alea = random.Random(graine)
+    positions = []
+    while len(positions) < nombre:
+        random.seed(alea.random())
+        etat = jeu.GameState()
+        for _ in range(alea.randrange(4, 24)):
+            coup, type_coup = jeu.meilleur_coup_ia(etat, jeu.DIFFICULTY_MEDIUM)
+            if type_coup == "deplacement":
+                etat = etat.deplacer(etat.tour, coup[0] * jeu.GRID_SIZE + coup[1])
+            elif type_coup == "mur" and jeu.mur_est_valide(coup, etat):
+                etat = etat.poser_mur(etat.tour, coup)
+            else:
+                etat = etat.passer()
+            if etat.pos_j1 // jeu.GRID_SIZE == 8 or etat.pos_j2 // jeu.GRID_SIZE == 0:
+                break
+        else:
+            positions.append(etat)
+    return positions
+
+
+def preparer_coup(jeu, graine):
+    """Remet à zéro les caches pour que chaque coup parte du même point"""
+    jeu.table_transposition.vider()
+    jeu._cache_distances.clear()
+    random.seed(graine)
+
+
+def compter(jeu, positions, difficulte):
+    """Nombre d'états créés and de nœuds minimax visités (sans tracemalloc)"""
+    compteurs = {'etats': 0, 'noeuds': 0}
+    copie, init, minimax = jeu.GameState.copie, jeu.GameState.__init__, jeu.minimax
+
+    def copie_comptee(etat):
+        compteurs['etats'] += 1
+        return copie(etat)
+
+    def init_compte(etat, *args, **kwargs):
+        compteurs['etats'] += 1
+        init(etat, *args, **kwargs)
+
+    def minimax_compte(*args, **kwargs):
+        compteurs['noeuds'] += 1
+        return minimax(*args, **kwargs)
+
+    jeu.GameState.copie, jeu.GameState.__init__, jeu.minimax = copie_comptee, init_compte, minimax_compte
+    try:
+        for indice, etat in enumerate(positions):
+            preparer_coup(jeu, indice)
+            jeu.meilleur_coup_ia(etat, difficulte)
+    finally:
+        jeu.GameState.copie, jeu.GameState.__init__, jeu.minimax = copie, init, minimax
+    return compteurs
+
+
+def mesurer(jeu, positions, difficulte):
+    """Pic de mémoire (octets) au-dessus du niveau de départ and durée de chaque coup"""
+    pics = []
+    duree = 0.0
+    for indice, etat in enumerate(positions):
+        preparer_coup(jeu, indice)
+        tracemalloc.start()
+        depart, _ = tracemalloc.get_traced_memory()
+        debut = time.perf_counter()
+        jeu.meilleur_coup_ia(etat, difficulte)
+        duree += time.perf_counter() - debut
+        _, pic = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        pics.append(pic - depart)
+    return pics, duree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default=MOTEUR,
+                        help="fichier du jeu à mesurer (par défaut la version courante)")
+    parser.add_argument('--positions', type=int, default=20, help="nombre de positions de test")
+    parser.add_argument('--graine', type=int, default=2024, help="graine des positions de test")
+    parser.add_argument('--difficulte', choices=('easy', 'medium', 'hard'), default='hard')
+    args = parser.parse_args()
+
+    jeu = charger_module(args.module)
+    difficulte = {'easy': jeu.DIFFICULTY_EASY, 'medium': jeu.DIFFICULTY_MEDIUM,
+                  'hard': jeu.DIFFICULTY_HARD}[args.difficulte]
+    positions = positions_de_test(jeu, args.positions, args.graine)
+
+    compteurs = compter(jeu, positions, difficulte)
+    pics, duree = mesurer(jeu, positions, difficulte)
+
+    nombre = len(positions)
+    print(f"module            : {args.module}")
+    print(f"positions         : {nombre} (difficulté {args.difficulte})")
+    print(f"nœuds minimax     : {compteurs['noeuds'] / nombre:.0f} par coup")
+    print(f"états créés       : {compteurs['etats'] / nombre:.1f} par coup, "
+          f"{compteurs['etats'] / max(1, compteurs['noeuds']):.3f} par nœud")
+    print(f"pic mémoire       : {sum(pics) / nombre / 1024:.1f} Kio en moyenne, {max(pics) / 1024:.1f} Kio au maximum")
+    print(f"temps (tracemalloc actif) : {duree / nombre * 1000:.0f} ms par coup")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Expérience : évaluation NumPy d'une fratrie de feuilles en une passe (evaluer_positions_lot).
+
+Les termes des trois fonctions d'évaluation du moteur sont calculés sur des tableaux, à
+partir des cartes de distances en cache. Les scores sont ceux que donneraient
+evaluer_position, evaluer_position_intermediaire or evaluer_position_difficile, qui
+restent la référence. Sur les fratries réelles de minimax (3 à 5 déplacements), le coût
+fixe des appels NumPy rend le lot plus lent que les appels scalaires (mesures
+feuilles_scalaires and feuilles_lot de suite.py) ; il ne gagne qu'à partir de quelques
+dizaines de positions par appel. Le moteur n'y fait donc pas appel.
+
+Les fonctions prennent en premier argument le module du jeu mesuré (voir
+allocations.charger_module). NumPy est nécessaire.
+"""
+import random
+
+import numpy as np
+
+# Cartes de distances converties en tableaux NumPy, mêmes clés que le cache du moteur
+_cache_distances_np = {}
+
+
+def carte_distances_np(jeu, etat, ligne_obj):
+    """carte_distances sous forme de tableau NumPy (float64, inf pour les cases sans chemin), en cache"""
+    cle = (etat.murs_h, etat.murs_v, ligne_obj)
+    carte = _cache_distances_np.get(cle)
+    if carte is None:
+        if len(_cache_distances_np) >= jeu.TAILLE_MAX_CACHE_DISTANCES:
+            _cache_distances_np.clear()
+        carte = np.array(jeu.carte_distances(etat, ligne_obj), dtype=np.float64)
+        _cache_distances_np[cle] = carte
+    return carte
+
+
+def _chemins_par_case(jeu, etat, cases, ligne_obj):
+    """count_chemins_alternatifs de chaque case du tableau, calculé une seule fois par case distincte"""
+    distinctes, inverse = np.unique(cases, return_inverse=True)
+    chemins = np.array([jeu.count_chemins_alternatifs(divmod(int(case), jeu.GRID_SIZE), ligne_obj, etat,
+                                                      max_depth=6)
+                        for case in distinctes], dtype=np.float64)
+    return chemins[inverse]
+
+
+def evaluer_positions_lot(jeu, etat, cases_j1, cases_j2, murs_j1, murs_j2, joueur_principal=2,
+                          difficulte=None, alea=random):
+    """
+    Évalue en une passe NumPy une fratrie de positions qui ont les murs posés de etat
+    and diffèrent par les cases des pions and les murs restants (typiquement les
+    positions après chacun des déplacements d'un même nœud).
+
+    Seuls les chemins alternatifs du niveau difficile sont comptés case par case (une fois
+    par case distincte), and le bruit du niveau facile est tiré position par position,
+    dans l'ordre, pour consommer le générateur comme les appels scalaires successifs.
+
+    Args:
+        jeu: Module du jeu mesuré
+        etat: GameState dont les murs posés sont communs à toutes les positions
+        cases_j1, cases_j2: Cases (ligne * 9 + colonne) des pions, une par position
+        murs_j1, murs_j2: Murs restants de chaque joueur, un par position
+        joueur_principal: Le joueur dont on évalue les positions (1 or 2)
+        difficulte: Niveau dont on reproduit la fonction d'évaluation (par défaut difficile)
+        alea: Générateur du bruit du niveau facile (comme pour evaluer_position)
+
+    Returns:
+        numpy.ndarray: Scores (float64) dans l'ordre des positions
+    """
+    if difficulte is None:
+        difficulte = jeu.DIFFICULTY_HARD
+    cases_j1 = np.asarray(cases_j1, dtype=np.int64)
+    cases_j2 = np.asarray(cases_j2, dtype=np.int64)
+    murs_j1 = np.asarray(murs_j1, dtype=np.int64)
+    murs_j2 = np.asarray(murs_j2, dtype=np.int64)
+
+    if joueur_principal == 1:
+        cases_joueur, cases_adversaire = cases_j1, cases_j2
+        murs_joueur, murs_adversaire = murs_j1, murs_j2
+        ligne_obj_joueur, ligne_obj_adversaire = 8, 0
+    else:
+        cases_joueur, cases_adversaire = cases_j2, cases_j1
+        murs_joueur, murs_adversaire = murs_j2, murs_j1
+        ligne_obj_joueur, ligne_obj_adversaire = 0, 8
+
+    ligne_joueur, colonne_joueur = np.divmod(cases_joueur, jeu.GRID_SIZE)
+    ligne_adversaire, colonne_adversaire = np.divmod(cases_adversaire, jeu.GRID_SIZE)
+    gagne = ligne_joueur == ligne_obj_joueur
+    perdu = ~gagne & (ligne_adversaire == ligne_obj_adversaire)
+
+    dist_joueur = carte_distances_np(jeu, etat, ligne_obj_joueur)[cases_joueur]
+    dist_adversaire = carte_distances_np(jeu, etat, ligne_obj_adversaire)[cases_adversaire]
+    if joueur_principal == 1:
+        avance = ligne_joueur
+    else:
+        avance = 8 - ligne_joueur
+    ecart_centre = np.abs(colonne_joueur - 4)
+
+    if difficulte == jeu.DIFFICULTY_EASY:
+        position_score = (dist_adversaire - dist_joueur) * 3.0
+        progres_joueur = avance * 2.0
+        centre_score = np.where((3 <= colonne_joueur) & (colonne_joueur <= 5), 0.3, 0.0)
+        fin_de_partie = (dist_joueur <= 3) | (dist_adversaire <= 3)
+        murs_score = np.where(fin_de_partie, (murs_joueur - murs_adversaire) * 0.5, 0.0)
+        # Un tirage par position non terminale, comme les appels scalaires successifs
+        bruit = np.zeros(len(cases_joueur))
+        en_cours = ~(gagne | perdu)
+        bruit[en_cours] = [alea.uniform(-2.0, 2.0) for _ in range(int(en_cours.sum()))]
+        scores = position_score + progres_joueur + centre_score + murs_score + bruit
+    elif difficulte == jeu.DIFFICULTY_MEDIUM:
+        position_score = 7.0 * dist_adversaire - 3.0 * dist_joueur
+        progres_joueur = avance * 2.0
+        murs_score = (murs_joueur - murs_adversaire * 0.8) * 1.2
+        dist_a_adversaire = np.abs(ligne_joueur - ligne_adversaire) + np.abs(colonne_joueur - colonne_adversaire)
+        bonus_blocage = np.where((dist_a_adversaire <= 2) & (1 <= ligne_adversaire) & (ligne_adversaire <= 7),
+                                 3.0, 0.0)
+        if joueur_principal == 1:
+            moitie_adverse = ligne_joueur >= 4
+        else:
+            moitie_adverse = ligne_joueur <= 4
+        centre_score = np.where((3 <= colonne_joueur) & (colonne_joueur <= 5),
+                                np.where(moitie_adverse, 2.5, 1.0), 0.0)
+        penalite_ecart = -ecart_centre * 0.5
+        scores = position_score + progres_joueur + murs_score + bonus_blocage + centre_score + penalite_ecart
+    else:  # difficulté DIFFICULTY_HARD
+        position_score = (dist_adversaire - dist_joueur) * 5.5
+        progres_joueur = avance * 3.5
+        centre_score = np.where((2 <= colonne_joueur) & (colonne_joueur <= 6), (6 - ecart_centre * 2) * 1.0, 0.0)
+        if joueur_principal == 1:
+            position_avancee = ligne_joueur >= 5
+        else:
+            position_avancee = ligne_joueur <= 3
+        position_strategique = np.where(position_avancee, 2.0, 0.0)
+        score_flexibilite = (_chemins_par_case(jeu, etat, cases_joueur, ligne_obj_joueur)
+                             - _chemins_par_case(jeu, etat, cases_adversaire, ligne_obj_adversaire)) * 0.5
+        nombre_murs = etat.nombre_murs()
+        if nombre_murs < 8:
+            murs_score = murs_joueur * 0.4
+        elif nombre_murs < 16:
+            murs_score = murs_joueur / (murs_adversaire + 0.1) * 2.0
+        else:
+            murs_score = np.where(dist_joueur < dist_adversaire, murs_joueur * 0.8, murs_joueur * 0.3)
+        scores = (position_score + progres_joueur + centre_score + position_strategique + score_flexibilite
+                  + murs_score)
+
+    return np.where(gagne, 10000.0, np.where(perdu, -10000.0, scores))
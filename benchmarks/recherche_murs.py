@@ -0,0 +1,57 @@
+"""
+Vitesse de la recherche avec les murs comme coups de l'arbre (nœuds par seconde).
+
+Compare, sur des positions reproductibles, la recherche des déplacements seuls
+(meilleur_deplacement_pour_joueur) and la recherche où les poses de murs sont aussi
+des coups à chaque niveau (meilleur_coup_avec_murs_pour_joueur), profondeur par profondeur.
+
+    python benchmarks/recherche_murs.py --difficulte hard --profondeurs 2 3 4
+"""
+import argparse
+import sys
+import time
+
+from allocations import MOTEUR, charger_module, positions_de_test, preparer_coup
+
+
+def mesurer(jeu, recherche, positions, profondeur, difficulte):
+    """Nœuds visités and durée totale d'une recherche racine sur chaque position"""
+    noeuds = 0
+    duree = 0.0
+    for indice, etat in enumerate(positions):
+        preparer_coup(jeu, indice)
+        contexte = jeu.ContexteRecherche()
+        debut = time.perf_counter()
+        recherche(etat, etat.tour, profondeur, difficulte, contexte=contexte)
+        duree += time.perf_counter() - debut
+        noeuds += contexte.noeuds
+    return noeuds, duree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default=MOTEUR,
+                        help="fichier du jeu à mesurer (par défaut la version courante)")
+    parser.add_argument('--positions', type=int, default=5, help="nombre de positions de test")
+    parser.add_argument('--graine', type=int, default=2024, help="graine des positions de test")
+    parser.add_argument('--difficulte', choices=('medium', 'hard'), default='medium')
+    parser.add_argument('--profondeurs', type=int, nargs='+', default=[2, 3])
+    args = parser.parse_args()
+
+    jeu = charger_module(args.module)
+    difficulte = {'medium': jeu.DIFFICULTY_MEDIUM, 'hard': jeu.DIFFICULTY_HARD}[args.difficulte]
+    positions = positions_de_test(jeu, args.positions, args.graine)
+    recherches = (("déplacements", jeu.meilleur_deplacement_pour_joueur),
+                  ("avec murs", jeu.meilleur_coup_avec_murs_pour_joueur))
+
+    print(f"{len(positions)} positions, difficulté {args.difficulte}")
+    print(f"{'prof.':>5}  {'recherche':<13} {'nœuds/coup':>10} {'ms/coup':>9} {'nœuds/s':>9}")
+    for profondeur in args.profondeurs:
+        for nom, recherche in recherches:
+            noeuds, duree = mesurer(jeu, recherche, positions, profondeur, difficulte)
+            print(f"{profondeur:>5}  {nom:<13} {noeuds / len(positions):>10.0f} "
+                  f"{duree / len(positions) * 1000:>9.0f} {noeuds / duree:>9.0f}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
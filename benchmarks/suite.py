@@ -0,0 +1,362 @@
+"""
+Suite de mesures de performance du moteur, comparée à une référence enregistrée.
+
+Micro-mesures (opérations par seconde) sur des positions fixes d'ouverture, de milieu
+and de fin de partie : a_star_search, has_path, deplacements_possibles, murs_legaux, les trois
+fonctions evaluer_position* and murs_proches_des_chemins_critique, and les évaluations de
+feuilles par seconde d'une fratrie (positions après chaque déplacement) à chaque niveau,
+une par une (feuilles_scalaires) or en un appel NumPy (feuilles_lot). Macro-mesures :
+un coup complet de meilleur_coup_ia à chaque niveau (coups and nœuds par seconde), au
+niveau MCTS (coups and parties simulées par seconde) and une partie simulate_ai_vs_ai à
+graine fixe (coups par seconde).
+
+    python benchmarks/suite.py                          # compare à benchmarks/reference.json
+    python benchmarks/suite.py --sortie resultats.json  # écrit aussi les mesures en JSON
+    python benchmarks/suite.py --enregistrer-reference  # remplace la référence
+    python benchmarks/suite.py --filtre 'meilleur_coup_ia*' --processus-recherche 8
+
+Le code de sortie vaut 1 si une mesure est plus lente que la référence au-delà de la
+tolérance (--tolerance, 0.25 par défaut). La référence n'a de sens que sur la machine
+où elle a été enregistrée : la réenregistrer avant de comparer sur une autre machine.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+
+from allocations import MOTEUR, RACINE, charger_module, preparer_coup
+
+try:
+    import evaluation_lot
+except ImportError:  # NumPy est optionnel : seules les mesures feuilles_lot en ont besoin
+    evaluation_lot = None
+
+REFERENCE = os.path.join(RACINE, "benchmarks", "reference.json")
+
+# Positions fixes : pions (ligne, colonne), murs "<orientation><x><y>", murs restants, tour.
+# Elles sont écrites en dur pour que les mesures restent comparables quand l'IA change.
+POSITIONS = {
+    'ouverture': [
+        ((0, 4), (8, 4), "", (10, 10), 1),
+        ((1, 3), (8, 5), "H40 H21 H37", (9, 8), 1),
+        ((1, 6), (8, 4), "H31 H51", (10, 8), 1),
+    ],
+    'milieu': [
+        ((1, 5), (7, 3), "H40 H21 H41 H36 H56 H37 V50 V56", (6, 6), 1),
+        ((0, 4), (7, 4), "H10 H31 H51 H26 H46 H47 V60 V21 V26", (6, 5), 1),
+    ],
+    'finale': [
+        ((6, 6), (5, 3), "H10 H01 H31 H51 H12 H03 H23 H26 H46 H17 H47 H67 V60 V21 V33 V26 V56 V77",
+         (2, 0), 1),
+        ((7, 3), (5, 4), "H00 H20 H40 H60 H22 H75 H26 H17 H37 H57 V31 V62 V72 V33 V64 V74 V15 V35 V46 V66",
+         (0, 0), 1),
+    ],
+}
+
+# Partie de simulate_ai_vs_ai mesurée : (niveau du joueur 1, niveau du joueur 2, graine)
+PARTIE = ('hard', 'medium', 1)
+
+METRIQUES = ('ops_par_s', 'evals_par_s', 'coups_par_s', 'noeuds_par_s', 'playouts_par_s')
+
+
+def construire_positions(jeu):
+    """GameState des positions fixes, par phase de jeu"""
+    positions = {}
+    for phase, liste in POSITIONS.items():
+        positions[phase] = []
+        for pos_j1, pos_j2, murs, restants, tour in liste:
+            murs_h = murs_v = 0
+            for mur in murs.split():
+                bit = 1 << (int(mur[2]) * jeu.TAILLE_MURS + int(mur[1]))
+                if mur[0] == 'H':
+                    murs_h |= bit
+                else:
+                    murs_v |= bit
+            positions[phase].append(jeu.GameState(pos_j1[0] * jeu.GRID_SIZE + pos_j1[1],
+                                                  pos_j2[0] * jeu.GRID_SIZE + pos_j2[1],
+                                                  murs_h, murs_v, restants[0], restants[1], tour))
+    return positions
+
+
+def niveaux(jeu):
+    """Niveaux de difficulté (nom de la ligne de commande, constante du moteur)"""
+    return (('easy', jeu.DIFFICULTY_EASY), ('medium', jeu.DIFFICULTY_MEDIUM), ('hard', jeu.DIFFICULTY_HARD))
+
+
+def cadence(appels, duree_min):
+    """Exécute la liste d'appels en boucle pendant au moins duree_min secondes ; opérations par seconde"""
+    operations = 0
+    debut = time.perf_counter()
+    while True:
+        for appel in appels:
+            appel()
+        operations += len(appels)
+        ecoule = time.perf_counter() - debut
+        if ecoule >= duree_min:
+            return operations / ecoule
+
+
+def micro_mesures(jeu, positions, duree_min):
+    """
+    Fonctions élémentaires du moteur. Le cache des cartes de distances est vidé avant
+    chaque appel des évaluations pour mesurer leur coût complet, pas une lecture en cache.
+    """
+    cache = jeu._cache_distances
+
+    def sans_cache(evaluer, etat):
+        def appel():
+            cache.clear()
+            evaluer(etat, 2)
+        return appel
+
+    fonctions = {
+        'a_star_search': lambda etat: [
+            lambda: jeu.a_star_search(etat.position(1), 8, etat),
+            lambda: jeu.a_star_search(etat.position(2), 0, etat)],
+        'has_path': lambda etat: [
+            lambda: jeu.has_path(etat.position(1), 8, etat),
+            lambda: jeu.has_path(etat.position(2), 0, etat)],
+        'deplacements_possibles': lambda etat: [
+            lambda: jeu.deplacements_possibles(etat, 1),
+            lambda: jeu.deplacements_possibles(etat, 2)],
+        'murs_legaux': lambda etat: [lambda: jeu.murs_legaux(etat)],
+        'evaluer_position': lambda etat: [sans_cache(jeu.evaluer_position, etat)],
+        'evaluer_position_intermediaire': lambda etat: [sans_cache(jeu.evaluer_position_intermediaire, etat)],
+        'evaluer_position_difficile': lambda etat: [sans_cache(jeu.evaluer_position_difficile, etat)],
+    }
+    for nom, difficulte in niveaux(jeu):
+        fonctions[f'murs_proches_des_chemins_critique[{nom}]'] = (
+            lambda etat, difficulte=difficulte: [
+                lambda: jeu.murs_proches_des_chemins_critique(etat, etat.position(1), 8, difficulte)])
+
+    for nom, construire in fonctions.items():
+        for phase, etats in positions.items():
+            appels = [appel for etat in etats for appel in construire(etat)]
+            yield f'{nom}/{phase}', {'ops_par_s': cadence(appels, duree_min)}
+
+    yield from mesures_feuilles(jeu, positions, duree_min)
+
+
+def fratrie(jeu, etat):
+    """Positions (GameState) après chacun des déplacements du joueur qui a la main"""
+    joueur = etat.tour
+    soeurs = []
+    for coup in jeu.deplacements_possibles(etat, joueur):
+        etat.jouer_coup(joueur, coup)
+        soeurs.append(etat.copie())
+        etat.annuler()
+    return soeurs
+
+
+def mesures_feuilles(jeu, positions, duree_min):
+    """
+    Évaluations de feuilles par seconde sur la fratrie de chaque position fixe : fonction
+    scalaire du niveau appelée sur chaque position, puis l'expérience evaluer_positions_lot
+    (evaluation_lot.py) sur toute la fratrie (si NumPy est installé). Les cartes de distances restent en cache, comme entre
+    les feuilles d'un même nœud.
+    """
+    scalaires = {jeu.DIFFICULTY_EASY: jeu.evaluer_position,
+                 jeu.DIFFICULTY_MEDIUM: jeu.evaluer_position_intermediaire,
+                 jeu.DIFFICULTY_HARD: jeu.evaluer_position_difficile}
+    for nom, difficulte in niveaux(jeu):
+        evaluer = scalaires[difficulte]
+        for phase, etats in positions.items():
+            fratries = [fratrie(jeu, etat) for etat in etats]
+            feuilles_par_appel = sum(len(soeurs) for soeurs in fratries) / len(fratries)
+            appels = [lambda soeurs=soeurs: [evaluer(soeur, 2) for soeur in soeurs] for soeurs in fratries]
+            yield (f'feuilles_scalaires[{nom}]/{phase}',
+                   {'evals_par_s': cadence(appels, duree_min) * feuilles_par_appel})
+            if evaluation_lot is None:
+                continue
+            appels = []
+            for etat, soeurs in zip(etats, fratries):
+                lot = ([soeur.pos_j1 for soeur in soeurs], [soeur.pos_j2 for soeur in soeurs],
+                       [soeur.murs_restants_j1 for soeur in soeurs], [soeur.murs_restants_j2 for soeur in soeurs])
+                appels.append(lambda etat=etat, lot=lot: evaluation_lot.evaluer_positions_lot(
+                    jeu, etat, *lot, 2, difficulte))
+            yield (f'feuilles_lot[{nom}]/{phase}',
+                   {'evals_par_s': cadence(appels, duree_min) * feuilles_par_appel})
+
+
+def mesurer_coups(jeu, positions, difficulte, duree_min):
+    """
+    Un coup de meilleur_coup_ia par position, répété pendant au moins duree_min secondes.
+    Le budget de nœuds illimité fait passer par l'approfondissement itératif (comme en
+    partie) and donne accès aux nœuds visités.
+    """
+    contextes = []
+
+    class ContexteCompte(jeu.ContexteRecherche):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            contextes.append(self)
+
+    contexte_origine = jeu.ContexteRecherche
+    jeu.ContexteRecherche = ContexteCompte
+    coups = 0
+    duree = 0.0
+    try:
+        while duree < duree_min:
+            for indice, etat in enumerate(positions):
+                preparer_coup(jeu, indice)
+                debut = time.perf_counter()
+                jeu.meilleur_coup_ia(etat, difficulte, budget_noeuds=float('inf'))
+                duree += time.perf_counter() - debut
+            coups += len(positions)
+    finally:
+        jeu.ContexteRecherche = contexte_origine
+    noeuds = sum(contexte.noeuds for contexte in contextes)
+    return {'coups_par_s': coups / duree, 'noeuds_par_s': noeuds / duree}
+
+
+def mesurer_mcts(jeu, positions, duree_min):
+    """
+    Un coup du niveau MCTS (PLAYOUTS_MCTS parties simulées) par position, répété pendant
+    au moins duree_min secondes. Les positions jouées par resoudre_course (plus aucun mur)
+    comptent dans les coups mais pas dans les parties simulées.
+    """
+    statistiques = jeu.StatistiquesRecherche()
+    coups = 0
+    duree = 0.0
+    while duree < duree_min:
+        for indice, etat in enumerate(positions):
+            preparer_coup(jeu, indice)
+            debut = time.perf_counter()
+            jeu.meilleur_coup_ia(etat, jeu.DIFFICULTY_MCTS, statistiques=statistiques)
+            duree += time.perf_counter() - debut
+        coups += len(positions)
+    duree_mcts = statistiques.durees.get('mcts', 0.0)
+    return {'coups_par_s': coups / duree,
+            'playouts_par_s': statistiques.playouts / duree_mcts if duree_mcts else 0.0}
+
+
+def macro_mesures(jeu, positions, duree_min):
+    """Coups complets de l'IA à chaque niveau, puis une partie simulée à graine fixe"""
+    for nom, difficulte in niveaux(jeu):
+        for phase, etats in positions.items():
+            yield f'meilleur_coup_ia[{nom}]/{phase}', mesurer_coups(jeu, etats, difficulte, duree_min)
+    for phase, etats in positions.items():
+        yield f'meilleur_coup_ia[mcts]/{phase}', mesurer_mcts(jeu, etats, duree_min)
+
+    ia1, ia2, graine = PARTIE
+    difficultes = dict(niveaux(jeu))
+    debut = time.perf_counter()
+    gagnant, coups = jeu._jouer_match(difficultes[ia1], difficultes[ia2], graine)[:2]
+    duree = time.perf_counter() - debut
+    yield f'simulate_ai_vs_ai[{ia1}-{ia2}]', {'coups_par_s': coups / duree, 'gagnant': gagnant, 'coups': coups}
+
+
+def comparer(mesures, reference, tolerance):
+    """Lignes de comparaison (nom, métrique, valeur, référence, rapport, régression)"""
+    lignes = []
+    for nom, valeurs in mesures.items():
+        for metrique in METRIQUES:
+            if metrique not in valeurs:
+                continue
+            base = reference.get(nom, {}).get(metrique)
+            rapport = valeurs[metrique] / base if base else None
+            regression = rapport is not None and rapport < 1 - tolerance
+            lignes.append((nom, metrique, valeurs[metrique], base, rapport, regression))
+    return lignes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default=MOTEUR,
+                        help="fichier du moteur à mesurer (par défaut la version courante)")
+    parser.add_argument('--duree', type=float, default=0.3,
+                        help="durée minimale de chaque mesure (hors partie simulée), en secondes")
+    parser.add_argument('--filtre', default='*',
+                        help="motif des mesures à lancer, par exemple 'evaluer_*' or '*/finale'")
+    parser.add_argument('--sans-macro', action='store_true',
+                        help="ne lance que les micro-mesures")
+    parser.add_argument('--processus-recherche', type=int, default=1,
+                        help="processus de calcul de la recherche parallèle à la racine (coups complets)")
+    parser.add_argument('--reference', default=REFERENCE, help="fichier JSON de référence")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="baisse relative tolérée avant de signaler une régression")
+    parser.add_argument('--sortie', help="fichier JSON où écrire les mesures ('-' : sortie standard)")
+    parser.add_argument('--enregistrer-reference', action='store_true',
+                        help="écrit les mesures dans le fichier de référence au lieu de comparer")
+    args = parser.parse_args()
+
+    jeu = charger_module(args.module)
+    positions = construire_positions(jeu)
+    if args.processus_recherche > 1:
+        jeu.configurer_recherche_parallele(args.processus_recherche)
+
+    mesures = {}
+    sources = [micro_mesures(jeu, positions, args.duree)]
+    if not args.sans_macro:
+        sources.append(macro_mesures(jeu, positions, args.duree))
+    for source in sources:
+        for nom, valeurs in source:
+            if fnmatch.fnmatch(nom, args.filtre):
+                mesures[nom] = {cle: round(valeur, 3) if isinstance(valeur, float) else valeur
+                                for cle, valeur in valeurs.items()}
+                print(f"{nom:55} " + "  ".join(f"{metrique} {valeurs[metrique]:12.1f}"
+                                                for metrique in METRIQUES if metrique in valeurs),
+                      file=sys.stderr)
+
+    resultat = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'processeur': platform.processor() or platform.machine(),
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'mesures': mesures,
+    }
+    if args.sortie == '-':
+        json.dump(resultat, sys.stdout, indent=2)
+        print()
+    elif args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as fichier:
+            json.dump(resultat, fichier, indent=2)
+
+    if args.enregistrer_reference:
+        # Les mesures non relancées (filtre) gardent leur valeur de référence
+        if os.path.exists(args.reference):
+            with open(args.reference, encoding='utf-8') as fichier:
+                ancien = json.load(fichier)
+            resultat['mesures'] = {**ancien.get('mesures', {}), **mesures}
+        with open(args.reference, 'w', encoding='utf-8') as fichier:
+            json.dump(resultat, fichier, indent=2)
+            fichier.write('\n')
+        print(f"Référence enregistrée dans {args.reference}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.reference):
+        print(f"Pas de référence ({args.reference}) : lancer avec --enregistrer-reference", file=sys.stderr)
+        return 0
+    with open(args.reference, encoding='utf-8') as fichier:
+        reference = json.load(fichier)
+
+    regressions = 0
+    print(f"\nComparaison à {args.reference} ({reference.get('date', '?')}, tolérance {args.tolerance:.0%})",
+          file=sys.stderr)
+    for nom, metrique, valeur, base, rapport, regression in comparer(mesures, reference['mesures'],
+                                                                     args.tolerance):
+        if base is None:
+            etat = "nouvelle mesure"
+        elif rapport is None:
+            etat = "-"
+        else:
+            etat = f"{rapport:6.2f}x" + ("  RÉGRESSION" if regression else "")
+        print(f"{nom:55} {metrique:13} {valeur:12.1f} {etat}", file=sys.stderr)
+        regressions += regression
+    for nom, valeurs in mesures.items():
+        partie_ref = reference['mesures'].get(nom, {})
+        if 'coups' in valeurs and partie_ref.get('coups') not in (None, valeurs['coups']):
+            print(f"{nom} : la partie a changé ({partie_ref['coups']} coups en référence, "
+                  f"{valeurs['coups']} maintenant), la cadence n'est pas directement comparable",
+                  file=sys.stderr)
+    if regressions:
+        print(f"{regressions} régression(s) au-delà de {args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
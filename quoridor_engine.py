@@ -0,0 +1,3872 @@
+"""
+Moteur du jeu de Quoridor sans interface graphique : règles, recherche IA and simulations.
+
+Ce module n'importe ni pygame ni tkinter. Projet IA.py (l'interface) s'appuie dessus,
+and il peut aussi servir seul aux processus de calcul, aux bancs d'essai or en ligne
+de commande :
+
+    python -m quoridor_engine batch --ia1 hard --ia2 medium -n 500 --jobs 16
+"""
+import sys
+import os
+import argparse
+import json
+import math
+import mmap
+import struct
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from collections import deque
+from contextlib import nullcontext
+from heapq import heappush, heappop
+import random
+import time
+
+# Constantes pour les niveaux de difficulté
+DIFFICULTY_EASY = 2
+DIFFICULTY_MEDIUM = 5
+DIFFICULTY_HARD = 7
+DIFFICULTY_MCTS = 9  # Recherche arborescente Monte-Carlo (meilleur_coup_mcts)
+
+# Noms des niveaux en ligne de commande
+NIVEAUX = {'easy': DIFFICULTY_EASY, 'medium': DIFFICULTY_MEDIUM, 'hard': DIFFICULTY_HARD,
+           'mcts': DIFFICULTY_MCTS}
+
+# Taille du plateau
+GRID_SIZE = 9
+
+# Nombre d'emplacements de murs par ligne (ancrages x, y dans 0..7)
+TAILLE_MURS = GRID_SIZE - 1
+
+# Masques des bords du plateau (bit case = ligne * 9 + colonne)
+LIGNE_0 = (1 << GRID_SIZE) - 1
+LIGNE_8 = LIGNE_0 << (8 * GRID_SIZE)
+COLONNE_0 = sum(1 << (i * GRID_SIZE) for i in range(GRID_SIZE))
+COLONNE_8 = COLONNE_0 << (GRID_SIZE - 1)
+TOUTES_CASES = (1 << (GRID_SIZE * GRID_SIZE)) - 1
+MASQUES_LIGNES = [LIGNE_0 << (i * GRID_SIZE) for i in range(GRID_SIZE)]
+
+def _table_blocages():
+    """
+    Pour chaque emplacement de mur y * 8 + x, les arêtes qu'il ferme :
+    (bas, haut) pour un mur horizontal, (droite, gauche) pour un mur vertical.
+    Le bit d'une case est mis si le pas dans cette direction depuis la case est fermé.
+    """
+    horizontaux = []
+    verticaux = []
+    for k in range(TAILLE_MURS * TAILLE_MURS):
+        y, x = divmod(k, TAILLE_MURS)
+        case = y * GRID_SIZE + x
+        horizontaux.append(((1 << case) | (1 << (case + 1)),
+                            (1 << (case + GRID_SIZE)) | (1 << (case + GRID_SIZE + 1))))
+        verticaux.append(((1 << case) | (1 << (case + GRID_SIZE)),
+                          (1 << (case + 1)) | (1 << (case + GRID_SIZE + 1))))
+    return horizontaux, verticaux
+
+BLOCAGES_H, BLOCAGES_V = _table_blocages()
+
+# Masques d'emplacements de murs (bit k = y * 8 + x)
+TOUS_EMPLACEMENTS = (1 << (TAILLE_MURS * TAILLE_MURS)) - 1
+# Emplacements des deux orientations (0..127) : un mur horizontal k a l'indice k,
+# un mur vertical k l'indice 64 + k (ensembles de murs_legaux, table CONFLITS_MURS)
+DECALAGE_V = TAILLE_MURS * TAILLE_MURS
+
+def emplacement_mur(mur):
+    """Indice (0..127) du mur : y * 8 + x, plus 64 s'il est vertical"""
+    k = mur['y'] * TAILLE_MURS + mur['x']
+    return k if mur['orientation'] == 'H' else DECALAGE_V + k
+
+def _table_conflits():
+    """
+    Pour chaque emplacement (0..127), le masque des emplacements qu'un mur posé là rend
+    impossibles : lui-même, les murs du même sens qui le chevauchent (décalés d'une case)
+    and le mur de l'autre sens qui le croise en son milieu (même ancrage).
+    """
+    conflits = []
+    for emplacement in range(2 * DECALAGE_V):
+        k = emplacement % DECALAGE_V
+        y, x = divmod(k, TAILLE_MURS)
+        if emplacement < DECALAGE_V:
+            voisins = [k] + [k + dx for dx in (-1, 1) if 0 <= x + dx < TAILLE_MURS]
+            masque = sum(1 << voisin for voisin in voisins) | (1 << (DECALAGE_V + k))
+        else:
+            voisins = [k] + [k + dy * TAILLE_MURS for dy in (-1, 1) if 0 <= y + dy < TAILLE_MURS]
+            masque = sum(1 << (DECALAGE_V + voisin) for voisin in voisins) | (1 << k)
+        conflits.append(masque)
+    return conflits
+
+CONFLITS_MURS = _table_conflits()
+EMPLACEMENTS_X_0 = sum(1 << (y * TAILLE_MURS) for y in range(TAILLE_MURS))
+EMPLACEMENTS_X_7 = EMPLACEMENTS_X_0 << (TAILLE_MURS - 1)
+
+def _table_murs_par_arete():
+    """
+    Pour chaque case, les emplacements de murs qui ferment son arête basse (murs horizontaux)
+    and son arête droite (murs verticaux), inverses de BLOCAGES_H and BLOCAGES_V.
+    """
+    horizontaux = [0] * (GRID_SIZE * GRID_SIZE)
+    verticaux = [0] * (GRID_SIZE * GRID_SIZE)
+    for k in range(TAILLE_MURS * TAILLE_MURS):
+        for table, (aretes, _) in ((horizontaux, BLOCAGES_H[k]), (verticaux, BLOCAGES_V[k])):
+            while aretes:
+                bit = aretes & -aretes
+                table[bit.bit_length() - 1] |= 1 << k
+                aretes ^= bit
+    return horizontaux, verticaux
+
+MURS_H_PAR_ARETE, MURS_V_PAR_ARETE = _table_murs_par_arete()
+
+# Coins du quadrillage (10 x 10, bit cy * 10 + cx) : les murs vont d'un coin à l'autre
+COTE_COINS = GRID_SIZE + 1
+BORD_COINS = sum(1 << (cy * COTE_COINS + cx) for cy in range(COTE_COINS) for cx in range(COTE_COINS)
+                 if cx in (0, GRID_SIZE) or cy in (0, GRID_SIZE))
+
+def _table_coins():
+    """Pour chaque emplacement y * 8 + x, les trois coins touchés par un mur horizontal and vertical"""
+    horizontaux = []
+    verticaux = []
+    for k in range(TAILLE_MURS * TAILLE_MURS):
+        y, x = divmod(k, TAILLE_MURS)
+        horizontaux.append(sum(1 << ((y + 1) * COTE_COINS + x + d) for d in range(3)))
+        verticaux.append(sum(1 << ((y + d) * COTE_COINS + x + 1) for d in range(3)))
+    return horizontaux, verticaux
+
+COINS_H, COINS_V = _table_coins()
+
+# Clés de Zobrist (tirées avec une graine fixe pour être identiques d'une exécution à l'autre)
+_alea_zobrist = random.Random(0x5A0B215)
+ZOBRIST_PIONS = [[_alea_zobrist.getrandbits(64) for _ in range(GRID_SIZE * GRID_SIZE)] for _ in range(2)]
+ZOBRIST_MURS_H = [_alea_zobrist.getrandbits(64) for _ in range(TAILLE_MURS * TAILLE_MURS)]
+ZOBRIST_MURS_V = [_alea_zobrist.getrandbits(64) for _ in range(TAILLE_MURS * TAILLE_MURS)]
+ZOBRIST_RESTANTS = [[_alea_zobrist.getrandbits(64) for _ in range(11)] for _ in range(2)]
+ZOBRIST_TOUR = _alea_zobrist.getrandbits(64)  # Présent dans la clé quand le joueur 2 a la main
+ZOBRIST_PRINCIPAL = [_alea_zobrist.getrandbits(64) for _ in range(2)]
+ZOBRIST_DIFFICULTE = _alea_zobrist.getrandbits(64)
+ZOBRIST_MURS_RECHERCHE = _alea_zobrist.getrandbits(64)  # Recherche où les murs sont des coups
+
+# Codage des entrées de GameState.historique (voir jouer_deplacement)
+ENTREE_MUR_H = GRID_SIZE * GRID_SIZE
+ENTREE_MUR_V = ENTREE_MUR_H + TAILLE_MURS * TAILLE_MURS
+ENTREE_PASSE = ENTREE_MUR_V + TAILLE_MURS * TAILLE_MURS
+
+# Les coups de la recherche avec murs utilisent le même codage : case d'arrivée (< 81)
+# pour un déplacement, ENTREE_MUR_H + k or ENTREE_MUR_V + k pour un mur
+def code_mur(mur):
+    """Code de coup d'un mur {'x', 'y', 'orientation'}"""
+    base = ENTREE_MUR_H if mur['orientation'] == 'H' else ENTREE_MUR_V
+    return base + mur['y'] * TAILLE_MURS + mur['x']
+
+def mur_depuis_code(code):
+    """Mur {'x', 'y', 'orientation'} correspondant à un code de coup"""
+    if code < ENTREE_MUR_V:
+        y, x = divmod(code - ENTREE_MUR_H, TAILLE_MURS)
+        return {'x': x, 'y': y, 'orientation': 'H'}
+    y, x = divmod(code - ENTREE_MUR_V, TAILLE_MURS)
+    return {'x': x, 'y': y, 'orientation': 'V'}
+
+class GameState:
+    """
+    État compact d'une partie utilisé par les règles and la recherche IA.
+
+    Les pions sont stockés sous forme de cases entières (ligne * 9 + colonne),
+    les murs sous forme de deux masques de bits (un bit par emplacement
+    y * 8 + x, l'un pour les murs horizontaux, l'autre pour les verticaux).
+    Quatre masques d'arêtes (bloque_haut, bloque_bas, bloque_gauche,
+    bloque_droite) indiquent pour chaque case si le pas dans cette direction
+    est fermé par un mur or par le bord ; ils sont mis à jour une seule fois
+    à la pose d'un mur. deplacer, poser_mur and passer renvoient un nouvel état ;
+    la recherche utilise plutôt jouer_deplacement, jouer_mur, jouer_passe and annuler,
+    qui modifient l'état sur place and empilent dans historique de quoi défaire le coup.
+    La clé de Zobrist (cle) est mise à jour de façon incrémentale à chaque coup.
+    """
+    __slots__ = ('pos_j1', 'pos_j2', 'murs_h', 'murs_v',
+                 'murs_restants_j1', 'murs_restants_j2', 'tour',
+                 'bloque_haut', 'bloque_bas', 'bloque_gauche', 'bloque_droite', 'cle',
+                 'historique')
+
+    def __init__(self, pos_j1=4, pos_j2=8 * GRID_SIZE + 4, murs_h=0, murs_v=0,
+                 murs_restants_j1=10, murs_restants_j2=10, tour=1):
+        self.pos_j1 = pos_j1
+        self.pos_j2 = pos_j2
+        self.murs_h = murs_h
+        self.murs_v = murs_v
+        self.murs_restants_j1 = murs_restants_j1
+        self.murs_restants_j2 = murs_restants_j2
+        self.tour = tour
+        self.bloque_haut = LIGNE_0
+        self.bloque_bas = LIGNE_8
+        self.bloque_gauche = COLONNE_0
+        self.bloque_droite = COLONNE_8
+        self.historique = []
+        for orientation, masque in (('H', murs_h), ('V', murs_v)):
+            while masque:
+                bit = masque & -masque
+                self._fermer_aretes(orientation, bit.bit_length() - 1)
+                masque ^= bit
+        self.cle = self.calculer_cle()
+
+    def calculer_cle(self):
+        """Clé de Zobrist complète (pions, murs, murs restants and joueur qui a la main)"""
+        cle = (ZOBRIST_PIONS[0][self.pos_j1] ^ ZOBRIST_PIONS[1][self.pos_j2] ^
+               ZOBRIST_RESTANTS[0][self.murs_restants_j1] ^ ZOBRIST_RESTANTS[1][self.murs_restants_j2])
+        for table, masque in ((ZOBRIST_MURS_H, self.murs_h), (ZOBRIST_MURS_V, self.murs_v)):
+            while masque:
+                bit = masque & -masque
+                cle ^= table[bit.bit_length() - 1]
+                masque ^= bit
+        if self.tour == 2:
+            cle ^= ZOBRIST_TOUR
+        return cle
+
+    def _fermer_aretes(self, orientation, k):
+        """Ferme les deux arêtes coupées par le mur d'emplacement k"""
+        if orientation == 'H':
+            bas, haut = BLOCAGES_H[k]
+            self.bloque_bas |= bas
+            self.bloque_haut |= haut
+        else:
+            droite, gauche = BLOCAGES_V[k]
+            self.bloque_droite |= droite
+            self.bloque_gauche |= gauche
+
+    def copie(self):
+        etat = GameState.__new__(GameState)
+        etat.pos_j1 = self.pos_j1
+        etat.pos_j2 = self.pos_j2
+        etat.murs_h = self.murs_h
+        etat.murs_v = self.murs_v
+        etat.murs_restants_j1 = self.murs_restants_j1
+        etat.murs_restants_j2 = self.murs_restants_j2
+        etat.tour = self.tour
+        etat.bloque_haut = self.bloque_haut
+        etat.bloque_bas = self.bloque_bas
+        etat.bloque_gauche = self.bloque_gauche
+        etat.bloque_droite = self.bloque_droite
+        etat.cle = self.cle
+        etat.historique = []
+        return etat
+
+    @classmethod
+    def depuis_grille(cls, grille, murs, murs_restants_j1=10, murs_restants_j2=10, tour=1):
+        """Construit un état à partir de la grille and de la liste de murs de l'interface"""
+        pos_j1 = find_player_position(grille, 1)
+        pos_j2 = find_player_position(grille, 2)
+        etat = cls.depuis_murs(murs)
+        etat.pos_j1 = pos_j1[0] * GRID_SIZE + pos_j1[1]
+        etat.pos_j2 = pos_j2[0] * GRID_SIZE + pos_j2[1]
+        etat.murs_restants_j1 = murs_restants_j1
+        etat.murs_restants_j2 = murs_restants_j2
+        etat.tour = tour
+        etat.cle = etat.calculer_cle()
+        return etat
+
+    @classmethod
+    def depuis_murs(cls, murs):
+        """Construit un état (pions en position initiale) portant la liste de murs donnée"""
+        murs_h = 0
+        murs_v = 0
+        for mur in murs:
+            if mur['orientation'] == 'H':
+                murs_h |= 1 << (mur['y'] * TAILLE_MURS + mur['x'])
+            else:
+                murs_v |= 1 << (mur['y'] * TAILLE_MURS + mur['x'])
+        return cls(murs_h=murs_h, murs_v=murs_v)
+
+    def vers_grille(self):
+        """Vue 9x9 de l'état (0 : case vide, 1 or 2 : pion du joueur), pour l'affichage or le débogage"""
+        grille = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        i, j = divmod(self.pos_j1, GRID_SIZE)
+        grille[i][j] = 1
+        i, j = divmod(self.pos_j2, GRID_SIZE)
+        grille[i][j] = 2
+        return grille
+
+    def liste_murs(self):
+        """Liste des murs au format {'x', 'y', 'orientation'} utilisé par l'affichage"""
+        liste = []
+        for orientation, masque in (('H', self.murs_h), ('V', self.murs_v)):
+            while masque:
+                bit = masque & -masque
+                y, x = divmod(bit.bit_length() - 1, TAILLE_MURS)
+                liste.append({'x': x, 'y': y, 'orientation': orientation})
+                masque ^= bit
+        return liste
+
+    def case(self, joueur):
+        return self.pos_j1 if joueur == 1 else self.pos_j2
+
+    def position(self, joueur):
+        """Position (ligne, colonne) du pion d'un joueur"""
+        return divmod(self.pos_j1 if joueur == 1 else self.pos_j2, GRID_SIZE)
+
+    def murs_restants(self, joueur):
+        return self.murs_restants_j1 if joueur == 1 else self.murs_restants_j2
+
+    def nombre_murs(self):
+        """Nombre de murs posés sur le plateau"""
+        return bin(self.murs_h).count('1') + bin(self.murs_v).count('1')
+
+    def contient_mur(self, mur):
+        masque = self.murs_h if mur['orientation'] == 'H' else self.murs_v
+        return (masque >> (mur['y'] * TAILLE_MURS + mur['x'])) & 1 == 1
+
+    def murs_occupes(self):
+        """Emplacements occupés des deux orientations (masque de 128 bits, voir emplacement_mur)"""
+        return self.murs_h | (self.murs_v << DECALAGE_V)
+
+    def mur_libre(self, mur):
+        """Indique si le mur est dans le plateau and ne chevauche ni ne croise aucun mur posé"""
+        x, y = mur['x'], mur['y']
+        if not (0 <= x < TAILLE_MURS and 0 <= y < TAILLE_MURS):
+            return False
+        return not (self.murs_occupes() & CONFLITS_MURS[emplacement_mur(mur)])
+
+    def aretes(self):
+        """Masques d'arêtes fermées dans l'ordre des directions haut, bas, gauche, droite"""
+        return self.bloque_haut, self.bloque_bas, self.bloque_gauche, self.bloque_droite
+
+    def mur_bloque(self, i, j, ni, nj):
+        """Indique si un mur bloque le pas de (i, j) vers la case voisine (ni, nj)"""
+        case = i * GRID_SIZE + j
+        if ni > i:
+            return (self.bloque_bas >> case) & 1 == 1
+        if ni < i:
+            return (self.bloque_haut >> case) & 1 == 1
+        if nj > j:
+            return (self.bloque_droite >> case) & 1 == 1
+        return (self.bloque_gauche >> case) & 1 == 1
+
+    def deplacer(self, joueur, case):
+        """Nouvel état où le pion du joueur est sur la case donnée and où l'adversaire a la main"""
+        etat = self.copie()
+        if joueur == 1:
+            etat.cle ^= ZOBRIST_PIONS[0][self.pos_j1] ^ ZOBRIST_PIONS[0][case] ^ ZOBRIST_TOUR
+            etat.pos_j1 = case
+        else:
+            etat.cle ^= ZOBRIST_PIONS[1][self.pos_j2] ^ ZOBRIST_PIONS[1][case] ^ ZOBRIST_TOUR
+            etat.pos_j2 = case
+        etat.tour = 3 - joueur
+        return etat
+
+    def poser_mur(self, joueur, mur):
+        """Nouvel état où le joueur a posé le mur donné (sans vérification de validité)"""
+        etat = self.copie()
+        k = mur['y'] * TAILLE_MURS + mur['x']
+        if mur['orientation'] == 'H':
+            etat.murs_h |= 1 << k
+            etat.cle ^= ZOBRIST_MURS_H[k]
+        else:
+            etat.murs_v |= 1 << k
+            etat.cle ^= ZOBRIST_MURS_V[k]
+        etat._fermer_aretes(mur['orientation'], k)
+        if joueur == 1:
+            etat.cle ^= ZOBRIST_RESTANTS[0][etat.murs_restants_j1] ^ ZOBRIST_RESTANTS[0][etat.murs_restants_j1 - 1]
+            etat.murs_restants_j1 -= 1
+        else:
+            etat.cle ^= ZOBRIST_RESTANTS[1][etat.murs_restants_j2] ^ ZOBRIST_RESTANTS[1][etat.murs_restants_j2 - 1]
+            etat.murs_restants_j2 -= 1
+        etat.cle ^= ZOBRIST_TOUR
+        etat.tour = 3 - joueur
+        return etat
+
+    def passer(self):
+        """Nouvel état identique où la main passe à l'adversaire"""
+        etat = self.copie()
+        etat.tour = 3 - self.tour
+        etat.cle ^= ZOBRIST_TOUR
+        return etat
+
+    # Coups joués sur place. Chaque coup empile un seul petit entier dans historique
+    # (toujours inférieur à 256, donc partagé par l'interpréteur and sans allocation) :
+    #   0..80    déplacement, valeur = case de départ du pion
+    #   81..144  mur horizontal, valeur = ENTREE_MUR_H + emplacement
+    #   145..208 mur vertical, valeur = ENTREE_MUR_V + emplacement
+    #   209      passe
+
+    def jouer_deplacement(self, joueur, case):
+        """Déplace sur place le pion du joueur sur la case donnée ; l'adversaire prend la main"""
+        if joueur == 1:
+            self.historique.append(self.pos_j1)
+            self.cle ^= ZOBRIST_PIONS[0][self.pos_j1] ^ ZOBRIST_PIONS[0][case] ^ ZOBRIST_TOUR
+            self.pos_j1 = case
+        else:
+            self.historique.append(self.pos_j2)
+            self.cle ^= ZOBRIST_PIONS[1][self.pos_j2] ^ ZOBRIST_PIONS[1][case] ^ ZOBRIST_TOUR
+            self.pos_j2 = case
+        self.tour = 3 - joueur
+
+    def jouer_mur(self, joueur, mur):
+        """
+        Pose sur place le mur donné pour le joueur ; l'adversaire prend la main.
+        Le mur doit être libre (mur_libre) : annuler rouvre ses arêtes sans autre vérification.
+        """
+        self.jouer_coup(joueur, code_mur(mur))
+
+    def jouer_coup(self, joueur, coup):
+        """Joue sur place un coup codé (case d'arrivée, code_mur or ENTREE_PASSE) pour le joueur"""
+        if coup < ENTREE_MUR_H:
+            self.jouer_deplacement(joueur, coup)
+            return
+        if coup == ENTREE_PASSE:
+            self.jouer_passe()
+            return
+        self.historique.append(coup)
+        if coup < ENTREE_MUR_V:
+            k = coup - ENTREE_MUR_H
+            self.murs_h |= 1 << k
+            self.cle ^= ZOBRIST_MURS_H[k]
+            self._fermer_aretes('H', k)
+        else:
+            k = coup - ENTREE_MUR_V
+            self.murs_v |= 1 << k
+            self.cle ^= ZOBRIST_MURS_V[k]
+            self._fermer_aretes('V', k)
+        if joueur == 1:
+            self.cle ^= ZOBRIST_RESTANTS[0][self.murs_restants_j1] ^ ZOBRIST_RESTANTS[0][self.murs_restants_j1 - 1]
+            self.murs_restants_j1 -= 1
+        else:
+            self.cle ^= ZOBRIST_RESTANTS[1][self.murs_restants_j2] ^ ZOBRIST_RESTANTS[1][self.murs_restants_j2 - 1]
+            self.murs_restants_j2 -= 1
+        self.cle ^= ZOBRIST_TOUR
+        self.tour = 3 - joueur
+
+    def jouer_passe(self):
+        """Passe la main sur place"""
+        self.historique.append(ENTREE_PASSE)
+        self.tour = 3 - self.tour
+        self.cle ^= ZOBRIST_TOUR
+
+    def annuler(self):
+        """Défait le dernier coup joué sur place"""
+        entree = self.historique.pop()
+        joueur = 3 - self.tour
+        self.tour = joueur
+        self.cle ^= ZOBRIST_TOUR
+        if entree < ENTREE_MUR_H:
+            if joueur == 1:
+                self.cle ^= ZOBRIST_PIONS[0][self.pos_j1] ^ ZOBRIST_PIONS[0][entree]
+                self.pos_j1 = entree
+            else:
+                self.cle ^= ZOBRIST_PIONS[1][self.pos_j2] ^ ZOBRIST_PIONS[1][entree]
+                self.pos_j2 = entree
+            return
+        if entree == ENTREE_PASSE:
+            return
+        if joueur == 1:
+            self.murs_restants_j1 += 1
+            self.cle ^= ZOBRIST_RESTANTS[0][self.murs_restants_j1] ^ ZOBRIST_RESTANTS[0][self.murs_restants_j1 - 1]
+        else:
+            self.murs_restants_j2 += 1
+            self.cle ^= ZOBRIST_RESTANTS[1][self.murs_restants_j2] ^ ZOBRIST_RESTANTS[1][self.murs_restants_j2 - 1]
+        if entree < ENTREE_MUR_V:
+            k = entree - ENTREE_MUR_H
+            self.murs_h ^= 1 << k
+            self.cle ^= ZOBRIST_MURS_H[k]
+            bas, haut = BLOCAGES_H[k]
+            self.bloque_bas ^= bas
+            self.bloque_haut ^= haut
+        else:
+            k = entree - ENTREE_MUR_V
+            self.murs_v ^= 1 << k
+            self.cle ^= ZOBRIST_MURS_V[k]
+            droite, gauche = BLOCAGES_V[k]
+            self.bloque_droite ^= droite
+            self.bloque_gauche ^= gauche
+
+    def _cle(self):
+        return (self.pos_j1, self.pos_j2, self.murs_h, self.murs_v,
+                self.murs_restants_j1, self.murs_restants_j2, self.tour)
+
+    def __eq__(self, autre):
+        return isinstance(autre, GameState) and self._cle() == autre._cle()
+
+    def __hash__(self):
+        return self.cle
+
+    def __repr__(self):
+        return (f"GameState(j1={self.position(1)}, j2={self.position(2)}, "
+                f"murs={self.nombre_murs()}, restants=({self.murs_restants_j1}, "
+                f"{self.murs_restants_j2}), tour={self.tour})")
+
+# Déplacements élémentaires dans l'ordre haut, bas, gauche, droite (même ordre que GameState.aretes)
+PAS_CASES = (-GRID_SIZE, GRID_SIZE, -1, 1)
+
+def cases_voisines(etat, case):
+    """Cases atteignables en un pas depuis case (sans tenir compte des pions)"""
+    voisines = []
+    for bloque, pas in zip(etat.aretes(), PAS_CASES):
+        if not (bloque >> case) & 1:
+            voisines.append(case + pas)
+    return voisines
+
+def etendre(etat, cases):
+    """Ensemble (masque) des cases atteignables en un pas depuis un ensemble de cases"""
+    return (((cases & ~etat.bloque_haut) >> GRID_SIZE) |
+            ((cases & ~etat.bloque_bas) << GRID_SIZE) |
+            ((cases & ~etat.bloque_gauche) >> 1) |
+            ((cases & ~etat.bloque_droite) << 1))
+
+def aretes_chemins_courts(etat, joueur):
+    """
+    Arêtes du graphe des plus courts chemins du pion du joueur vers sa ligne objectif.
+    Renvoie deux masques de cases : verticales (arête entre la case and celle du dessous)
+    and horizontales (arête entre la case and celle de droite).
+    """
+    distances = carte_distances(etat, 8 if joueur == 1 else 0)
+    depart = etat.case(joueur)
+    verticales = 0
+    horizontales = 0
+    if distances[depart] == float('inf'):
+        return verticales, horizontales
+    aretes = etat.aretes()
+    vues = 1 << depart
+    frontiere = [depart]
+    while frontiere:
+        suivante = []
+        for case in frontiere:
+            distance_suivante = distances[case] - 1
+            if distance_suivante < 0:
+                continue
+            for bloque, pas in zip(aretes, PAS_CASES):
+                if (bloque >> case) & 1:
+                    continue
+                voisin = case + pas
+                if distances[voisin] != distance_suivante:
+                    continue
+                if pas == GRID_SIZE or pas == -GRID_SIZE:
+                    verticales |= 1 << min(case, voisin)
+                else:
+                    horizontales |= 1 << min(case, voisin)
+                if not (vues >> voisin) & 1:
+                    vues |= 1 << voisin
+                    suivante.append(voisin)
+        frontiere = suivante
+    return verticales, horizontales
+
+def emplacements_libres(etat):
+    """
+    Masques (horizontaux, verticaux) des emplacements en conflit avec aucun mur posé :
+    la table CONFLITS_MURS appliquée à tous les murs à la fois par décalages de masques.
+    """
+    murs_h = etat.murs_h
+    murs_v = etat.murs_v
+    libres_h = ~(murs_h | ((murs_h << 1) & ~EMPLACEMENTS_X_0) | ((murs_h >> 1) & ~EMPLACEMENTS_X_7) | murs_v)
+    libres_v = ~(murs_v | (murs_v << TAILLE_MURS) | (murs_v >> TAILLE_MURS) | murs_h)
+    return libres_h & TOUS_EMPLACEMENTS, libres_v & TOUS_EMPLACEMENTS
+
+def murs_candidats_recherche(etat, joueur):
+    """
+    Murs (codes de coup) que le joueur peut envisager dans la recherche : ceux qui coupent une
+    arête d'un plus court chemin de l'un des deux pions, ceux de l'adversaire en premier.
+    Seul le chevauchement avec les murs posés est vérifié ici ; l'existence d'un chemin
+    pour chaque joueur est vérifiée après la pose (chemins_ouverts).
+    """
+    libres_h, libres_v = emplacements_libres(etat)
+
+    coups = []
+    for cible in (3 - joueur, joueur):
+        verticales, horizontales = aretes_chemins_courts(etat, cible)
+        emplacements_h = 0
+        while verticales:
+            bit = verticales & -verticales
+            emplacements_h |= MURS_H_PAR_ARETE[bit.bit_length() - 1]
+            verticales ^= bit
+        emplacements_v = 0
+        while horizontales:
+            bit = horizontales & -horizontales
+            emplacements_v |= MURS_V_PAR_ARETE[bit.bit_length() - 1]
+            horizontales ^= bit
+        for base, emplacements in ((ENTREE_MUR_H, emplacements_h & libres_h),
+                                   (ENTREE_MUR_V, emplacements_v & libres_v)):
+            while emplacements:
+                bit = emplacements & -emplacements
+                coups.append(base + bit.bit_length() - 1)
+                emplacements ^= bit
+        # Un mur déjà proposé pour l'adversaire ne l'est pas une seconde fois
+        libres_h &= ~emplacements_h
+        libres_v &= ~emplacements_v
+    return coups
+
+def chemins_ouverts(etat):
+    """Indique si les deux pions ont encore un chemin vers leur ligne objectif"""
+    return (carte_distances(etat, 8)[etat.pos_j1] != float('inf') and
+            carte_distances(etat, 0)[etat.pos_j2] != float('inf'))
+
+def _murs_coupant_un_chemin(etat, joueur):
+    """
+    Masques (horizontaux, verticaux) des murs qui coupent une arête d'un plus court chemin
+    du joueur (un seul chemin, suivi dans la carte des distances), or None s'il n'y a pas de chemin.
+    """
+    distances = carte_distances(etat, 8 if joueur == 1 else 0)
+    case = etat.case(joueur)
+    if distances[case] == float('inf'):
+        return None
+    aretes = etat.aretes()
+    coupants_h = 0
+    coupants_v = 0
+    while distances[case]:
+        for bloque, pas in zip(aretes, PAS_CASES):
+            if not (bloque >> case) & 1 and distances[case + pas] == distances[case] - 1:
+                break
+        voisin = case + pas
+        if pas == GRID_SIZE or pas == -GRID_SIZE:
+            coupants_h |= MURS_H_PAR_ARETE[min(case, voisin)]
+        else:
+            coupants_v |= MURS_V_PAR_ARETE[min(case, voisin)]
+        case = voisin
+    return coupants_h, coupants_v
+
+def _ligne_atteinte(depart, cible, bloque_haut, bloque_bas, bloque_gauche, bloque_droite):
+    """Parcours en largeur sur les masques de cases (comme has_path) avec des arêtes données"""
+    atteintes = 1 << depart
+    frontiere = atteintes
+    while frontiere:
+        if atteintes & cible:
+            return True
+        frontiere = ((((frontiere & ~bloque_haut) >> GRID_SIZE) |
+                      ((frontiere & ~bloque_bas) << GRID_SIZE) |
+                      ((frontiere & ~bloque_gauche) >> 1) |
+                      ((frontiere & ~bloque_droite) << 1)) & ~atteintes)
+        atteintes |= frontiere
+    return False
+
+def _composantes_murs(etat):
+    """
+    Composantes connexes (masques de coins) du graphe formé par le bord du plateau and les
+    murs posés, deux murs étant reliés s'ils ont un coin en commun.
+    """
+    composantes = [BORD_COINS]
+    for table, masque in ((COINS_H, etat.murs_h), (COINS_V, etat.murs_v)):
+        while masque:
+            bit = masque & -masque
+            fusion = table[bit.bit_length() - 1]
+            restantes = []
+            for composante in composantes:
+                if composante & fusion:
+                    fusion |= composante
+                else:
+                    restantes.append(composante)
+            restantes.append(fusion)
+            composantes = restantes
+            masque ^= bit
+    return composantes
+
+def _ferme_une_region(composantes, coins_mur):
+    """Un mur ne sépare deux régions du plateau que s'il relie deux coins d'une même composante"""
+    for composante in composantes:
+        if bin(composante & coins_mur).count('1') >= 2:
+            return True
+    return False
+
+def murs_legaux(etat):
+    """
+    Ensemble (masque de 128 bits, voir emplacement_mur) des murs posables dans l'état : dans
+    le plateau, sans chevauchement and sans couper un joueur de sa ligne objectif.
+
+    Un mur ne peut isoler un joueur que s'il coupe une arête de son chemin actuel : les murs
+    qui ne coupent ni le chemin d'un joueur ni celui de l'autre sont légaux sans autre calcul.
+    Parmi ceux qui coupent un chemin, un mur qui ne relie pas deux coins d'une même composante
+    des murs posés (bord compris) ne ferme aucune région : il est légal lui aussi. Seuls les
+    murs restants sont vérifiés par un parcours, pour le (or les) joueur(s) dont ils coupent
+    le chemin, au lieu de deux has_path par mur candidat.
+    """
+    libres_h, libres_v = emplacements_libres(etat)
+    chemins = []
+    for joueur, cible in ((1, MASQUES_LIGNES[8]), (2, MASQUES_LIGNES[0])):
+        coupants = _murs_coupant_un_chemin(etat, joueur)
+        if coupants is None:
+            return 0
+        chemins.append((etat.case(joueur), cible) + coupants)
+
+    coupants_h = chemins[0][2] | chemins[1][2]
+    coupants_v = chemins[0][3] | chemins[1][3]
+    legaux_h = libres_h & ~coupants_h
+    legaux_v = libres_v & ~coupants_v
+
+    haut, bas, gauche, droite = etat.aretes()
+    composantes = _composantes_murs(etat)
+    a_verifier = libres_h & coupants_h
+    while a_verifier:
+        bit = a_verifier & -a_verifier
+        k = bit.bit_length() - 1
+        fermees_bas, fermees_haut = BLOCAGES_H[k]
+        if not _ferme_une_region(composantes, COINS_H[k]) or all(_ligne_atteinte(depart, cible, haut | fermees_haut, bas | fermees_bas, gauche, droite)
+               for depart, cible, coupe_h, _ in chemins if coupe_h & bit):
+            legaux_h |= bit
+        a_verifier ^= bit
+    a_verifier = libres_v & coupants_v
+    while a_verifier:
+        bit = a_verifier & -a_verifier
+        k = bit.bit_length() - 1
+        fermees_droite, fermees_gauche = BLOCAGES_V[k]
+        if not _ferme_une_region(composantes, COINS_V[k]) or all(_ligne_atteinte(depart, cible, haut, bas, gauche | fermees_gauche, droite | fermees_droite)
+               for depart, cible, _, coupe_v in chemins if coupe_v & bit):
+            legaux_v |= bit
+        a_verifier ^= bit
+    return legaux_h | (legaux_v << DECALAGE_V)
+
+def _etat_murs(walls):
+    """Renvoie un GameState pour les murs donnés (état du moteur or liste de murs de l'interface)"""
+    if isinstance(walls, GameState):
+        return walls
+    return GameState.depuis_murs(walls)
+
+def a_star_search(start_pos, target_row, walls):
+    """
+    Algorithme A* pour trouver le chemin le plus court vers une ligne cible
+    walls peut être un GameState or une liste de murs
+    """
+    if start_pos is None:
+        return float('inf'), []
+    if statistiques_recherche is not None:
+        statistiques_recherche.appels_a_star += 1
+    etat = _etat_murs(walls)
+
+    # Initialisation (heuristique : distance Manhattan vers la ligne cible)
+    depart = start_pos[0] * GRID_SIZE + start_pos[1]
+    open_set = []
+    heappush(open_set, (abs(start_pos[0] - target_row), 0, depart, []))  # (f, g, case, path)
+    closed_set = set()
+
+    while open_set:
+        _, g_score, case, path = heappop(open_set)
+
+        # Arrivé à la ligne cible
+        if case // GRID_SIZE == target_row:
+            return g_score, [divmod(c, GRID_SIZE) for c in path] + [divmod(case, GRID_SIZE)]
+
+        # Déjà visité
+        if case in closed_set:
+            continue
+
+        closed_set.add(case)
+
+        # Explorer les voisins non séparés par un mur
+        for voisin in cases_voisines(etat, case):
+            if voisin not in closed_set:
+                new_g = g_score + 1
+                new_f = new_g + abs(voisin // GRID_SIZE - target_row)
+                heappush(open_set, (new_f, new_g, voisin, path + [case]))
+
+    return float('inf'), []  # Pas de chemin trouvé
+
+# Cartes de distances déjà calculées, indexées par (murs_h, murs_v, ligne cible)
+_cache_distances = {}
+TAILLE_MAX_CACHE_DISTANCES = 20000
+
+def carte_distances(etat, ligne_obj):
+    """
+    Distances (en pas, murs seuls) de chacune des 81 cases vers la ligne objectif.
+    Calculée par un parcours en largeur inverse depuis la ligne objectif, une seule
+    fois par configuration de murs : les déplacements de pions ne changent pas la carte.
+    Les cases sans chemin valent float('inf').
+    """
+    cle = (etat.murs_h, etat.murs_v, ligne_obj)
+    carte = _cache_distances.get(cle)
+    if carte is not None:
+        return carte
+    if statistiques_recherche is not None:
+        statistiques_recherche.cartes_distances += 1
+
+    distances = [float('inf')] * (GRID_SIZE * GRID_SIZE)
+    atteintes = MASQUES_LIGNES[ligne_obj]
+    frontiere = atteintes
+    distance = 0
+    while frontiere:
+        couche = frontiere
+        while couche:
+            bit = couche & -couche
+            distances[bit.bit_length() - 1] = distance
+            couche ^= bit
+        frontiere = etendre(etat, frontiere) & ~atteintes
+        atteintes |= frontiere
+        distance += 1
+
+    if len(_cache_distances) >= TAILLE_MAX_CACHE_DISTANCES:
+        _cache_distances.clear()
+    carte = tuple(distances)
+    _cache_distances[cle] = carte
+    return carte
+
+def distance_objectif(etat, joueur):
+    """Distance du pion d'un joueur à sa ligne objectif (lecture dans la carte en cache)"""
+    if joueur == 1:
+        return carte_distances(etat, 8)[etat.pos_j1]
+    return carte_distances(etat, 0)[etat.pos_j2]
+
+def evaluer_position(etat, joueur_principal=2, alea=random):
+    """
+    Évalue la position actuelle du jeu (mode facile).
+    Détermine un score basé sur la proximité à la ligne opposée
+    et d'autres critères simples pour guider les prochaines actions.
+    Args:
+        etat: GameState de la position (pions, murs and murs restants)
+        joueur_principal: Le joueur dont on évalue la position (1 or 2)
+        
+    Returns:
+        float: Score d'évaluation (positif si favorable au joueur_principal)
+    """
+    # Déterminer qui est le joueur and qui est l'adversaire
+    joueur_num = joueur_principal
+    adversaire_num = 3 - joueur_principal  # 1->2, 2->1
+
+    # Positions des joueurs
+    pos_joueur = etat.position(joueur_num)
+    pos_adversaire = etat.position(adversaire_num)
+
+    # Déterminer les lignes objectifs
+    ligne_obj_joueur = 8 if joueur_num == 1 else 0
+    ligne_obj_adversaire = 0 if joueur_num == 1 else 8
+
+    # Détection de fin de partie
+    if pos_joueur[0] == ligne_obj_joueur:  # Joueur principal gagne
+        return 10000
+    if pos_adversaire[0] == ligne_obj_adversaire:  # Adversaire gagne
+        return -10000
+        
+    # Distances optimales (cartes de distances partagées par toutes les feuilles)
+    dist_joueur = distance_objectif(etat, joueur_num)
+    dist_adversaire = distance_objectif(etat, adversaire_num)
+    
+    # Coefficients de pondération - RÉDUITS pour l'IA facile
+    poids_distance = 3.0  # Réduit de 5.0 à 3.0
+    poids_avance = 2.0    # Réduit de 3.0 à 2.0
+    poids_position_centrale = 0.3  # Réduit de 0.5 à 0.3
+    
+    # Distance and progression - positif quand favorable au joueur_principal
+    # IA facile: fonction simplifiée qui favorise moins les situations avantageuses
+    position_score = (dist_adversaire - dist_joueur) * poids_distance
+    
+    # Calcul de la progression vers l'objectif
+    if joueur_num == 1:  # Joueur 1 va vers le bas (ligne 8)
+        progres_joueur = pos_joueur[0] * poids_avance
+    else:  # Joueur 2 va vers le haut (ligne 0)
+        progres_joueur = (8 - pos_joueur[0]) * poids_avance
+    
+    # Bonus pour le contrôle du centre
+    centre_score = 0
+    if 3 <= pos_joueur[1] <= 5:
+        centre_score = poids_position_centrale
+    
+    # Impact des murs restants en fin de partie
+    murs_score = 0
+    if dist_joueur <= 3 or dist_adversaire <= 3:  # En fin de partie
+        murs_restants_joueur = etat.murs_restants(joueur_num)
+        murs_restants_adversaire = etat.murs_restants(adversaire_num)
+        murs_score = (murs_restants_joueur - murs_restants_adversaire) * 0.5
+    
+    # Ajouter plus d'aléatoire pour le niveau facile pour éviter les répétitions and rendre moins prévisible
+    random_factor = alea.uniform(-2.0, 2.0)  # Augmenté de -0.5/0.5 à -2.0/2.0
+    
+    return position_score + progres_joueur + centre_score + murs_score + random_factor
+
+def evaluer_position_intermediaire(etat, joueur_principal=2):
+    """
+    Fonction d'évaluation pour le niveau intermédiaire, plus orientée sur le blocage.
+    
+    Args:
+        Identiques à evaluer_position
+    """
+    joueur_num = joueur_principal
+    adversaire_num = 3 - joueur_principal
+    
+    pos_joueur = etat.position(joueur_num)
+    pos_adversaire = etat.position(adversaire_num)
+
+    ligne_obj_joueur = 8 if joueur_num == 1 else 0
+    ligne_obj_adversaire = 0 if joueur_num == 1 else 8
+
+    # Détection de fin de partie
+    if pos_joueur[0] == ligne_obj_joueur:
+        return 10000
+    if pos_adversaire[0] == ligne_obj_adversaire:
+        return -10000
+        
+    # Calcul des distances
+    dist_joueur = distance_objectif(etat, joueur_num)
+    dist_adversaire = distance_objectif(etat, adversaire_num)
+    
+    # Plus orienté sur le blocage de l'adversaire que l'avancée personnelle
+    poids_distance_adversaire = 7.0  # Plus élevé que dans la version standard
+    poids_distance_joueur = 3.0      # Moins élevé que dans la version standard
+    poids_avance = 2.0
+    poids_murs_restants = 1.2        # Plus d'importance aux murs
+    
+    # Score basé sur la différence de distance, mais favorisant le blocage
+    position_score = poids_distance_adversaire * dist_adversaire - poids_distance_joueur * dist_joueur
+    
+    # Progression du joueur
+    if joueur_num == 1:
+        progres_joueur = pos_joueur[0] * poids_avance
+    else:
+        progres_joueur = (8 - pos_joueur[0]) * poids_avance
+        
+    # Favoriser la conservation des murs pour la fin de partie
+    murs_restants_joueur = etat.murs_restants(joueur_num)
+    murs_restants_adversaire = etat.murs_restants(adversaire_num)
+    
+    murs_score = (murs_restants_joueur - murs_restants_adversaire * 0.8) * poids_murs_restants
+    
+    # Bonus pour être en position de bloquer l'adversaire
+    dist_a_adversaire = abs(pos_joueur[0] - pos_adversaire[0]) + abs(pos_joueur[1] - pos_adversaire[1])
+    bonus_blocage = 0
+    if dist_a_adversaire <= 2:
+        if 1 <= pos_adversaire[0] <= 7:  # Si l'adversaire n'est pas aux extrémités
+            bonus_blocage = 3.0
+    
+    # Bonus pour les positions qui contrôlent le centre du plateau
+    centre_score = 0
+    if 3 <= pos_joueur[1] <= 5:
+        if (joueur_num == 1 and pos_joueur[0] >= 4) or (joueur_num == 2 and pos_joueur[0] <= 4):
+            centre_score = 2.5  # Forte valeur pour contrôler le centre dans la moitié adverse
+        else:
+            centre_score = 1.0
+    
+    # Pénalité pour trop s'éloigner du centre horizontalement
+    ecart_centre = abs(pos_joueur[1] - 4)
+    penalite_ecart = -ecart_centre * 0.5
+    
+    return position_score + progres_joueur + murs_score + bonus_blocage + centre_score + penalite_ecart
+
+def evaluer_position_difficile(etat, joueur_principal=2):
+    """
+    Fonction d'évaluation pour le niveau difficile, plus sophistiquée and équilibrée.
+    
+    Args:
+        Identiques à evaluer_position
+    """
+    joueur_num = joueur_principal
+    adversaire_num = 3 - joueur_principal
+    
+    pos_joueur = etat.position(joueur_num)
+    pos_adversaire = etat.position(adversaire_num)
+
+    ligne_obj_joueur = 8 if joueur_num == 1 else 0
+    ligne_obj_adversaire = 0 if joueur_num == 1 else 8
+
+    # Détection de fin de partie
+    if pos_joueur[0] == ligne_obj_joueur:
+        return 10000
+    if pos_adversaire[0] == ligne_obj_adversaire:
+        return -10000
+        
+    # Calcul des distances
+    dist_joueur = distance_objectif(etat, joueur_num)
+    dist_adversaire = distance_objectif(etat, adversaire_num)
+    
+    # Équilibre bien dosé entre progression and blocage
+    poids_distance = 5.5
+    poids_avance = 3.5
+    poids_position_centrale = 1.0
+    poids_murs_strategie = 2.0
+    
+    # Score basé sur la différence de distance 
+    position_score = (dist_adversaire - dist_joueur) * poids_distance
+    
+    # Progression and avancement sur le plateau
+    if joueur_num == 1:
+        progres_joueur = pos_joueur[0] * poids_avance
+    else:
+        progres_joueur = (8 - pos_joueur[0]) * poids_avance
+    
+    # Contrôle du centre avec plus de nuances
+    centre_score = 0
+    if 2 <= pos_joueur[1] <= 6:  # Zone plus large que la version de base
+        centre_bonus = 6 - abs(pos_joueur[1] - 4) * 2  # Bonus dégressif depuis la colonne centrale
+        centre_score = centre_bonus * poids_position_centrale
+    
+    # Bonus pour les positions de jeu stratégiques
+    position_strategique = 0
+    if (joueur_num == 1 and pos_joueur[0] >= 5) or (joueur_num == 2 and pos_joueur[0] <= 3):
+        # Position avancée dans le territoire adverse
+        position_strategique += 2.0
+    
+    # La différence de chemins alternatifs (mesure la flexibilité de mouvement)
+    chemins_joueur = count_chemins_alternatifs(pos_joueur, ligne_obj_joueur, etat, max_depth=6)
+    chemins_adversaire = count_chemins_alternatifs(pos_adversaire, ligne_obj_adversaire, etat, max_depth=6)
+    score_flexibilite = (chemins_joueur - chemins_adversaire) * 0.5
+    
+    # Utilisation stratégique des murs (variable selon la phase de jeu)
+    murs_restants_joueur = etat.murs_restants(joueur_num)
+    murs_restants_adversaire = etat.murs_restants(adversaire_num)
+    nombre_murs = etat.nombre_murs()
+    
+    # En début de partie, conserver ses murs
+    if nombre_murs < 8:
+        murs_score = murs_restants_joueur * 0.4
+    # En milieu de partie, les utiliser stratégiquement
+    elif nombre_murs < 16:
+        ratio_joueur_adverse = murs_restants_joueur / (murs_restants_adversaire + 0.1)
+        murs_score = ratio_joueur_adverse * poids_murs_strategie
+    # En fin de partie, pousser pour la victoire or bloquer l'adversaire
+    else:
+        if dist_joueur < dist_adversaire:
+            # Si on est en avance, garder des murs pour bloquer le rattrapage
+            murs_score = murs_restants_joueur * 0.8
+        else:
+            # Si on est en retard, valeur moindre des murs
+            murs_score = murs_restants_joueur * 0.3
+    
+    return position_score + progres_joueur + centre_score + position_strategique + score_flexibilite + murs_score
+
+# Taille par défaut de la table de transposition (en mégaoctets)
+TAILLE_TABLE_TRANSPOSITION_MO = 32
+
+# Types de score stockés dans la table de transposition
+EXACT = 0
+BORNE_INF = 1  # Le score réel est supérieur or égal au score stocké
+BORNE_SUP = 2  # Le score réel est inférieur or égal au score stocké
+
+class TableTransposition:
+    """
+    Table de transposition bornée pour minimax, indexée par clé de Zobrist.
+
+    Chaque case contient (clé, profondeur, borne, score, meilleur coup, génération).
+    Remplacement : une entrée n'est écrasée que par la même position, par une
+    recherche plus profonde or égale, or si elle date d'un coup précédent.
+    """
+    TAILLE_ENTREE = 128  # Estimation en octets d'une entrée (tuple, entiers and pointeur)
+
+    def __init__(self, taille_mo=TAILLE_TABLE_TRANSPOSITION_MO):
+        nombre = max(1, int(taille_mo * 1024 * 1024) // self.TAILLE_ENTREE)
+        nombre = 1 << (nombre.bit_length() - 1)  # Puissance de deux pour indexer par masque
+        self.masque = nombre - 1
+        self.entrees = [None] * nombre
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coupures = 0
+        self.ecritures = 0
+
+    def nouvelle_recherche(self):
+        """À appeler avant chaque coup : les entrées plus anciennes deviennent remplaçables"""
+        self.generation += 1
+
+    def vider(self):
+        self.entrees = [None] * (self.masque + 1)
+        self.generation = 0
+        self.reinitialiser_compteurs()
+
+    def reinitialiser_compteurs(self):
+        self.hits = 0
+        self.misses = 0
+        self.coupures = 0
+        self.ecritures = 0
+
+    def sonder(self, cle):
+        entree = self.entrees[cle & self.masque]
+        if entree is not None and entree[0] == cle:
+            self.hits += 1
+            return entree
+        self.misses += 1
+        return None
+
+    def enregistrer(self, cle, profondeur, borne, score, meilleur_coup):
+        index = cle & self.masque
+        entree = self.entrees[index]
+        if (entree is None or entree[0] == cle or profondeur >= entree[1]
+                or entree[5] != self.generation):
+            self.entrees[index] = (cle, profondeur, borne, score, meilleur_coup, self.generation)
+            self.ecritures += 1
+
+    def statistiques(self):
+        sondages = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'taux_hits': self.hits / sondages if sondages else 0.0,
+            'coupures': self.coupures,
+            'ecritures': self.ecritures,
+            'entrees': self.masque + 1,
+        }
+
+table_transposition = TableTransposition()
+
+def configurer_table_transposition(taille_mo):
+    """Remplace la table de transposition globale par une table de la taille donnée (en Mo)"""
+    global table_transposition
+    table_transposition = TableTransposition(taille_mo)
+    return table_transposition
+
+def _cle_recherche(etat, joueur_principal, difficulte, avec_murs=False):
+    """Clé de table : la position plus le point de vue, la fonction d'évaluation and le mode de recherche"""
+    cle = etat.cle ^ ZOBRIST_PRINCIPAL[joueur_principal - 1] ^ (ZOBRIST_DIFFICULTE * difficulte & 0xFFFFFFFFFFFFFFFF)
+    if avec_murs:
+        cle ^= ZOBRIST_MURS_RECHERCHE
+    return cle
+
+class RechercheInterrompue(Exception):
+    """Levée dans minimax quand le budget (temps or nœuds) de la recherche est épuisé"""
+    pass
+
+class RechercheAnnulee(Exception):
+    """Levée par meilleur_coup_ia quand la recherche est annulée (voir RechercheEnCours)"""
+    pass
+
+class ContexteRecherche:
+    """
+    Recherche en cours : échéance (time.perf_counter), budget de nœuds, compteur de nœuds
+    visités and générateur du hasard de l'IA (alea : coups aléatoires du niveau facile, choix
+    entre mur and déplacement, simulations MCTS ; par défaut le module random). Les limites
+    ne sont vérifiées que si limites_actives est vrai, ce qui permet de toujours terminer
+    la première itération. L'annulation (threading.Event optionnel) est vérifiée à chaque
+    nœud, première itération comprise.
+    """
+    __slots__ = ('echeance', 'budget_noeuds', 'noeuds', 'limites_actives', 'profondeur_atteinte',
+                 'annulation', 'alea')
+
+    def __init__(self, budget_temps=None, budget_noeuds=None, annulation=None, alea=None):
+        self.echeance = time.perf_counter() + budget_temps if budget_temps is not None else None
+        self.budget_noeuds = budget_noeuds
+        self.noeuds = 0
+        self.limites_actives = True
+        self.profondeur_atteinte = 0
+        self.annulation = annulation
+        self.alea = alea if alea is not None else random
+
+    def limitee(self):
+        """Indique si la recherche a un budget or peut être annulée (approfondissement itératif)"""
+        return self.echeance is not None or self.budget_noeuds is not None or self.annulation is not None
+
+    def verifier_annulation(self):
+        """Lève RechercheAnnulee si la recherche a été annulée"""
+        if self.annulation is not None and self.annulation.is_set():
+            raise RechercheAnnulee()
+
+    def temps_restant(self):
+        if self.echeance is None:
+            return float('inf')
+        return self.echeance - time.perf_counter()
+
+    def verifier(self):
+        """Compte un nœud and lève RechercheInterrompue si une limite est dépassée"""
+        self.noeuds += 1
+        if self.annulation is not None and self.annulation.is_set():
+            raise RechercheAnnulee()
+        if self.limites_actives:
+            if self.budget_noeuds is not None and self.noeuds > self.budget_noeuds:
+                raise RechercheInterrompue()
+            if self.echeance is not None and time.perf_counter() > self.echeance:
+                raise RechercheInterrompue()
+
+class StatistiquesRecherche:
+    """
+    Compteurs d'une or plusieurs recherches de meilleur_coup_ia : nœuds minimax, évaluations
+    de feuilles, coupures alpha-beta par demi-coup depuis la racine, appels des parcours de
+    chemins (A*, has_path, cartes de distances calculées, count_chemins_alternatifs), murs
+    candidats générés and rejetés faute de chemin, sondages de la table de transposition,
+    réponses préparées pendant le tour adverse (Reflexion : coups demandés, coups trouvés
+    and secondes de recherche économisées), consultations du livre d'ouvertures, parties
+    simulées par le niveau MCTS (nœuds de son arbre dans noeuds) and durées par phase
+    (en secondes). Les coups joués depuis le livre ne comptent pas dans coups.
+
+    Pendant un coup, l'objet est publié dans la variable globale statistiques_recherche ;
+    les fonctions ne comptent que si elle n'est pas None, ce qui ne coûte qu'un test
+    quand les statistiques sont désactivées.
+    """
+    __slots__ = ('coups', 'noeuds', 'evaluations', 'coupures', 'appels_a_star', 'appels_has_path',
+                 'cartes_distances', 'appels_chemins_alternatifs', 'murs_generes', 'murs_rejetes',
+                 'sondages_table', 'succes_table', 'coupures_table', 'sondages_reflexion',
+                 'succes_reflexion', 'temps_economise', 'sondages_livre', 'succes_livre', 'playouts',
+                 'durees')
+
+    COMPTEURS = ('coups', 'noeuds', 'evaluations', 'appels_a_star', 'appels_has_path',
+                 'cartes_distances', 'appels_chemins_alternatifs', 'murs_generes', 'murs_rejetes',
+                 'sondages_table', 'succes_table', 'coupures_table', 'sondages_reflexion',
+                 'succes_reflexion', 'temps_economise', 'sondages_livre', 'succes_livre', 'playouts')
+
+    def __init__(self):
+        for compteur in self.COMPTEURS:
+            setattr(self, compteur, 0)
+        self.coupures = {}  # demi-coup depuis la racine -> nombre de coupures
+        self.durees = {}    # phase -> secondes
+
+    def ajouter_duree(self, phase, duree):
+        self.durees[phase] = self.durees.get(phase, 0.0) + duree
+
+    def fusionner(self, autre):
+        """Ajoute les compteurs d'un autre objet (autre coup, autre match or autre processus)"""
+        for compteur in self.COMPTEURS:
+            setattr(self, compteur, getattr(self, compteur) + getattr(autre, compteur))
+        for ply, nombre in autre.coupures.items():
+            self.coupures[ply] = self.coupures.get(ply, 0) + nombre
+        for phase, duree in autre.durees.items():
+            self.ajouter_duree(phase, duree)
+        return self
+
+    def temps_economise_livre(self):
+        """Temps de recherche économisé par le livre d'ouvertures, estimé au temps moyen d'un coup cherché"""
+        if not self.coups:
+            return 0.0
+        return self.succes_livre * self.durees.get('total', 0.0) / self.coups
+
+    def en_dict(self):
+        resultat = {compteur: getattr(self, compteur) for compteur in self.COMPTEURS}
+        resultat['coupures'] = dict(sorted(self.coupures.items()))
+        resultat['durees'] = dict(self.durees)
+        return resultat
+
+    def resume(self):
+        """Lignes lisibles : moyennes par coup and part du temps de chaque phase"""
+        coups = max(1, self.coups)
+        total = self.durees.get('total', 0.0)
+        lignes = [
+            f"{self.coups} coups, {total / coups * 1000:.1f} ms par coup",
+            f"nœuds {self.noeuds / coups:.0f}, évaluations {self.evaluations / coups:.0f} par coup "
+            f"({self.noeuds / total if total else 0:.0f} nœuds/s)",
+            "coupures alpha-beta par demi-coup : " +
+            (", ".join(f"{ply}: {nombre}" for ply, nombre in sorted(self.coupures.items())) or "aucune"),
+            f"A* {self.appels_a_star / coups:.1f}, has_path {self.appels_has_path / coups:.1f}, "
+            f"cartes de distances {self.cartes_distances / coups:.1f}, "
+            f"count_chemins_alternatifs {self.appels_chemins_alternatifs / coups:.1f} par coup",
+            f"murs candidats {self.murs_generes}, rejetés faute de chemin {self.murs_rejetes}",
+            f"table de transposition : {self.succes_table}/{self.sondages_table} sondages réussis, "
+            f"{self.coupures_table} coupures",
+        ]
+        if self.sondages_reflexion:
+            lignes.append(f"réflexion pendant le tour adverse : {self.succes_reflexion}/{self.sondages_reflexion} "
+                          f"réponses prêtes, {self.temps_economise:.2f} s économisées")
+        if self.sondages_livre:
+            lignes.append(f"livre d'ouvertures : {self.succes_livre}/{self.sondages_livre} coups trouvés, "
+                          f"environ {self.temps_economise_livre():.2f} s économisées")
+        if self.playouts:
+            duree_mcts = self.durees.get('mcts', 0.0)
+            lignes.append(f"MCTS : {self.playouts / coups:.0f} parties simulées par coup "
+                          f"({self.playouts / duree_mcts if duree_mcts else 0:.0f} playouts/s)")
+        for phase, duree in sorted(self.durees.items(), key=lambda item: -item[1]):
+            if phase != 'total':
+                lignes.append(f"phase {phase} : {duree / coups * 1000:.1f} ms par coup "
+                              f"({duree / total if total else 0:.0%})")
+        return lignes
+
+# Statistiques du coup en cours (None : comptage désactivé)
+statistiques_recherche = None
+
+def _alea(contexte):
+    """Générateur du hasard d'une recherche : celui de son contexte, par défaut le module random"""
+    return contexte.alea if contexte is not None else random
+
+def minimax(etat, profondeur, alpha, beta, est_maximisant, joueur_principal=2, difficulte=DIFFICULTY_HARD,
+            contexte=None, avec_murs=False):
+    """
+    Implémentation unifiée de minimax avec élagage alpha-beta.
+    Utilise différentes fonctions d'évaluation selon la difficulté.
+    
+    Args:
+        etat: GameState de la position (le joueur qui a la main est etat.tour)
+        profondeur: Profondeur restante de recherche
+        alpha, beta: Valeurs pour l'élagage
+        est_maximisant: Si c'est le tour du joueur maximisant
+        joueur_principal: Le joueur pour lequel on optimise (1 or 2)
+        difficulte: Le niveau de difficulté qui détermine la fonction d'évaluation
+        contexte: ContexteRecherche optionnel (budget de temps or de nœuds)
+        avec_murs: Si vrai, les poses de murs (murs_candidats_recherche) sont aussi des coups
+                   de l'arbre (niveaux intermédiaire and difficile seulement)
+        
+    Returns:
+        float: Score de la meilleure position trouvée
+    """
+    if contexte is not None:
+        contexte.verifier()
+    stats = statistiques_recherche
+    if stats is not None:
+        stats.noeuds += 1
+
+    # Niveau facile : évaluation bruitée and coups tirés au hasard, pas de table de transposition
+    if difficulte == DIFFICULTY_EASY:
+        if profondeur == 0:
+            if stats is not None:
+                stats.evaluations += 1
+            return evaluer_position(etat, joueur_principal, _alea(contexte))
+        return _minimax_sans_table(etat, profondeur, alpha, beta, est_maximisant, joueur_principal, difficulte,
+                                   contexte)
+
+    # Consulter la table de transposition
+    table = table_transposition
+    cle = _cle_recherche(etat, joueur_principal, difficulte, avec_murs)
+    entree = table.sonder(cle)
+    coup_table = None
+    if entree is not None:
+        _, profondeur_table, borne, score_table, coup_table, _ = entree
+        if profondeur_table >= profondeur:
+            if borne == EXACT:
+                table.coupures += 1
+                return score_table
+            if borne == BORNE_INF and score_table >= beta:
+                table.coupures += 1
+                return score_table
+            if borne == BORNE_SUP and score_table <= alpha:
+                table.coupures += 1
+                return score_table
+
+    # Vérifier fin de partie or profondeur max atteinte
+    if profondeur == 0:
+        if stats is not None:
+            stats.evaluations += 1
+        if difficulte == DIFFICULTY_MEDIUM:
+            score = evaluer_position_intermediaire(etat, joueur_principal)
+        else:  # difficulté DIFFICULTY_HARD
+            score = evaluer_position_difficile(etat, joueur_principal)
+        table.enregistrer(cle, 0, EXACT, score, None)
+        return score
+
+    tour_joueur = etat.tour
+
+    # Vérifier victoire
+    ligne_obj = 8 if tour_joueur == 1 else 0
+    if etat.case(tour_joueur) // GRID_SIZE == ligne_obj:
+        return float('inf') if tour_joueur == joueur_principal else float('-inf')
+
+    # Coups possibles (déplacements puis murs), le meilleur coup connu de la table en premier
+    coups_possibles = deplacements_possibles(etat, tour_joueur)
+    if avec_murs and etat.murs_restants(tour_joueur) > 0:
+        murs_candidats = murs_candidats_recherche(etat, tour_joueur)
+        coups_possibles += murs_candidats
+        if stats is not None:
+            stats.murs_generes += len(murs_candidats)
+    if coup_table in coups_possibles:
+        coups_possibles.remove(coup_table)
+        coups_possibles.insert(0, coup_table)
+
+    alpha_initial, beta_initial = alpha, beta
+    meilleur_coup = None
+    if est_maximisant:
+        meilleur_score = float('-inf')
+        for coup in coups_possibles:
+            etat.jouer_coup(tour_joueur, coup)
+            if coup >= ENTREE_MUR_H and not chemins_ouverts(etat):
+                etat.annuler()
+                if stats is not None:
+                    stats.murs_rejetes += 1
+                continue
+            score = minimax(etat, profondeur - 1, alpha, beta,
+                            False, joueur_principal, difficulte, contexte, avec_murs)
+            etat.annuler()
+            if score > meilleur_score or meilleur_coup is None:
+                meilleur_score = score
+                meilleur_coup = coup
+            alpha = max(alpha, meilleur_score)
+            if beta <= alpha:
+                if stats is not None:
+                    _compter_coupure(stats, etat)
+                break
+    else:
+        meilleur_score = float('inf')
+        for coup in coups_possibles:
+            etat.jouer_coup(tour_joueur, coup)
+            if coup >= ENTREE_MUR_H and not chemins_ouverts(etat):
+                etat.annuler()
+                if stats is not None:
+                    stats.murs_rejetes += 1
+                continue
+            score = minimax(etat, profondeur - 1, alpha, beta,
+                            True, joueur_principal, difficulte, contexte, avec_murs)
+            etat.annuler()
+            if score < meilleur_score or meilleur_coup is None:
+                meilleur_score = score
+                meilleur_coup = coup
+            beta = min(beta, meilleur_score)
+            if beta <= alpha:
+                if stats is not None:
+                    _compter_coupure(stats, etat)
+                break
+
+    # Stocker le résultat avec le type de borne correspondant à la fenêtre initiale
+    if meilleur_score <= alpha_initial:
+        borne = BORNE_SUP
+    elif meilleur_score >= beta_initial:
+        borne = BORNE_INF
+    else:
+        borne = EXACT
+    table.enregistrer(cle, profondeur, borne, meilleur_score, meilleur_coup)
+    return meilleur_score
+
+def _compter_coupure(stats, etat):
+    """Coupure alpha-beta ; la recherche part d'une copie, donc l'historique donne le demi-coup"""
+    ply = len(etat.historique)
+    stats.coupures[ply] = stats.coupures.get(ply, 0) + 1
+
+def _minimax_sans_table(etat, profondeur, alpha, beta, est_maximisant, joueur_principal, difficulte, contexte):
+    """Minimax alpha-beta du niveau facile (coups limités and arrêts aléatoires)"""
+    alea = _alea(contexte)
+    tour_joueur = etat.tour
+
+    # Ligne objectif dépend du joueur
+    ligne_obj = 8 if tour_joueur == 1 else 0
+
+    # Vérifier victoire
+    if etat.case(tour_joueur) // GRID_SIZE == ligne_obj:
+        return float('inf') if tour_joueur == joueur_principal else float('-inf')
+
+    # Obtenir coups possibles
+    coups_possibles = deplacements_possibles(etat, tour_joueur)
+
+    # Pour le niveau facile, considérer seulement une partie des coups possibles
+    if difficulte == DIFFICULTY_EASY:
+        # Limiter les choix à examiner pour l'IA facile
+        if len(coups_possibles) > 2:
+            # Ne considérer que 2 coups aléatoires or quelques coups de base
+            alea.shuffle(coups_possibles)
+            coups_possibles = coups_possibles[:2]
+
+    # Tour du joueur maximisant (joueur_principal)
+    if est_maximisant:
+        meilleur_score = float('-inf')
+        for coup in coups_possibles:
+            # Simuler le coup and appel récursif - la main passe à l'adversaire
+            etat.jouer_deplacement(tour_joueur, coup)
+            score = minimax(etat, profondeur - 1, alpha, beta,
+                            False, joueur_principal, difficulte, contexte)
+            etat.annuler()
+
+            meilleur_score = max(score, meilleur_score)
+            alpha = max(alpha, meilleur_score)
+
+            # Élagage
+            if beta <= alpha:
+                if statistiques_recherche is not None:
+                    _compter_coupure(statistiques_recherche, etat)
+                break
+
+            # Pour l'IA facile, ajouter une chance d'arrêter l'exploration prématurément
+            if difficulte == DIFFICULTY_EASY and alea.random() < 0.3:
+                break
+
+        return meilleur_score
+
+    # Tour du joueur minimisant
+    else:
+        meilleur_score = float('inf')
+        for coup in coups_possibles:
+            # Simuler le coup and appel récursif - la main passe à l'adversaire
+            etat.jouer_deplacement(tour_joueur, coup)
+            score = minimax(etat, profondeur - 1, alpha, beta,
+                            True, joueur_principal, difficulte, contexte)
+            etat.annuler()
+
+            meilleur_score = min(score, meilleur_score)
+            beta = min(beta, meilleur_score)
+
+            # Élagage
+            if beta <= alpha:
+                if statistiques_recherche is not None:
+                    _compter_coupure(statistiques_recherche, etat)
+                break
+                
+            # Pour l'IA facile, ajouter une chance d'arrêter l'exploration prématurément
+            if difficulte == DIFFICULTY_EASY and alea.random() < 0.3:
+                break
+
+        return meilleur_score
+
+# Recherche parallèle à la racine : nombre de processus de calcul (1 : tout dans ce processus)
+processus_recherche = 1
+_pool_recherche = None
+
+# En deçà, les coups racine sont trop vite évalués pour gagner à être répartis
+PROFONDEUR_MIN_PARALLELE = 3
+
+def configurer_recherche_parallele(processus):
+    """
+    Répartit les coups racine des niveaux intermédiaire and difficile entre plusieurs
+    processus de calcul (None : autant que de cœurs ; 1 : recherche dans ce processus).
+    Le pool est créé au premier coup concerné puis conservé d'un coup à l'autre.
+    """
+    global processus_recherche, _pool_recherche
+    if processus is None:
+        processus = os.cpu_count() or 1
+    processus = max(1, processus)
+    if _pool_recherche is not None and processus != processus_recherche:
+        _pool_recherche.shutdown()
+        _pool_recherche = None
+    processus_recherche = processus
+
+def _recherche_parallele(difficulte, profondeur):
+    """Indique si les coups racine d'une recherche sont répartis entre les processus de calcul"""
+    return (processus_recherche > 1 and difficulte != DIFFICULTY_EASY
+            and profondeur >= PROFONDEUR_MIN_PARALLELE)
+
+def _evaluer_coup_racine(etat, joueur_num, coup, profondeur, difficulte, alpha, avec_murs, limites,
+                         generation, avec_statistiques):
+    """
+    Score minimax d'un coup racine, dans un processus de calcul (voir _meilleur_coup_parallele).
+    Renvoie (score, nœuds visités, StatistiquesRecherche or None).
+    """
+    global statistiques_recherche
+    table = table_transposition
+    # Les entrées des coups précédents restent utilisables mais deviennent remplaçables
+    table.generation = generation
+    contexte = ContexteRecherche(*limites) if limites is not None else ContexteRecherche()
+    if avec_statistiques:
+        statistiques_recherche = StatistiquesRecherche()
+        hits, misses, coupures = table.hits, table.misses, table.coupures
+    try:
+        etat.jouer_coup(joueur_num, coup)
+        score = minimax(etat, profondeur, alpha, float('inf'), False,
+                        joueur_principal=joueur_num, difficulte=difficulte,
+                        contexte=contexte, avec_murs=avec_murs)
+        stats = statistiques_recherche
+        if stats is not None:
+            stats.succes_table += table.hits - hits
+            stats.sondages_table += table.hits - hits + table.misses - misses
+            stats.coupures_table += table.coupures - coupures
+        return score, contexte.noeuds, stats
+    finally:
+        statistiques_recherche = None
+
+def _meilleur_coup_parallele(etat, joueur_num, candidats, profondeur, difficulte, contexte,
+                             avec_murs=False):
+    """
+    Évalue les coups racine candidats, liste de (code du coup, bonus), dans les processus de
+    calcul : un lot d'autant de coups que de processus à la fois. Chaque lot est cherché avec
+    pour borne alpha le meilleur score des lots précédents (moins le bonus du coup), ce qui
+    coupe les coups moins bons sans changer le choix. Le score d'un coup est son score minimax
+    plus son bonus ; comme dans la boucle séquentielle, le premier coup de score strictement
+    supérieur l'emporte. Renvoie (meilleur coup, meilleur score).
+    """
+    global _pool_recherche
+    if _pool_recherche is None:
+        _pool_recherche = ProcessPoolExecutor(max_workers=processus_recherche,
+                                              initializer=_initialiser_processus,
+                                              initargs=(CHEMINS_ALTERNATIFS_HISTORIQUE, chemin_livre_ouvertures, PLAYOUTS_MCTS))
+    stats = statistiques_recherche
+    meilleur_score = float('-inf')
+    meilleur_coup = None
+    for debut in range(0, len(candidats), processus_recherche):
+        lot = candidats[debut:debut + processus_recherche]
+        limites = None
+        if contexte is not None and contexte.limites_actives:
+            limites = (contexte.temps_restant() if contexte.echeance is not None else None,
+                       contexte.budget_noeuds - contexte.noeuds
+                       if contexte.budget_noeuds is not None else None)
+        futures = [_pool_recherche.submit(_evaluer_coup_racine, etat, joueur_num, coup, profondeur - 1,
+                                          difficulte, meilleur_score - bonus, avec_murs, limites,
+                                          table_transposition.generation, stats is not None)
+                   for coup, bonus in lot]
+        # Une recherche annulable n'attend le lot que par petites tranches
+        annulation = contexte.annulation if contexte is not None else None
+        en_cours = futures
+        while en_cours:
+            _, en_cours = wait(en_cours, timeout=0.05 if annulation is not None else None)
+            if annulation is not None and annulation.is_set():
+                for future in en_cours:
+                    future.cancel()
+                raise RechercheAnnulee()
+        resultats = []
+        interrompue = False
+        for future in futures:
+            try:
+                resultats.append(future.result())
+            except RechercheInterrompue:
+                interrompue = True
+        if interrompue:
+            raise RechercheInterrompue()
+
+        for (coup, bonus), (score, noeuds, stats_coup) in zip(lot, resultats):
+            if contexte is not None:
+                contexte.noeuds += noeuds
+            if stats_coup is not None:
+                stats.fusionner(stats_coup)
+            if score + bonus > meilleur_score or meilleur_coup is None:
+                meilleur_score = score + bonus
+                meilleur_coup = coup
+        if (contexte is not None and contexte.limites_actives and contexte.budget_noeuds is not None
+                and contexte.noeuds > contexte.budget_noeuds):
+            raise RechercheInterrompue()
+    return meilleur_coup, meilleur_score
+
+def meilleur_deplacement_pour_joueur(etat, joueur_num, profondeur, difficulte, contexte=None, coup_prioritaire=None):
+    """
+    Détermine le meilleur déplacement pour un joueur (renvoie la case d'arrivée).
+    coup_prioritaire (meilleur coup de l'itération précédente) est examiné en premier.
+    La recherche joue and défait les coups sur une copie de l'état.
+    """
+    etat = etat.copie()
+    alea = _alea(contexte)
+    i, j = etat.position(joueur_num)
+    coups_possibles = deplacements_possibles(etat, joueur_num)
+    
+    if not coups_possibles:
+        return None, None
+    if coup_prioritaire in coups_possibles:
+        coups_possibles.remove(coup_prioritaire)
+        coups_possibles.insert(0, coup_prioritaire)
+        
+    # Pour éviter les répétitions en mode facile, ajouter une petite perturbation aléatoire
+    if difficulte == DIFFICULTY_EASY:
+        # Augmenter la probabilité de choisir un coup aléatoire pour l'IA facile
+        if alea.random() < 0.40:  # 40% de chance (augmenté de 15%)
+            return alea.choice(coups_possibles), "deplacement"
+        
+    meilleur_score = float('-inf')
+    meilleur_coup = None
+    parallele = _recherche_parallele(difficulte, profondeur)
+    candidats = []
+    
+    for coup in coups_possibles:
+        ni, nj = divmod(coup, GRID_SIZE)
+        # Score de base selon la difficulté
+        score_base = 0
+        
+        # Bonus pour direction favorable
+        if (joueur_num == 1 and ni > i) or (joueur_num == 2 and ni < i):
+            # Réduire le bonus pour le niveau facile
+            score_base += 0.5 if difficulte == DIFFICULTY_EASY else 1  
+            
+        # Bonus pour position centrale
+        if 3 <= nj <= 5:
+            score_base += 0.2 if difficulte == DIFFICULTY_EASY else 0.5
+
+        # Recherche parallèle : les coups sont évalués après la boucle, dans les processus de calcul
+        if parallele:
+            candidats.append((coup, score_base))
+            continue
+        
+        # Pour l'IA facile, parfois ne pas utiliser minimax du tout
+        if difficulte == DIFFICULTY_EASY and alea.random() < 0.25:
+            score_minimax = score_base + alea.uniform(-1, 1)
+        else:
+            # Réduire la profondeur pour l'IA facile
+            depth_adjusted = max(1, profondeur - 1) if difficulte == DIFFICULTY_EASY else profondeur
+            
+            # Évaluation minimax du déplacement simulé avec la difficulté appropriée
+            etat.jouer_deplacement(joueur_num, coup)
+            score_minimax = minimax(etat,
+                                  profondeur=depth_adjusted - 1, 
+                                  alpha=float('-inf'), beta=float('inf'), 
+                                  est_maximisant=False, 
+                                  joueur_principal=joueur_num,
+                                  difficulte=difficulte,
+                                  contexte=contexte)
+            etat.annuler()
+        
+        # Pour le niveau facile, ajouter un facteur aléatoire plus important
+        if difficulte == DIFFICULTY_EASY:
+            score_minimax += alea.uniform(-3.0, 3.0)  # Augmenté de -1.0/1.0 à -3.0/3.0
+            
+        # Score final
+        score_final = score_base + score_minimax
+        
+        if score_final > meilleur_score:
+            meilleur_score = score_final
+            meilleur_coup = coup
+
+    if parallele:
+        meilleur_coup, _ = _meilleur_coup_parallele(etat, joueur_num, candidats, profondeur,
+                                                    difficulte, contexte)
+            
+    return meilleur_coup, "deplacement"
+
+def murs_proches_des_chemins_critique(etat, pos_joueur, target_row, difficulte=DIFFICULTY_HARD, alea=random):
+    """
+    Identifie les murs potentiels qui ralentissent efficacement l'adversaire
+    (alea : générateur du hasard de la recherche, voir ContexteRecherche)
+    """
+    # Trouver le chemin optimal actuel
+    dist_actuelle, chemin = a_star_search(pos_joueur, target_row, etat)
+
+    murs_candidats = []
+    murs_evalues = []
+    legaux = None  # Murs posables sans isoler un joueur (murs_legaux), calculés au premier besoin
+    # Les murs candidats sont posés puis retirés sur une copie de l'état
+    etat = etat.copie()
+    if difficulte == DIFFICULTY_MEDIUM:
+        chemins_avant = count_chemins_alternatifs(pos_joueur, target_row, etat, max_depth=4)
+    
+    # Stratégies différentes selon la difficulté
+    chemins_a_analyser = 1  # Base 
+    
+    # Pour le niveau facile, réduire encore plus l'analyse stratégique
+    if difficulte == DIFFICULTY_EASY:
+        # L'IA facile ne regardera qu'un segment à la fois and ne sera pas efficace pour les murs
+        chemins_a_analyser = 1
+        # Si le chemin est court or chance aléatoire, ne pas analyser du tout
+        if len(chemin) < 3 or alea.random() < 0.3:
+            return []
+    elif difficulte == DIFFICULTY_MEDIUM:
+        # L'IA intermédiaire analysera plus de segments pour trouver des opportunités de blocage
+        chemins_a_analyser = min(len(chemin) - 1, 4)  # Analyser jusqu'à 4 segments du chemin
+    elif difficulte == DIFFICULTY_HARD:
+        # L'IA difficile est plus sélective and efficace
+        chemins_a_analyser = min(len(chemin) - 1, 3)  # Analyser jusqu'à 3 segments du chemin
+
+    # Analyser chaque segment du chemin pour les murs potentiels
+    for i in range(min(chemins_a_analyser, len(chemin) - 1)):
+        curr_i, curr_j = chemin[i]
+
+        next_i, next_j = chemin[i + 1]
+
+        # Différence de position
+        di = next_i - curr_i
+        dj = next_j - curr_j
+
+        # Générer des murs possibles
+        murs_possibles = []
+
+        # Si mouvement horizontal
+        if di == 0:
+            x = min(curr_j, next_j)
+            # Mur vertical pour bloquer ce mouvement
+            murs_possibles.append({'x': x, 'y': curr_i - 1, 'orientation': 'V'})
+            murs_possibles.append({'x': x, 'y': curr_i, 'orientation': 'V'})
+            
+            # Pour le niveau intermédiaire, ajouter des murs adjacents pour créer des labyrinthes
+            if difficulte == DIFFICULTY_MEDIUM and curr_i > 0 and curr_i < GRID_SIZE-1:
+                murs_possibles.append({'x': x - 1 if x > 0 else x, 'y': curr_i, 'orientation': 'H'})
+                murs_possibles.append({'x': x, 'y': curr_i, 'orientation': 'H'})
+
+        # Si mouvement vertical
+        elif dj == 0:
+            y = min(curr_i, next_i)
+            # Mur horizontal pour bloquer ce mouvement
+            murs_possibles.append({'x': curr_j - 1, 'y': y, 'orientation': 'H'})
+            murs_possibles.append({'x': curr_j, 'y': y, 'orientation': 'H'})
+            
+            # Pour le niveau intermédiaire, ajouter des murs adjacents pour créer des labyrinthes
+            if difficulte == DIFFICULTY_MEDIUM and curr_j > 0 and curr_j < GRID_SIZE-1:
+                murs_possibles.append({'x': curr_j, 'y': y - 1 if y > 0 else y, 'orientation': 'V'})
+                murs_possibles.append({'x': curr_j, 'y': y, 'orientation': 'V'})
+
+        # Niveau facile: évaluer moins précisément les murs (parfois ignorer complètement)
+        if difficulte == DIFFICULTY_EASY and alea.random() < 0.4:
+            # Juste ajouter des murs au hasard parmi ceux disponibles
+            if murs_possibles:
+                mur = alea.choice(murs_possibles)
+                if mur_est_valide(mur, etat):
+                    murs_candidats.append((mur, 1))  # Gain arbitraire de 1
+            continue  # Passer à l'itération suivante
+
+        # Évaluer chaque mur possible
+        for mur in murs_possibles:
+            if (0 <= mur['x'] <= GRID_SIZE-2 and
+                0 <= mur['y'] <= GRID_SIZE-2 and
+                mur not in murs_evalues):
+
+                murs_evalues.append(mur)
+
+                if mur_est_valide(mur, etat):
+                    if statistiques_recherche is not None:
+                        statistiques_recherche.murs_generes += 1
+
+                    # Vérifier que les deux joueurs ont toujours un chemin
+                    if legaux is None:
+                        legaux = murs_legaux(etat)
+                    if not (legaux >> emplacement_mur(mur)) & 1:
+                        if statistiques_recherche is not None:
+                            statistiques_recherche.murs_rejetes += 1
+                        continue
+
+                    etat.jouer_mur(etat.tour, mur)
+
+                    # Calculer la nouvelle distance
+                    nouvelle_dist = carte_distances(etat, target_row)[pos_joueur[0] * GRID_SIZE + pos_joueur[1]]
+
+                    # Gain = augmentation de distance
+                    gain = nouvelle_dist - dist_actuelle
+                    
+                    # Pour l'IA facile, sous-estimer l'impact des murs
+                    if difficulte == DIFFICULTY_EASY:
+                        gain = gain * 0.5  # Réduit l'importance perçue des murs
+                        
+                    # Pour l'IA intermédiaire, considérer aussi les murs qui créent des détours plus longs
+                    if difficulte == DIFFICULTY_MEDIUM and gain > 0:
+                        # Bonus pour les murs qui forcent l'adversaire à faire un grand détour
+                        chemins_apres = count_chemins_alternatifs(pos_joueur, target_row, etat, max_depth=4)
+                        
+                        # Si le mur réduit significativement les options de l'adversaire
+                        if chemins_avant > chemins_apres:
+                            gain += (chemins_avant - chemins_apres) * 0.5
+
+                    if gain > 0:
+                        murs_candidats.append((mur, gain))
+
+                    etat.annuler()
+
+    # Trier les murs par gain décroissant
+    murs_candidats.sort(key=lambda x: x[1], reverse=True)
+
+    # Pour le niveau facile, introduire de l'aléatoire dans la sélection
+    if difficulte == DIFFICULTY_EASY and murs_candidats:
+        # Parfois choisir des murs au hasard au lieu des meilleurs
+        if alea.random() < 0.5:  # 50% de chance
+            alea.shuffle(murs_candidats)
+
+    # Retourner les meilleurs murs (plus nombreux pour l'IA intermédiaire)
+    if difficulte == DIFFICULTY_MEDIUM:
+        return [mur for mur, _ in murs_candidats[:7]]  # Plus d'options pour l'IA intermédiaire
+    elif difficulte == DIFFICULTY_EASY:
+        return [mur for mur, _ in murs_candidats[:2]]  # Moins d'options pour l'IA facile
+    else:
+        return [mur for mur, _ in murs_candidats[:5]]
+
+def meilleur_mur_pour_joueur(etat, joueur_num, profondeur, difficulte, contexte=None, coup_prioritaire=None):
+    """
+    Détermine le meilleur mur à placer pour un joueur.
+    coup_prioritaire (meilleur mur de l'itération précédente) est examiné en premier.
+    La recherche pose and retire les murs sur une copie de l'état.
+    """
+    etat = etat.copie()
+    adversaire_num = 3 - joueur_num
+    pos_adversaire = etat.position(adversaire_num)
+    ligne_obj_adv = 8 if adversaire_num == 1 else 0
+
+    # Trouver des murs candidats avec la difficulté appropriée
+    stats = statistiques_recherche
+    if stats is not None:
+        debut = time.perf_counter()
+    murs_candidats = murs_proches_des_chemins_critique(etat, pos_adversaire, ligne_obj_adv, difficulte,
+                                                       _alea(contexte))
+    if stats is not None:
+        stats.ajouter_duree('murs_proches_des_chemins_critique', time.perf_counter() - debut)
+    
+    if not murs_candidats:
+        return None, None
+    
+    meilleur_score = float('-inf')
+    meilleur_mur = None
+    
+    max_candidats = 7 if difficulte == DIFFICULTY_MEDIUM else 5
+    murs_candidats = murs_candidats[:max_candidats]
+    if coup_prioritaire in murs_candidats:
+        murs_candidats.remove(coup_prioritaire)
+        murs_candidats.insert(0, coup_prioritaire)
+
+    # Mesures de la position courante pour l'IA intermédiaire (avant toute pose)
+    if difficulte == DIFFICULTY_MEDIUM:
+        chemins_avant = count_chemins_alternatifs(pos_adversaire, ligne_obj_adv, etat, max_depth=4)
+        dist_avant = distance_objectif(etat, adversaire_num)
+    
+    # Murs posables sans isoler un joueur, en un seul calcul pour tous les candidats
+    legaux = murs_legaux(etat)
+    parallele = _recherche_parallele(difficulte, profondeur)
+    candidats = []
+    for mur in murs_candidats:
+        if not mur_est_valide(mur, etat):
+            continue
+        if not (legaux >> emplacement_mur(mur)) & 1:
+            if stats is not None:
+                stats.murs_rejetes += 1
+            continue
+
+        etat.jouer_mur(joueur_num, mur)
+
+        # Pour l'IA intermédiaire, favoriser les murs qui créent des déviations complexes
+        bonus = 0
+        if difficulte == DIFFICULTY_MEDIUM:
+            # Vérifier l'impact sur les chemins alternatifs de l'adversaire
+            chemins_apres = count_chemins_alternatifs(pos_adversaire, ligne_obj_adv, etat, max_depth=4)
+
+            # Bonus pour réduire les options
+            bonus += (chemins_avant - chemins_apres) * 2.0
+
+            # Également vérifier l'impact sur la distance
+            dist_apres = distance_objectif(etat, adversaire_num)
+
+            # Bonus pour l'augmentation de la distance
+            if dist_apres > dist_avant:
+                bonus += (dist_apres - dist_avant) * 3.0
+
+        # Recherche parallèle : les murs sont évalués après la boucle, dans les processus de calcul
+        if parallele:
+            etat.annuler()
+            candidats.append((code_mur(mur), bonus))
+            continue
+
+        # Évaluation avec la fonction appropriée à la difficulté
+        score = minimax(etat,
+                        profondeur=profondeur - 1,
+                        alpha=float('-inf'), beta=float('inf'),
+                        est_maximisant=False,
+                        joueur_principal=joueur_num,
+                        difficulte=difficulte,
+                        contexte=contexte) + bonus
+
+        if score > meilleur_score:
+            meilleur_score = score
+            meilleur_mur = mur
+
+        etat.annuler()
+
+    if parallele:
+        code, _ = _meilleur_coup_parallele(etat, joueur_num, candidats, profondeur, difficulte, contexte)
+        if code is not None:
+            meilleur_mur = mur_depuis_code(code)
+                
+    return meilleur_mur, "mur" if meilleur_mur else None
+
+def meilleur_coup_avec_murs_pour_joueur(etat, joueur_num, profondeur, difficulte, contexte=None,
+                                        coup_prioritaire=None):
+    """
+    Recherche où déplacements and poses de murs sont des coups de l'arbre minimax, à tous les niveaux.
+    Renvoie (code du coup, "deplacement" or "mur") ; coup_prioritaire est examiné en premier.
+    """
+    etat = etat.copie()
+    stats = statistiques_recherche
+    coups_possibles = deplacements_possibles(etat, joueur_num)
+    if etat.murs_restants(joueur_num) > 0:
+        murs_candidats = murs_candidats_recherche(etat, joueur_num)
+        coups_possibles += murs_candidats
+        if stats is not None:
+            stats.murs_generes += len(murs_candidats)
+    if coup_prioritaire in coups_possibles:
+        coups_possibles.remove(coup_prioritaire)
+        coups_possibles.insert(0, coup_prioritaire)
+
+    meilleur_score = float('-inf')
+    meilleur_coup = None
+    parallele = _recherche_parallele(difficulte, profondeur)
+    candidats = []
+    for coup in coups_possibles:
+        etat.jouer_coup(joueur_num, coup)
+        if coup >= ENTREE_MUR_H and not chemins_ouverts(etat):
+            etat.annuler()
+            if stats is not None:
+                stats.murs_rejetes += 1
+            continue
+        if parallele:
+            etat.annuler()
+            candidats.append((coup, 0))
+            continue
+        # La fenêtre se resserre sur le meilleur score déjà trouvé
+        score = minimax(etat, profondeur - 1, meilleur_score, float('inf'), False,
+                        joueur_principal=joueur_num, difficulte=difficulte,
+                        contexte=contexte, avec_murs=True)
+        etat.annuler()
+        if score > meilleur_score or meilleur_coup is None:
+            meilleur_score = score
+            meilleur_coup = coup
+
+    if parallele:
+        meilleur_coup, _ = _meilleur_coup_parallele(etat, joueur_num, candidats, profondeur, difficulte,
+                                                    contexte, avec_murs=True)
+    if meilleur_coup is None:
+        return None, None
+    return meilleur_coup, "deplacement" if meilleur_coup < ENTREE_MUR_H else "mur"
+
+def _rechercher(recherche, etat, joueur_num, profondeur, difficulte, contexte):
+    """
+    Lance une recherche racine (meilleur_deplacement_pour_joueur or meilleur_mur_pour_joueur).
+    Sans contexte or avec un contexte sans limite (ContexteRecherche.limitee), recherche directe
+    à la profondeur donnée. Sinon, approfondissement itératif de 1 à profondeur : chaque itération examine d'abord le meilleur coup de la
+    précédente, and le résultat de la dernière itération complète est renvoyé quand le budget
+    est épuisé. La première itération est toujours menée à son terme.
+    Avec les statistiques actives, la durée est comptée dans la phase du nom de la recherche.
+    """
+    stats = statistiques_recherche
+    if stats is not None:
+        debut_phase = time.perf_counter()
+
+    if contexte is None or not contexte.limitee():
+        meilleur = recherche(etat, joueur_num, profondeur, difficulte, contexte=contexte)
+    else:
+        meilleur = (None, None)
+        for profondeur_courante in range(1, profondeur + 1):
+            contexte.limites_actives = profondeur_courante > 1
+            debut = time.perf_counter()
+            try:
+                resultat = recherche(etat, joueur_num, profondeur_courante, difficulte,
+                                     contexte=contexte, coup_prioritaire=meilleur[0])
+            except RechercheInterrompue:
+                break
+            meilleur = resultat
+            contexte.profondeur_atteinte = profondeur_courante
+            if meilleur[0] is None:
+                break
+            # L'itération suivante coûte au moins autant que celle-ci : inutile de la commencer
+            if contexte.temps_restant() < time.perf_counter() - debut:
+                break
+        contexte.limites_actives = False
+
+    if stats is not None:
+        stats.ajouter_duree(recherche.__name__, time.perf_counter() - debut_phase)
+    return meilleur
+
+# Issues d'une course, pour le joueur qui a la main
+COURSE_GAGNEE = 1
+COURSE_NULLE = 0
+COURSE_PERDUE = -1
+
+# Courses déjà résolues, indexées par (murs_h, murs_v)
+_cache_courses = {}
+TAILLE_MAX_CACHE_COURSES = 16
+
+def _index_course(case_j1, case_j2, tour):
+    return (case_j1 * GRID_SIZE * GRID_SIZE + case_j2) * 2 + tour - 1
+
+def _resoudre_courses(etat):
+    """
+    Résout toutes les courses (plus aucun mur à poser) pour les murs de etat : analyse
+    rétrograde sur les positions (case J1, case J2, joueur qui a la main). Depuis les
+    positions gagnées, une position est gagnée si un coup mène à une position perdue pour
+    l'adversaire, perdue si tous ses coups mènent à des positions gagnées pour lui ; le
+    parcours en largeur donne le nombre de demi-coups jusqu'à l'arrivée (au plus vite pour
+    le gagnant, au plus tard pour le perdant). Les autres positions sont nulles : aucun
+    joueur ne peut forcer l'arrivée, or le joueur qui a la main est bloqué (match nul, comme
+    dans simulate_ai_vs_ai). Renvoie (issues, distances, successeurs) indexés par _index_course.
+    """
+    cases = GRID_SIZE * GRID_SIZE
+    aretes = etat.aretes()
+    taille = cases * cases * 2
+    issues = [COURSE_NULLE] * taille
+    distances = [0] * taille
+    successeurs = [()] * taille
+    predecesseurs = [[] for _ in range(taille)]
+    restants = [0] * taille
+    file = deque()
+
+    for case_j1 in range(cases):
+        for case_j2 in range(cases):
+            if case_j1 == case_j2:
+                continue
+            for tour in (1, 2):
+                index = _index_course(case_j1, case_j2, tour)
+                # Partie terminée : l'arrivée vient du dernier coup, joué par l'adversaire
+                if case_j1 // GRID_SIZE == 8 or case_j2 // GRID_SIZE == 0:
+                    gagnant = 1 if case_j1 // GRID_SIZE == 8 else 2
+                    issues[index] = COURSE_GAGNEE if gagnant == tour else COURSE_PERDUE
+                    file.append(index)
+                    continue
+                case, case_adversaire = (case_j1, case_j2) if tour == 1 else (case_j2, case_j1)
+                suivants = []
+                for bloque, pas in zip(aretes, PAS_CASES):
+                    if (bloque >> case) & 1:
+                        continue
+                    arrivee = case + pas
+                    if arrivee == case_adversaire:
+                        if (bloque >> arrivee) & 1:
+                            continue
+                        arrivee += pas
+                    if tour == 1:
+                        suivant = _index_course(arrivee, case_j2, 2)
+                    else:
+                        suivant = _index_course(case_j1, arrivee, 1)
+                    suivants.append((arrivee, suivant))
+                    predecesseurs[suivant].append(index)
+                successeurs[index] = suivants
+                restants[index] = len(suivants)
+                issues[index] = None
+
+    while file:
+        index = file.popleft()
+        for precedent in predecesseurs[index]:
+            if issues[precedent] is not None:
+                continue
+            if issues[index] == COURSE_PERDUE:
+                issues[precedent] = COURSE_GAGNEE
+                distances[precedent] = distances[index] + 1
+                file.append(precedent)
+            else:
+                restants[precedent] -= 1
+                if restants[precedent] == 0:
+                    issues[precedent] = COURSE_PERDUE
+                    distances[precedent] = distances[index] + 1
+                    file.append(precedent)
+
+    for index in range(taille):
+        if issues[index] is None:
+            issues[index] = COURSE_NULLE
+    return issues, distances, successeurs
+
+def resoudre_course(etat):
+    """
+    Issue exacte d'une course, quand aucun des deux joueurs n'a plus de mur à poser :
+    (issue, demi-coups, case) pour le joueur qui a la main, où issue vaut COURSE_GAGNEE,
+    COURSE_PERDUE or COURSE_NULLE, demi-coups est le nombre de demi-coups jusqu'à l'arrivée
+    (0 pour une nulle) and case est le meilleur déplacement (None s'il n'y en a pas).
+    Renvoie None si un joueur peut encore poser un mur. Toutes les courses d'une même
+    configuration de murs sont résolues au premier appel, puis lues dans le cache.
+    """
+    if etat.murs_restants_j1 or etat.murs_restants_j2:
+        return None
+    cle = (etat.murs_h, etat.murs_v)
+    courses = _cache_courses.get(cle)
+    if courses is None:
+        if len(_cache_courses) >= TAILLE_MAX_CACHE_COURSES:
+            _cache_courses.clear()
+        courses = _cache_courses[cle] = _resoudre_courses(etat)
+    issues, distances, successeurs = courses
+
+    index = _index_course(etat.pos_j1, etat.pos_j2, etat.tour)
+    issue = issues[index]
+    meilleure_case = None
+    meilleure_distance = None
+    for case, suivant in successeurs[index]:
+        # Issue du coup pour le joueur qui le joue : l'inverse de celle de l'adversaire
+        if -issues[suivant] != issue:
+            continue
+        distance = distances[suivant]
+        if (meilleure_case is None or (issue == COURSE_GAGNEE and distance < meilleure_distance)
+                or (issue == COURSE_PERDUE and distance > meilleure_distance)):
+            meilleure_case = case
+            meilleure_distance = distance
+    return issue, distances[index], meilleure_case
+
+# Recherche arborescente Monte-Carlo (niveau DIFFICULTY_MCTS) : nombre de parties
+# simulées par coup, constante d'exploration UCT, élargissement progressif des murs
+# (largeur = déplacements + ELARGISSEMENT_MCTS * visites ** EXPOSANT_ELARGISSEMENT_MCTS),
+# longueur maximale des simulations and probabilité d'y jouer un déplacement au hasard
+PLAYOUTS_MCTS = 1500
+EXPLORATION_MCTS = 0.7
+ELARGISSEMENT_MCTS = 1.0
+EXPOSANT_ELARGISSEMENT_MCTS = 0.5
+DEMI_COUPS_SIMULATION_MCTS = 80
+ALEA_SIMULATION_MCTS = 0.1
+
+def configurer_mcts(playouts):
+    """Nombre de parties simulées par coup du niveau MCTS (borné aussi par les budgets de meilleur_coup_ia)"""
+    global PLAYOUTS_MCTS
+    PLAYOUTS_MCTS = max(1, int(playouts))
+
+class NoeudMCTS:
+    """
+    Nœud de l'arbre MCTS : coup qui y mène (joué par joueur), visites and parties gagnées
+    par ce joueur. Les déplacements non essayés sont développés d'abord ; les murs
+    (murs_mcts, du plus au moins prometteur) ne le sont qu'au fil des visites.
+    """
+    __slots__ = ('coup', 'joueur', 'enfants', 'deplacements', 'largeur', 'murs', 'visites', 'gains')
+
+    def __init__(self, coup=None, joueur=None):
+        self.coup = coup
+        self.joueur = joueur
+        self.enfants = []
+        self.deplacements = None
+        self.largeur = 0
+        self.murs = None
+        self.visites = 0
+        self.gains = 0
+
+    def selectionner(self):
+        """Enfant de plus grande borne UCT"""
+        log_visites = math.log(self.visites)
+        return max(self.enfants, key=lambda enfant: enfant.gains / enfant.visites +
+                   EXPLORATION_MCTS * math.sqrt(log_visites / enfant.visites))
+
+def murs_mcts(etat, joueur):
+    """
+    Murs (codes) à développer dans l'arbre MCTS pour le joueur qui a la main : les murs
+    candidats qui allongent le chemin adverse plus que le sien, du plus au moins rentable.
+    """
+    adversaire = 3 - joueur
+    ligne_joueur = 8 if joueur == 1 else 0
+    ligne_adversaire = 8 - ligne_joueur
+    case_joueur = etat.case(joueur)
+    case_adversaire = etat.case(adversaire)
+    dist_joueur = carte_distances(etat, ligne_joueur)[case_joueur]
+    dist_adversaire = carte_distances(etat, ligne_adversaire)[case_adversaire]
+    murs = []
+    for coup in murs_candidats_recherche(etat, joueur):
+        etat.jouer_coup(joueur, coup)
+        if chemins_ouverts(etat):
+            gain = ((carte_distances(etat, ligne_adversaire)[case_adversaire] - dist_adversaire)
+                    - (carte_distances(etat, ligne_joueur)[case_joueur] - dist_joueur))
+            if gain > 0:
+                murs.append((gain, coup))
+        etat.annuler()
+    murs.sort(key=lambda mur: -mur[0])
+    return [coup for _, coup in murs]
+
+def _gagnant(etat):
+    """Joueur arrivé sur sa ligne objectif, or None"""
+    if etat.pos_j1 // GRID_SIZE == 8:
+        return 1
+    if etat.pos_j2 // GRID_SIZE == 0:
+        return 2
+    return None
+
+def _simuler_partie(etat, alea=random):
+    """
+    Termine la partie depuis etat avec la politique rapide des simulations and renvoie le
+    gagnant ; etat est rendu inchangé. Chaque joueur avance vers la case voisine la plus
+    proche de son objectif sur la carte des distances (au hasard avec la probabilité
+    ALEA_SIMULATION_MCTS), sans poser de mur : les murs posés restent ceux de l'arbre, and
+    la carte en cache sert à toute la simulation. Au-delà de DEMI_COUPS_SIMULATION_MCTS
+    demi-coups, la course est jugée sur les distances. Le hasard vient de alea.
+    """
+    cartes = {1: carte_distances(etat, 8), 2: carte_distances(etat, 0)}
+    joues = 0
+    gagnant = None
+    while joues < DEMI_COUPS_SIMULATION_MCTS:
+        gagnant = _gagnant(etat)
+        if gagnant is not None:
+            break
+        joueur = etat.tour
+        coups = deplacements_possibles(etat, joueur)
+        if not coups:
+            etat.jouer_passe()
+            joues += 1
+            continue
+        if alea.random() < ALEA_SIMULATION_MCTS:
+            coup = alea.choice(coups)
+        else:
+            coup = min(coups, key=cartes[joueur].__getitem__)
+        etat.jouer_deplacement(joueur, coup)
+        joues += 1
+    if gagnant is None:
+        # Le joueur qui a la main gagne la course à distance égale
+        joueur = etat.tour
+        dist_joueur = distance_objectif(etat, joueur)
+        gagnant = joueur if dist_joueur <= distance_objectif(etat, 3 - joueur) else 3 - joueur
+    for _ in range(joues):
+        etat.annuler()
+    return gagnant
+
+def meilleur_coup_mcts(etat, joueur_num=None, contexte=None):
+    """
+    Meilleur coup (code) du joueur par recherche arborescente Monte-Carlo : sélection UCT,
+    développement des déplacements puis des murs par élargissement progressif, simulation
+    de la fin de partie par _simuler_partie and rétropropagation du gagnant. Chaque
+    simulation compte pour un nœud du contexte : la recherche s'arrête à PLAYOUTS_MCTS
+    simulations or à la première limite du contexte atteinte, and renvoie le coup le plus
+    visité de la racine (or le déplacement le plus court si aucune simulation n'a eu lieu) ;
+    ENTREE_PASSE si le joueur ne peut que passer son tour.
+    """
+    if joueur_num is None:
+        joueur_num = etat.tour
+    etat = etat.copie()
+    if etat.tour != joueur_num:
+        etat.jouer_passe()
+    if contexte is None:
+        contexte = ContexteRecherche()
+    racine = NoeudMCTS()
+    stats = statistiques_recherche
+    debut = time.perf_counter()
+    playouts = 0
+    try:
+        while playouts < PLAYOUTS_MCTS:
+            contexte.verifier()
+            chemin = [racine]
+            noeud = racine
+            joues = 0
+            gagnant = _gagnant(etat)
+            while gagnant is None:
+                joueur = etat.tour
+                if noeud.deplacements is None:
+                    # Un pion enfermé (sans déplacement possible) passe son tour
+                    noeud.deplacements = deplacements_possibles(etat, joueur) or [ENTREE_PASSE]
+                    contexte.alea.shuffle(noeud.deplacements)
+                    noeud.largeur = len(noeud.deplacements)
+                coup = None
+                if noeud.deplacements:
+                    coup = noeud.deplacements.pop()
+                elif (etat.murs_restants(joueur) and len(noeud.enfants) < noeud.largeur +
+                      ELARGISSEMENT_MCTS * noeud.visites ** EXPOSANT_ELARGISSEMENT_MCTS):
+                    if noeud.murs is None:
+                        noeud.murs = murs_mcts(etat, joueur)
+                    if noeud.murs:
+                        coup = noeud.murs.pop(0)
+                if coup is not None:
+                    # Développement d'un nouvel enfant puis simulation depuis sa position
+                    enfant = NoeudMCTS(coup, joueur)
+                    noeud.enfants.append(enfant)
+                    chemin.append(enfant)
+                    etat.jouer_coup(joueur, coup)
+                    joues += 1
+                    if stats is not None:
+                        stats.noeuds += 1
+                    gagnant = _gagnant(etat) or _simuler_partie(etat, contexte.alea)
+                    break
+                noeud = noeud.selectionner()
+                chemin.append(noeud)
+                etat.jouer_coup(joueur, noeud.coup)
+                joues += 1
+                gagnant = _gagnant(etat)
+            for noeud in chemin:
+                noeud.visites += 1
+                if noeud.joueur == gagnant:
+                    noeud.gains += 1
+            for _ in range(joues):
+                etat.annuler()
+            playouts += 1
+    except RechercheInterrompue:
+        pass
+    finally:
+        if stats is not None:
+            stats.playouts += playouts
+            stats.ajouter_duree('mcts', time.perf_counter() - debut)
+
+    if not racine.enfants:
+        coups = deplacements_possibles(etat, joueur_num)
+        if not coups:
+            return None
+        return min(coups, key=carte_distances(etat, 8 if joueur_num == 1 else 0).__getitem__)
+    return max(racine.enfants, key=lambda enfant: enfant.visites).coup
+
+def meilleur_coup_ia(etat, difficulte, joueur_num=None, budget_temps=None, budget_noeuds=None,
+                     profondeur_max=None, murs_dans_recherche=False, statistiques=None, annulation=None,
+                     generateur=None):
+    """
+    Fonction unifiée pour déterminer le meilleur coup de l'IA.
+    Par défaut, joue pour le joueur qui a la main dans l'état.
+    
+    Args:
+        etat: GameState de la position courante
+        difficulte: Niveau de difficulté (DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD
+            or DIFFICULTY_MCTS)
+        joueur_num: Le joueur pour lequel on cherche le meilleur coup (1 or 2)
+        budget_temps: Temps maximal de réflexion en secondes (approfondissement itératif)
+        budget_noeuds: Nombre maximal de nœuds minimax (approfondissement itératif), or de
+            parties simulées au niveau MCTS (au plus PLAYOUTS_MCTS)
+        profondeur_max: Profondeur maximale, par défaut celle du niveau de difficulté
+        murs_dans_recherche: Si vrai (niveaux intermédiaire and difficile), les murs sont des coups
+            de l'arbre de recherche au lieu d'être choisis par tirage avant la recherche
+        statistiques: StatistiquesRecherche optionnel, complété par les compteurs de ce coup
+        annulation: threading.Event optionnel ; une fois positionné, la recherche s'arrête
+            and lève RechercheAnnulee
+        generateur: random.Random optionnel, seule source du hasard de l'IA pendant ce coup
+            (porté par le ContexteRecherche de la recherche) ; par défaut le module random
+        
+    Returns:
+        tuple: (coup, type_coup) où coup est la position (ligne, colonne) or le mur,
+               and type_coup est "deplacement" or "mur"
+
+    Aux niveaux intermédiaire and difficile, sans profondeur_max imposée and avec la mesure
+    des chemins alternatifs par défaut (CHEMINS_ALTERNATIFS_HISTORIQUE faux), le coup est lu
+    dans le livre d'ouvertures (livre_ouvertures) quand la position s'y trouve ; à ces
+    niveaux and au niveau MCTS, quand plus aucun mur ne peut être posé, c'est le coup
+    exact de la course (resoudre_course).
+    """
+    if (difficulte != DIFFICULTY_EASY and profondeur_max is None
+            and (joueur_num is None or joueur_num == etat.tour)):
+        course = resoudre_course(etat)
+        if course is not None and course[2] is not None:
+            return divmod(course[2], GRID_SIZE), "deplacement"
+
+    # Le livre est construit avec la mesure des chemins alternatifs par défaut : l'autre
+    # mesure cherche tous ses coups
+    livre = (livre_ouvertures() if difficulte in (DIFFICULTY_MEDIUM, DIFFICULTY_HARD) and profondeur_max is None
+             and not CHEMINS_ALTERNATIFS_HISTORIQUE else None)
+    if livre is not None:
+        entree = livre.chercher(_cle_recherche(etat, joueur_num or etat.tour, difficulte))
+        if statistiques is not None:
+            statistiques.sondages_livre += 1
+            if entree is not None:
+                statistiques.succes_livre += 1
+        if entree is not None:
+            coup = entree[0]
+            if coup >= ENTREE_MUR_H:
+                return mur_depuis_code(coup), "mur"
+            return divmod(coup, GRID_SIZE), "deplacement"
+
+    global statistiques_recherche
+    if statistiques is None:
+        return _choisir_coup(etat, difficulte, joueur_num, budget_temps, budget_noeuds,
+                             profondeur_max, murs_dans_recherche, annulation, generateur)
+
+    precedentes = statistiques_recherche
+    statistiques_recherche = statistiques
+    table = table_transposition
+    hits, misses, coupures = table.hits, table.misses, table.coupures
+    debut = time.perf_counter()
+    try:
+        return _choisir_coup(etat, difficulte, joueur_num, budget_temps, budget_noeuds,
+                             profondeur_max, murs_dans_recherche, annulation, generateur)
+    finally:
+        statistiques_recherche = precedentes
+        statistiques.coups += 1
+        statistiques.ajouter_duree('total', time.perf_counter() - debut)
+        statistiques.succes_table += table.hits - hits
+        statistiques.sondages_table += table.hits - hits + table.misses - misses
+        statistiques.coupures_table += table.coupures - coupures
+
+def _choisir_coup(etat, difficulte, joueur_num, budget_temps, budget_noeuds, profondeur_max,
+                  murs_dans_recherche, annulation, generateur):
+    """Corps de meilleur_coup_ia"""
+    if joueur_num is None:
+        joueur_num = etat.tour
+    adversaire_num = 3 - joueur_num
+    # Le contexte porte le générateur du hasard jusqu'aux feuilles de la recherche
+    contexte = ContexteRecherche(budget_temps, budget_noeuds, annulation, generateur)
+    alea = contexte.alea
+    if difficulte == DIFFICULTY_MCTS:
+        coup = meilleur_coup_mcts(etat, joueur_num, contexte)
+        if coup is None or coup == ENTREE_PASSE:
+            return None, None
+        if coup >= ENTREE_MUR_H:
+            return mur_depuis_code(coup), "mur"
+        return divmod(coup, GRID_SIZE), "deplacement"
+    table_transposition.nouvelle_recherche()
+
+    # Configuration selon la difficulté
+    profondeur_recherche = {
+        DIFFICULTY_EASY: 1,   # Facile - profondeur minimale
+        DIFFICULTY_MEDIUM: 3,   # Moyen
+        DIFFICULTY_HARD: 4    # Difficile
+    }.get(difficulte, 3)
+    if profondeur_max is not None:
+        profondeur_recherche = profondeur_max
+
+    # Budget de réflexion : approfondissement itératif jusqu'à profondeur_recherche (_rechercher)
+    if murs_dans_recherche and difficulte != DIFFICULTY_EASY:
+        coup, type_coup = _rechercher(meilleur_coup_avec_murs_pour_joueur, etat, joueur_num,
+                                      profondeur_recherche, difficulte, contexte)
+        if coup is None:
+            return None, None
+        if type_coup == "mur":
+            return mur_depuis_code(coup), type_coup
+        return divmod(coup, GRID_SIZE), type_coup
+
+    murs_restants_joueur = etat.murs_restants(joueur_num)
+
+    # Distances vers l'objectif
+    dist_joueur = distance_objectif(etat, joueur_num)
+    dist_adv = distance_objectif(etat, adversaire_num)
+    
+    # Ajuster la stratégie selon la difficulté
+    if difficulte == DIFFICULTY_EASY:  # Facile - utilisation simplifiée du minimax
+        # Pour l'IA facile, forte préférence pour des mouvements simples and prévisibles
+        priorite_deplacement = 0.90  # Augmenté de 0.85 à 0.90, très forte préférence pour le déplacement
+        # Ajouter un petit aléa pour éviter des comportements répétitifs
+        if alea.random() < 0.2:  # 20% de chance de changer de stratégie
+            priorite_deplacement = 0.75
+        
+        # L'IA facile n'est pas consciente de son avantage or désavantage
+        if alea.random() < 0.6:  # 60% du temps, elle ignore la situation de jeu
+            # Se désintéresse parfois du placement stratégique des murs
+            if dist_adv <= 2 and alea.random() < 0.5:  # même quand l'adversaire est proche de gagner
+                priorite_deplacement = 0.85
+    elif difficulte == DIFFICULTY_MEDIUM:  # Moyen - plus agressif avec les murs
+        # Plus de murs quand en désavantage or quand l'adversaire est proche de gagner
+        if dist_joueur > dist_adv or dist_adv <= 3:
+            priorite_deplacement = 0.4  # 60% de chances de placer un mur
+        else:
+            priorite_deplacement = 0.65  # 35% de chances de placer un mur
+    else:  # Difficile - stratégie plus équilibrée
+        priorite_deplacement = 0.75 if dist_joueur <= dist_adv else 0.6
+        if dist_adv <= 2:  # Si l'adversaire est près de gagner, priorité aux murs
+            priorite_deplacement = 0.3
+    
+    # Décision: déplacement or pose de mur
+    if alea.random() >= priorite_deplacement and murs_restants_joueur > 0:
+        # MUR
+        mur_candidat, type_coup = _rechercher(meilleur_mur_pour_joueur, etat, joueur_num,
+                                              profondeur_recherche, difficulte, contexte)
+        if mur_candidat:
+            return mur_candidat, type_coup
+
+    # DÉPLACEMENT (or fallback si pas de bon mur)
+    case, type_coup = _rechercher(meilleur_deplacement_pour_joueur, etat, joueur_num,
+                                  profondeur_recherche, difficulte, contexte)
+    if case is None:
+        return None, None
+    return divmod(case, GRID_SIZE), type_coup
+
+class RechercheEnCours:
+    """
+    Coup de meilleur_coup_ia cherché dans un thread, pour qu'une interface continue
+    d'afficher and de traiter ses évènements pendant la réflexion de l'IA.
+
+    termine() indique si le coup est prêt, resultat() l'attend and le renvoie (or lève
+    l'exception de la recherche), annuler() arrête la recherche and attend la fin du
+    thread ; resultat() lève alors RechercheAnnulee. La recherche porte sur une copie
+    de l'état ; une seule recherche à la fois (table de transposition partagée).
+    """
+    def __init__(self, etat, difficulte, joueur_num=None, **options):
+        self.annulation = threading.Event()
+        self.future = Future()
+        self.thread = threading.Thread(target=self._chercher, daemon=True,
+                                       args=(etat.copie(), difficulte, joueur_num, options))
+        self.thread.start()
+
+    def _chercher(self, etat, difficulte, joueur_num, options):
+        try:
+            coup = meilleur_coup_ia(etat, difficulte, joueur_num, annulation=self.annulation, **options)
+        except BaseException as erreur:
+            self.future.set_exception(erreur)
+        else:
+            self.future.set_result(coup)
+
+    def termine(self):
+        return self.future.done()
+
+    def resultat(self, timeout=None):
+        return self.future.result(timeout)
+
+    def annuler(self):
+        self.annulation.set()
+        self.thread.join()
+
+# Nombre de coups adverses pour lesquels Reflexion prépare une réponse
+PREDICTIONS_REFLEXION = 3
+
+class Reflexion:
+    """
+    Réflexion de l'IA pendant le tour de son adversaire (« pondering »), dans un thread.
+
+    Depuis etat, où l'adversaire a la main, l'IA prédit ses coups les plus probables : le
+    coup que sa propre recherche choisirait à sa place, puis ses déplacements qui le
+    rapprochent le plus de son objectif. Pour chacun, dans cet ordre, elle cherche sa
+    réponse (meilleur_coup_ia avec les options données) and la garde, indexée par la clé de
+    Zobrist de la position après le coup adverse. reponse() arrête la réflexion and renvoie
+    la réponse prête pour la position jouée, or None.
+    """
+    def __init__(self, etat, difficulte, joueur_num, predictions=PREDICTIONS_REFLEXION, **options):
+        self.reponses = {}  # clé de Zobrist -> (coup, type_coup, durée de la recherche)
+        self.annulation = threading.Event()
+        self.thread = threading.Thread(target=self._reflechir, daemon=True,
+                                       args=(etat.copie(), difficulte, joueur_num, predictions, options))
+        self.thread.start()
+
+    def _reflechir(self, etat, difficulte, joueur_num, predictions, options):
+        adversaire_num = 3 - joueur_num
+        try:
+            for coup in self._coups_probables(etat, difficulte, adversaire_num, predictions, options):
+                etat.jouer_coup(adversaire_num, coup)
+                debut = time.perf_counter()
+                reponse = meilleur_coup_ia(etat, difficulte, joueur_num, annulation=self.annulation,
+                                           **options)
+                self.reponses[etat.cle] = reponse + (time.perf_counter() - debut,)
+                etat.annuler()
+        except RechercheAnnulee:
+            pass
+
+    def _coups_probables(self, etat, difficulte, adversaire_num, predictions, options):
+        """Codes des coups adverses les plus probables, du plus au moins probable"""
+        coups = []
+        coup, type_coup = meilleur_coup_ia(etat, difficulte, adversaire_num,
+                                           annulation=self.annulation, **options)
+        if type_coup == "mur":
+            coups.append(code_mur(coup))
+        elif coup is not None:
+            coups.append(coup[0] * GRID_SIZE + coup[1])
+        distances = carte_distances(etat, 8 if adversaire_num == 1 else 0)
+        for case in sorted(deplacements_possibles(etat, adversaire_num), key=distances.__getitem__):
+            if case not in coups:
+                coups.append(case)
+        return coups[:predictions]
+
+    def annuler(self):
+        self.annulation.set()
+        self.thread.join()
+
+    def reponse(self, etat, statistiques=None):
+        """
+        Arrête la réflexion and renvoie (coup, type_coup) préparé pour etat (position après
+        le coup adverse), or None. Avec statistiques, compte la demande, and si la réponse
+        était prête, le temps de recherche économisé.
+        """
+        self.annuler()
+        trouvee = self.reponses.get(etat.cle)
+        if statistiques is not None:
+            statistiques.sondages_reflexion += 1
+            if trouvee is not None:
+                statistiques.succes_reflexion += 1
+                statistiques.temps_economise += trouvee[2]
+        return trouvee[:2] if trouvee is not None else None
+
+# Livre d'ouvertures : en-tête (signature, version, nombre d'entrées) puis entrées de taille
+# fixe triées par clé : clé de recherche (_cle_recherche), code du coup, profondeur de la
+# recherche and score du coup pour le joueur qui a la main
+ENTETE_LIVRE = struct.Struct('<4sII')
+ENTREE_LIVRE = struct.Struct('<QHBxf')
+SIGNATURE_LIVRE = b'QLIV'
+VERSION_LIVRE = 1
+
+# Livre lu par meilleur_coup_ia (None : pas de livre, voir configurer_livre_ouvertures)
+chemin_livre_ouvertures = os.path.join(os.path.dirname(os.path.abspath(__file__)), "livre_ouvertures.bin")
+_livres_ouverts = {}
+
+class LivreOuvertures:
+    """
+    Livre d'ouvertures en lecture seule, projeté en mémoire (mmap) : seules les pages
+    parcourues par la recherche dichotomique d'une clé sont lues sur le disque.
+    """
+    def __init__(self, chemin):
+        with open(chemin, 'rb') as fichier:
+            self.donnees = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, version, self.nombre = ENTETE_LIVRE.unpack_from(self.donnees, 0)
+        if signature != SIGNATURE_LIVRE or version != VERSION_LIVRE:
+            raise ValueError(f"{chemin} n'est pas un livre d'ouvertures (version {VERSION_LIVRE})")
+        if len(self.donnees) != ENTETE_LIVRE.size + self.nombre * ENTREE_LIVRE.size:
+            raise ValueError(f"{chemin} : livre d'ouvertures tronqué")
+
+    def __len__(self):
+        return self.nombre
+
+    def chercher(self, cle):
+        """(code du coup, score, profondeur) pour la clé de recherche donnée, or None"""
+        bas, haut = 0, self.nombre
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            cle_milieu, coup, profondeur, score = ENTREE_LIVRE.unpack_from(
+                self.donnees, ENTETE_LIVRE.size + milieu * ENTREE_LIVRE.size)
+            if cle_milieu == cle:
+                return coup, score, profondeur
+            if cle_milieu < cle:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        return None
+
+def ecrire_livre_ouvertures(chemin, entrees):
+    """Écrit un livre d'ouvertures ; entrees : dictionnaire clé -> (code du coup, score, profondeur)"""
+    with open(chemin, 'wb') as fichier:
+        fichier.write(ENTETE_LIVRE.pack(SIGNATURE_LIVRE, VERSION_LIVRE, len(entrees)))
+        for cle in sorted(entrees):
+            coup, score, profondeur = entrees[cle]
+            fichier.write(ENTREE_LIVRE.pack(cle, coup, profondeur, score))
+
+def configurer_livre_ouvertures(chemin):
+    """Choisit le fichier du livre d'ouvertures lu par meilleur_coup_ia (None : pas de livre)"""
+    global chemin_livre_ouvertures
+    chemin_livre_ouvertures = chemin
+
+def livre_ouvertures():
+    """Livre d'ouvertures configuré, ouvert au premier appel ; None s'il n'y en a pas"""
+    chemin = chemin_livre_ouvertures
+    if chemin is None:
+        return None
+    if chemin not in _livres_ouverts:
+        _livres_ouverts[chemin] = LivreOuvertures(chemin) if os.path.exists(chemin) else None
+    return _livres_ouverts[chemin]
+
+def conflit(mur1, mur2):
+    """Indique si deux murs ne peuvent pas être posés ensemble (chevauchement or croisement)"""
+    return (CONFLITS_MURS[emplacement_mur(mur1)] >> emplacement_mur(mur2)) & 1 == 1
+
+def masque_murs(murs):
+    """Emplacements occupés par une liste de murs (masque de 128 bits, voir emplacement_mur)"""
+    masque = 0
+    for mur in murs:
+        masque |= 1 << emplacement_mur(mur)
+    return masque
+
+def mur_est_valide(mur, murs_locaux):
+    """Indique si le mur peut être posé parmi murs_locaux (liste de murs or GameState)"""
+    if isinstance(murs_locaux, GameState):
+        return murs_locaux.mur_libre(mur)
+
+    if not (0 <= mur['x'] <= GRID_SIZE-2 and
+            0 <= mur['y'] <= GRID_SIZE-2):
+        return False
+
+    return not (masque_murs(murs_locaux) & CONFLITS_MURS[emplacement_mur(mur)])
+
+def mur_bloque_mouvement(current_i, current_j, target_i, target_j, walls):
+    """Indique si un mur sépare deux cases voisines (walls : GameState or liste de murs)"""
+    if abs(target_i - current_i) + abs(target_j - current_j) != 1:
+        return False
+    return _etat_murs(walls).mur_bloque(current_i, current_j, target_i, target_j)
+
+def deplacements_possibles(etat, joueur):
+    """Cases d'arrivée possibles pour le pion du joueur (pas simples and sauts en ligne droite)"""
+    case = etat.pos_j1 if joueur == 1 else etat.pos_j2
+    case_adversaire = etat.pos_j2 if joueur == 1 else etat.pos_j1
+    moves = []
+    # Les bords du plateau sont inclus dans les masques d'arêtes fermées
+    for bloque, pas in zip(etat.aretes(), PAS_CASES):
+        if (bloque >> case) & 1:
+            continue
+        voisin = case + pas
+        if voisin != case_adversaire:
+            moves.append(voisin)
+        elif not (bloque >> voisin) & 1:
+            moves.append(voisin + pas)
+    return moves
+
+def find_player_position(grille, player_num):
+    for i in range(GRID_SIZE):
+        for j in range(GRID_SIZE):
+            if grille[i][j] == player_num:
+                return (i, j)
+    return None
+
+def has_path(start_pos, target_row, walls):
+    """Indique si la ligne cible est atteignable (parcours en largeur sur les masques de cases)"""
+    if start_pos is None:
+        return False
+    if statistiques_recherche is not None:
+        statistiques_recherche.appels_has_path += 1
+    etat = _etat_murs(walls)
+    cible = MASQUES_LIGNES[target_row]
+    atteintes = 1 << (start_pos[0] * GRID_SIZE + start_pos[1])
+    frontiere = atteintes
+    while frontiere:
+        if atteintes & cible:
+            return True
+        frontiere = etendre(etat, frontiere) & ~atteintes
+        atteintes |= frontiere
+    return False
+
+# Mesure de count_chemins_alternatifs : par défaut, comptage des chemins courts par
+# programmation dynamique sur la carte des distances (compter_chemins_courts). Vrai pour
+# revenir à l'ancienne recherche (A* puis parcours depuis chaque case du chemin optimal),
+# par exemple pour comparer la force des IA avec l'une and l'autre mesure.
+CHEMINS_ALTERNATIFS_HISTORIQUE = False
+
+# Nombre de chemins au-delà duquel compter_chemins_courts s'arrête
+PLAFOND_CHEMINS = 8
+
+def compter_chemins_courts(etat, case, ligne_obj, marge=1, plafond=PLAFOND_CHEMINS):
+    """
+    Nombre (plafonné) de chemins de case vers ligne_obj de longueur au plus distance + marge
+    (marge 0 or 1), sans tenir compte des pions.
+
+    Un pas vers la ligne objectif fait baisser la distance de 1 ; un pas latéral (entre deux
+    cases à la même distance) allonge le chemin de 1 and un pas en arrière de 2. Avec une
+    marge de 1, un chemin fait donc au plus un pas latéral : les chemins sont comptés couche
+    par couche de la carte des distances, en partant de la case, avec pour chaque case le
+    nombre de façons de l'atteindre sans and avec pas latéral.
+    """
+    distances = carte_distances(etat, ligne_obj)
+    distance = distances[case]
+    if distance == float('inf'):
+        return 0
+    if distance == 0:
+        return 1
+
+    aretes = etat.aretes()
+    total = 0
+    # couche[c] : nombre de façons d'atteindre la case c sans and avec pas latéral
+    couche = {case: [1] + [0] * marge}
+    while distance > 0:
+        if marge:
+            for c, facons in list(couche.items()):
+                if not facons[0]:
+                    continue
+                for bloque, pas in zip(aretes, PAS_CASES):
+                    if (bloque >> c) & 1 or distances[c + pas] != distance:
+                        continue
+                    couche.setdefault(c + pas, [0, 0])[1] += facons[0]
+
+        # Pas vers la couche suivante
+        distance -= 1
+        suivante = {}
+        for c, facons in couche.items():
+            for bloque, pas in zip(aretes, PAS_CASES):
+                if (bloque >> c) & 1 or distances[c + pas] != distance:
+                    continue
+                arrivee = suivante.get(c + pas)
+                if arrivee is None:
+                    suivante[c + pas] = facons[:]
+                else:
+                    for lateral in range(marge + 1):
+                        arrivee[lateral] += facons[lateral]
+        couche = suivante
+        if distance == 0:
+            total = sum(sum(facons) for facons in couche.values())
+    return min(total, plafond)
+
+def count_chemins_alternatifs(pos, target_row, walls, max_depth=10):
+    """
+    Compte le nombre de chemins alternatifs proches du chemin optimal (longueur au plus
+    distance + 1) : compter_chemins_courts, or l'ancienne recherche limitée à max_depth
+    si CHEMINS_ALTERNATIFS_HISTORIQUE est vrai (max_depth n'est utilisé que par celle-ci).
+    """
+    if pos is None:
+        return 0
+    if statistiques_recherche is not None:
+        statistiques_recherche.appels_chemins_alternatifs += 1
+    etat = _etat_murs(walls)
+    if not CHEMINS_ALTERNATIFS_HISTORIQUE:
+        return compter_chemins_courts(etat, pos[0] * GRID_SIZE + pos[1], target_row)
+    return _count_chemins_alternatifs_historique(pos, target_row, etat, max_depth)
+
+def _count_chemins_alternatifs_historique(pos, target_row, etat, max_depth):
+    """
+    Compte le nombre de chemins alternatifs proches du chemin optimal
+    Utilise une profondeur limitée pour l'efficacité
+    """
+    # Trouve d'abord le chemin le plus court avec A*
+    dist, chemin_optimal = a_star_search(pos, target_row, etat)
+    if dist == float('inf'):
+        return 0
+
+    # Compte les chemins alternatifs
+    chemins_distincts = set()
+    chemins_distincts.add(tuple(chemin_optimal))
+
+    # Points d'embranchement possibles du chemin optimal
+    for i in range(len(chemin_optimal) - 1):
+        point = chemin_optimal[i]
+
+        # Recherche de chemins alternatifs depuis ce point
+        visited = set([point])
+        queue = deque([(point, [point], 0)])  # (position, chemin, profondeur)
+
+        while queue:
+            current, path, depth = queue.popleft()
+
+            if depth > max_depth:
+                continue
+
+            # Si nous avons rejoint le chemin optimal plus loin
+            if current in chemin_optimal[i+1:]:
+                nouveau_chemin = tuple(chemin_optimal[:i] + path + chemin_optimal[chemin_optimal.index(current)+1:])
+                if len(nouveau_chemin) <= dist + 2:  # Seulement les chemins courts
+                    chemins_distincts.add(nouveau_chemin)
+                continue
+
+            # Explorer les voisins
+            c_i, c_j = current
+            for voisin in cases_voisines(etat, c_i * GRID_SIZE + c_j):
+                neighbor = divmod(voisin, GRID_SIZE)
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, path + [neighbor], depth + 1))
+
+    # Retourne le nombre de chemins distincts trouvés
+    return len(chemins_distincts)
+
+def simulate_ai_vs_ai(difficulte_ia1, difficulte_ia2, statistiques=None, partie=None, generateur=None,
+                      reglages=None):
+    """
+    Simulation complète sans interface graphique.
+    statistiques (dictionnaire optionnel) reçoit, par difficulté, un StatistiquesRecherche
+    cumulant les coups des IA de ce niveau ; partie (dictionnaire optionnel) reçoit le
+    nombre de murs posés par chaque IA (murs_ia1, murs_ia2) and les coups joués
+    (deroulement : liste de (joueur, type_coup, coup)). Tout le hasard de la partie vient
+    de generateur (random.Random, par défaut le module random).
+    reglages (dictionnaire optionnel joueur -> réglages) donne à chaque IA ses arguments de
+    meilleur_coup_ia (budget_temps, budget_noeuds, profondeur_max) and, avec la clé
+    chemins_historiques, sa mesure des chemins alternatifs (CHEMINS_ALTERNATIFS_HISTORIQUE).
+    """
+    global CHEMINS_ALTERNATIFS_HISTORIQUE
+    etat = GameState()  # État local : pions en position initiale, aucun mur
+    difficultes = {1: difficulte_ia1, 2: difficulte_ia2}
+    alea = generateur if generateur is not None else random
+    parametres = {joueur: dict((reglages or {}).get(joueur, {})) for joueur in difficultes}
+    chemins_historiques = {joueur: parametres[joueur].pop('chemins_historiques', CHEMINS_ALTERNATIFS_HISTORIQUE)
+                           for joueur in difficultes}
+    if partie is not None:
+        partie['murs_ia1'] = partie['murs_ia2'] = 0
+        partie['deroulement'] = []
+    max_tours = 200  # Sécurité contre les boucles infinies
+    tour = 0
+    # Les niveaux intermédiaire and difficile jouent les courses sans mur à la perfection
+    # (resoudre_course) : leur issue est connue dès le premier coup de la course
+    # (sauf à profondeur imposée, où meilleur_coup_ia ne consulte pas resoudre_course)
+    arbitrage = (DIFFICULTY_EASY not in difficultes.values()
+                 and all(p.get('profondeur_max') is None for p in parametres.values()))
+
+    while True:
+        tour += 1
+        if tour > max_tours:
+            return 0, tour  # Match nul après 200 tours, renvoie également le nombre de coups
+
+        # Vérification victoire immédiate
+        if etat.pos_j1 // GRID_SIZE == 8:  # Joueur 1 a gagné
+            return 1, tour
+        if etat.pos_j2 // GRID_SIZE == 0:  # Joueur 2 a gagné
+            return 2, tour
+
+        # Course sans mur : résultat and nombre de coups de la partie jouée jusqu'au bout
+        course = resoudre_course(etat) if arbitrage else None
+        if course is not None:
+            issue, demi_coups, _ = course
+            if issue == COURSE_NULLE or tour + demi_coups > max_tours:
+                return 0, max_tours + 1
+            return (etat.tour if issue == COURSE_GAGNEE else 3 - etat.tour), tour + demi_coups
+
+        try:
+            # Tour du joueur actuel
+            tour_joueur = etat.tour
+
+            # S'assurer que deplacements_possibles ne retourne pas une liste vide
+            moves = deplacements_possibles(etat, tour_joueur)
+            if not moves:
+                return 0, tour  # Match nul si aucun mouvement possible
+
+            stats = None
+            if statistiques is not None:
+                stats = statistiques.setdefault(difficultes[tour_joueur], StatistiquesRecherche())
+            historique_precedent = CHEMINS_ALTERNATIFS_HISTORIQUE
+            CHEMINS_ALTERNATIFS_HISTORIQUE = chemins_historiques[tour_joueur]
+            try:
+                coup, type_coup = meilleur_coup_ia(etat, difficultes[tour_joueur], tour_joueur,
+                                                   statistiques=stats, generateur=generateur,
+                                                   **parametres[tour_joueur])
+            finally:
+                CHEMINS_ALTERNATIFS_HISTORIQUE = historique_precedent
+
+            # Fallback si pas de coup valide
+            if not coup or not type_coup:
+                coup = divmod(alea.choice(moves), GRID_SIZE)
+                type_coup = "deplacement"
+
+            # Application du coup
+            if type_coup == "deplacement":
+                ni, nj = coup
+                etat = etat.deplacer(tour_joueur, ni * GRID_SIZE + nj)
+            elif type_coup == "mur" and etat.murs_restants(tour_joueur) > 0 and mur_est_valide(coup, etat):
+                etat = etat.poser_mur(tour_joueur, coup)
+                if partie is not None:
+                    partie[f'murs_ia{tour_joueur}'] += 1
+            else:
+                etat = etat.passer()
+                type_coup, coup = "passe", None
+            if partie is not None:
+                partie['deroulement'].append((tour_joueur, type_coup, coup))
+
+        except Exception as e:
+            print(f"Erreur durant la simulation: {str(e)}")
+            return 0, tour  # Match nul en cas d'erreur
+
+def _jouer_match(difficulte_ia1, difficulte_ia2, graine, statistiques=False, reglages=None):
+    """
+    Joue un match de simulation avec son propre générateur du hasard, random.Random(graine),
+    and une table de transposition vide : le résultat ne dépend que des difficultés and de
+    la graine, quel que soit le processus, l'ordre dans lequel les matchs sont joués or ce
+    qui a consommé le module random avant lui.
+    Renvoie (gagnant, coups, partie) où partie donne les murs posés par chaque IA (murs_ia1,
+    murs_ia2), les coups joués (deroulement), la durée du match en secondes (duree) and, si
+    statistiques est vrai, les statistiques par difficulté (statistiques). reglages : voir
+    simulate_ai_vs_ai.
+    """
+    table_transposition.vider()
+    partie = {}
+    par_difficulte = {} if statistiques else None
+    debut = time.perf_counter()
+    gagnant, coups = simulate_ai_vs_ai(difficulte_ia1, difficulte_ia2, par_difficulte, partie,
+                                       random.Random(graine), reglages)
+    partie['duree'] = time.perf_counter() - debut
+    if statistiques:
+        partie['statistiques'] = par_difficulte
+    return gagnant, coups, partie
+
+def _initialiser_processus(chemins_historiques, chemin_livre, playouts_mcts):
+    """
+    Reporte dans un processus de calcul les réglages du moteur du processus principal.
+    Un processus de calcul cherche ses coups lui-même, sans recherche parallèle.
+    """
+    global CHEMINS_ALTERNATIFS_HISTORIQUE, chemin_livre_ouvertures, processus_recherche, _pool_recherche
+    global PLAYOUTS_MCTS
+    CHEMINS_ALTERNATIFS_HISTORIQUE = chemins_historiques
+    chemin_livre_ouvertures = chemin_livre
+    PLAYOUTS_MCTS = playouts_mcts
+    processus_recherche = 1
+    _pool_recherche = None
+
+def jouer_matchs(difficulte_ia1, difficulte_ia2, num_matches, processus=None, graine=None,
+                 statistiques=None, matchs=None):
+    """
+    Joue une série de matchs de simulation and renvoie (générateur) les résultats
+    (numéro du match, gagnant, nombre de coups, partie) au fur and à mesure qu'ils se
+    terminent ; partie donne les murs posés par chaque IA and la durée (voir _jouer_match).
+
+    Args:
+        processus: Nombre de processus de calcul (par défaut le nombre de cœurs) ; 1 pour tout
+                   jouer dans ce processus
+        graine: Graine de la série ; le match k est joué avec la graine "graine:k", si bien
+                qu'une même graine donne les mêmes résultats en série or en parallèle.
+                Par défaut, une graine tirée au hasard.
+        statistiques: Dictionnaire optionnel difficulté -> StatistiquesRecherche, complété
+                      par les compteurs de recherche de chaque match terminé
+        matchs: Numéros des matchs à jouer (par défaut 1 à num_matches), par exemple ceux
+                qui manquent au journal d'une série interrompue
+    """
+    if graine is None:
+        graine = random.randrange(2 ** 32)
+    if matchs is None:
+        matchs = range(1, num_matches + 1)
+    graines = {match: f"{graine}:{match}" for match in matchs}
+    if not graines:
+        return
+    if processus is None:
+        processus = os.cpu_count() or 1
+    processus = max(1, min(processus, len(graines)))
+    avec_statistiques = statistiques is not None
+
+    def resultat(match, valeurs):
+        gagnant, coups, partie = valeurs
+        if avec_statistiques:
+            for difficulte, stats in partie.pop('statistiques').items():
+                statistiques.setdefault(difficulte, StatistiquesRecherche()).fusionner(stats)
+        return match, gagnant, coups, partie
+
+    if processus == 1:
+        for match, graine_match in graines.items():
+            yield resultat(match, _jouer_match(difficulte_ia1, difficulte_ia2, graine_match,
+                                               avec_statistiques))
+        return
+
+    with ProcessPoolExecutor(max_workers=processus, initializer=_initialiser_processus,
+                             initargs=(CHEMINS_ALTERNATIFS_HISTORIQUE, chemin_livre_ouvertures, PLAYOUTS_MCTS)) as pool:
+        futures = {pool.submit(_jouer_match, difficulte_ia1, difficulte_ia2, graine_match,
+                               avec_statistiques): match
+                   for match, graine_match in graines.items()}
+        try:
+            for future in as_completed(futures):
+                yield resultat(futures[future], future.result())
+        finally:
+            # Série interrompue : ne pas lancer les matchs restants
+            for future in futures:
+                future.cancel()
+
+# Délai maximal (en secondes) entre deux fsync du journal des matchs
+DELAI_FSYNC_JOURNAL = 1.0
+
+class JournalMatchs:
+    """
+    Journal d'une série de matchs au format JSONL : un enregistrement par match terminé
+    (série, numéro and graine du match, niveaux, gagnant, coups, murs posés par chaque IA,
+    durée, réglages du moteur), ajouté dès la fin du match. Chaque ligne est vidée vers le système à
+    l'écriture, and le fichier est synchronisé sur disque (fsync) au plus tous les
+    DELAI_FSYNC_JOURNAL secondes and à la fermeture : une série interrompue garde ses
+    matchs terminés, sauf au pire la dernière seconde en cas de panne du système.
+    Pour reprendre une série, les matchs sont ajoutés en fin de fichier, après avoir retiré
+    une dernière ligne incomplète (série interrompue pendant l'écriture). Sinon le fichier
+    est créé : un journal existant and non vide n'est remplacé qu'avec ecraser, and lève
+    sinon ValueError.
+    """
+    def __init__(self, chemin, reprendre=False, delai_fsync=DELAI_FSYNC_JOURNAL, ecraser=False):
+        if reprendre:
+            _reparer_journal(chemin)
+            mode = 'a'
+        elif ecraser or (os.path.exists(chemin) and os.path.getsize(chemin) == 0):
+            mode = 'w'
+        else:
+            mode = 'x'
+        try:
+            self.fichier = open(chemin, mode, encoding='utf-8')
+        except FileExistsError:
+            raise ValueError(f"{chemin} contient déjà une série : la reprendre (--reprendre) "
+                             f"or la remplacer (--ecraser)") from None
+        self.delai_fsync = delai_fsync
+        self.dernier_fsync = time.monotonic()
+
+    def ecrire(self, enregistrement):
+        self.fichier.write(json.dumps(enregistrement) + '\n')
+        self.fichier.flush()
+        if time.monotonic() - self.dernier_fsync >= self.delai_fsync:
+            os.fsync(self.fichier.fileno())
+            self.dernier_fsync = time.monotonic()
+
+    def fermer(self):
+        if not self.fichier.closed:
+            self.fichier.flush()
+            os.fsync(self.fichier.fileno())
+            self.fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+def lire_journal(chemin):
+    """
+    Enregistrements d'un journal de matchs (liste vide si le fichier n'existe pas). Une
+    dernière ligne incomplète (série interrompue pendant l'écriture) est ignorée ; le
+    fichier n'est pas modifié (voir _reparer_journal).
+    """
+    if not os.path.exists(chemin):
+        return []
+    enregistrements = []
+    with open(chemin, 'rb') as fichier:
+        lignes = fichier.read().split(b'\n')
+    for indice, ligne in enumerate(lignes):
+        if not ligne.strip():
+            continue
+        try:
+            enregistrements.append(json.loads(ligne))
+        except ValueError:
+            if indice < len(lignes) - 1:
+                raise ValueError(f"{chemin} : ligne {indice + 1} illisible")
+    return enregistrements
+
+def _reparer_journal(chemin):
+    """
+    Avant d'ajouter des matchs à un journal : retire une dernière ligne incomplète, or
+    termine par un saut de ligne une dernière ligne complète, pour que le match suivant
+    commence sur une nouvelle ligne.
+    """
+    if not os.path.exists(chemin):
+        return
+    with open(chemin, 'r+b') as fichier:
+        contenu = fichier.read()
+        if not contenu or contenu.endswith(b'\n'):
+            return
+        debut = contenu.rfind(b'\n') + 1
+        try:
+            json.loads(contenu[debut:])
+        except ValueError:
+            fichier.truncate(debut)
+        else:
+            fichier.write(b'\n')
+
+def _nom_niveau(difficulte):
+    """Nom d'un niveau en ligne de commande (clé de NIVEAUX)"""
+    for nom, valeur in NIVEAUX.items():
+        if valeur == difficulte:
+            return nom
+    return difficulte
+
+def _reglages_moteur():
+    """
+    Réglages du moteur qui changent le jeu des IA (livre d'ouvertures, parties simulées du
+    niveau MCTS, mesure des chemins alternatifs), écrits dans chaque enregistrement du journal
+    """
+    return {
+        'livre': livre_ouvertures() is not None,
+        'playouts_mcts': PLAYOUTS_MCTS,
+        'chemins_historiques': CHEMINS_ALTERNATIFS_HISTORIQUE,
+    }
+
+def _appliquer_reglages_moteur(reglages):
+    """Rétablit les réglages du moteur d'un enregistrement du journal (voir _reglages_moteur)"""
+    global CHEMINS_ALTERNATIFS_HISTORIQUE
+    if not reglages['livre']:
+        configurer_livre_ouvertures(None)
+    configurer_mcts(reglages['playouts_mcts'])
+    CHEMINS_ALTERNATIFS_HISTORIQUE = reglages['chemins_historiques']
+
+def _enregistrement_match(graine, match, difficulte_ia1, difficulte_ia2, gagnant, coups, partie):
+    """Enregistrement du journal pour un match terminé"""
+    return {
+        'serie': graine,
+        'match': match,
+        'graine': f"{graine}:{match}",
+        'ia1': _nom_niveau(difficulte_ia1),
+        'ia2': _nom_niveau(difficulte_ia2),
+        'gagnant': gagnant,
+        'coups': coups,
+        'murs_ia1': partie['murs_ia1'],
+        'murs_ia2': partie['murs_ia2'],
+        'duree': round(partie['duree'], 4),
+        'reglages': _reglages_moteur(),
+    }
+
+def _reprendre_serie(journal, difficulte_ia1, difficulte_ia2, graine):
+    """
+    Graine de la série and matchs déjà joués (numéro -> enregistrement) d'après le journal.
+    Lève ValueError si le journal appartient à une autre série (niveaux, graine or réglages
+    du moteur, voir _reglages_moteur).
+    """
+    enregistrements = lire_journal(journal)
+    if not enregistrements:
+        return graine, {}
+    niveaux = (_nom_niveau(difficulte_ia1), _nom_niveau(difficulte_ia2))
+    premier = enregistrements[0]
+    if (premier['ia1'], premier['ia2']) != niveaux:
+        raise ValueError(f"{journal} : série {premier['ia1']} contre {premier['ia2']}, "
+                         f"pas {niveaux[0]} contre {niveaux[1]}")
+    if graine is not None and graine != premier['serie']:
+        raise ValueError(f"{journal} : série de graine {premier['serie']}, pas {graine}")
+    reglages = _reglages_moteur()
+    if premier.get('reglages') != reglages:
+        raise ValueError(f"{journal} : série jouée avec les réglages {premier.get('reglages')}, pas {reglages}")
+    return premier['serie'], {enregistrement['match']: enregistrement for enregistrement in enregistrements}
+
+def _matchs_du_journal(journal, num_matches):
+    """Matchs (numéro, gagnant, nombre de coups) du journal, parmi les num_matches de la série"""
+    par_match = {enregistrement['match']: enregistrement for enregistrement in lire_journal(journal)}
+    return [(match, enregistrement['gagnant'], enregistrement['coups'])
+            for match, enregistrement in sorted(par_match.items()) if match <= num_matches]
+
+def _agreger_matchs(matchs):
+    """Victoires par joueur (0 : matchs nuls) and nombre total de coups d'une liste de matchs"""
+    scores = {0: 0, 1: 0, 2: 0}
+    total_coups = 0
+    for _, gagnant, coups in matchs:
+        scores[gagnant if gagnant in scores else 0] += 1
+        total_coups += coups
+    return scores, total_coups
+
+def run_batch_simulations(difficulte_ia1, difficulte_ia2, num_matches, processus=None, graine=None,
+                          statistiques=False, journal=None, reprendre=False, ecraser=False):
+    """
+    Exécute une série de matchs and affiche les résultats dans la console.
+    Renvoie un résumé {'graine', 'scores', 'moyenne_coups', 'matchs'} où matchs est la liste
+    (numéro, gagnant, nombre de coups) triée par numéro de match. Si statistiques est vrai,
+    les compteurs de recherche sont cumulés par difficulté, affichés and ajoutés au résumé
+    sous la clé 'statistiques' (nom de la difficulté -> StatistiquesRecherche).
+
+    Avec journal (chemin d'un fichier JSONL), chaque match terminé y est écrit aussitôt
+    (JournalMatchs). Avec reprendre, la série du journal est poursuivie : sa graine est
+    relue, les matchs déjà présents ne sont pas rejoués, and les résultats finaux sont
+    recalculés depuis le fichier (les statistiques ne couvrent que les matchs joués cette
+    fois). Sans reprendre, un journal existant and non vide n'est remplacé qu'avec ecraser
+    (sinon ValueError, avant de jouer le moindre match).
+    """
+    difficulty_names = {
+        DIFFICULTY_EASY: "Facile",
+        DIFFICULTY_MEDIUM: "Intermédiaire",
+        DIFFICULTY_HARD: "Difficile",
+        DIFFICULTY_MCTS: "MCTS"
+    }
+    ia1_name = difficulty_names.get(difficulte_ia1, "Inconnu")
+    ia2_name = difficulty_names.get(difficulte_ia2, "Inconnu")
+    
+    deja_joues = {}
+    if journal and reprendre:
+        graine, deja_joues = _reprendre_serie(journal, difficulte_ia1, difficulte_ia2, graine)
+    if graine is None:
+        graine = random.randrange(2 ** 32)
+    fichier_journal = JournalMatchs(journal, reprendre, ecraser=ecraser) if journal else nullcontext()
+    print(f"\nDébut de {num_matches} matchs {ia1_name} vs {ia2_name} (graine {graine})...")
+    if deja_joues:
+        print(f"Reprise de {journal} : {len(deja_joues)} matchs déjà joués")
+    a_jouer = [match for match in range(1, num_matches + 1) if match not in deja_joues]
+    matchs = [(match, enregistrement['gagnant'], enregistrement['coups'])
+              for match, enregistrement in deja_joues.items() if match <= num_matches]
+    par_difficulte = {} if statistiques else None
+    
+    try:
+        with fichier_journal as sortie:
+            for match, gagnant, nombre_coups, partie in jouer_matchs(difficulte_ia1, difficulte_ia2,
+                                                                     num_matches, processus, graine,
+                                                                     par_difficulte, a_jouer):
+                if sortie is not None:
+                    sortie.ecrire(_enregistrement_match(graine, match, difficulte_ia1, difficulte_ia2,
+                                                        gagnant, nombre_coups, partie))
+
+                # Vérifier que le résultat est valide (0, 1 or 2)
+                if gagnant not in (0, 1, 2):
+                    print(f"Erreur: résultat invalide {gagnant}, considéré comme match nul")
+                    gagnant = 0
+
+                if gagnant == 0:
+                    resultat = "Match nul"
+                else:
+                    resultat = f"{ia1_name if gagnant == 1 else ia2_name} gagne"
+                print(f"- Match {match} : {resultat} en {nombre_coups} coups")
+                matchs.append((match, gagnant, nombre_coups))
+
+        if journal:
+            matchs = _matchs_du_journal(journal, num_matches)
+        scores, total_coups = _agreger_matchs(matchs)
+        print("\nRésultats finaux:")
+        total = sum(scores.values())
+        if total > 0:  # Éviter division par zéro
+            print(f"- {ia1_name}: {scores[1]} victoires ({scores[1]/total*100:.1f}%)")
+            print(f"- {ia2_name}: {scores[2]} victoires ({scores[2]/total*100:.1f}%)")
+            print(f"- Matchs nuls: {scores[0]} ({scores[0]/total*100:.1f}%)")
+            print(f"- Moyenne de coups par match: {total_coups/total:.1f}")
+        else:
+            print("Aucun match n'a été complété avec succès.")
+        if par_difficulte:
+            for difficulte, stats in sorted(par_difficulte.items()):
+                print(f"\nStatistiques de recherche - {difficulty_names.get(difficulte, 'Inconnu')}:")
+                for ligne in stats.resume():
+                    print(f"- {ligne}")
+                if stats.succes_livre and total:
+                    print(f"- livre d'ouvertures : environ {stats.temps_economise_livre() / total * 1000:.1f} ms "
+                          f"économisées par partie")
+        print("----------------------------------")
+    except Exception as e:
+        print(f"Erreur pendant les simulations: {str(e)}")
+
+    scores, total_coups = _agreger_matchs(matchs)
+    total = sum(scores.values())
+    resume = {
+        'graine': graine,
+        'scores': scores,
+        'moyenne_coups': total_coups / total if total else 0,
+        'matchs': sorted(matchs),
+    }
+    if par_difficulte is not None:
+        resume['statistiques'] = {difficulty_names.get(difficulte, 'Inconnu'): stats
+                                  for difficulte, stats in par_difficulte.items()}
+    return resume
+
+def run_batch_simulations_with_progress(difficulte_ia1, difficulte_ia2, num_matches, 
+                                       progress_callback=None, result_callback=None,
+                                       processus=None, graine=None, journal=None, reprendre=False,
+                                       ecraser=False):
+    """
+    Version améliorée qui exécute une série de matchs avec suivi de progression
+    
+    Args:
+        difficulte_ia1: Niveau de difficulté de l'IA1
+        difficulte_ia2: Niveau de difficulté de l'IA2
+        num_matches: Nombre total de matchs à exécuter
+        progress_callback: Fonction appelée pour mettre à jour la progression
+        result_callback: Fonction appelée pour afficher les résultats finaux
+        processus: Nombre de processus de calcul (par défaut le nombre de cœurs)
+        graine: Graine de la série (voir jouer_matchs)
+        journal: Fichier JSONL où écrire chaque match terminé (voir run_batch_simulations)
+        reprendre: Poursuit la série du journal
+        ecraser: Remplace un journal existant (voir JournalMatchs)
+    """
+    difficulty_names = {
+        DIFFICULTY_EASY: "Facile",
+        DIFFICULTY_MEDIUM: "Intermédiaire",
+        DIFFICULTY_HARD: "Difficile",
+        DIFFICULTY_MCTS: "MCTS"
+    }
+    ia1_name = difficulty_names.get(difficulte_ia1, "Inconnu")
+    ia2_name = difficulty_names.get(difficulte_ia2, "Inconnu")
+    
+    print(f"\nDébut de {num_matches} matchs {ia1_name} vs {ia2_name}...")
+    matchs = []
+    
+    termines = 0
+    try:
+        deja_joues = {}
+        if journal and reprendre:
+            graine, deja_joues = _reprendre_serie(journal, difficulte_ia1, difficulte_ia2, graine)
+        if graine is None:
+            graine = random.randrange(2 ** 32)
+        a_jouer = [match for match in range(1, num_matches + 1) if match not in deja_joues]
+        matchs = [(match, enregistrement['gagnant'], enregistrement['coups'])
+                  for match, enregistrement in deja_joues.items() if match <= num_matches]
+        termines = len(matchs)
+
+        # Mise à jour de la progression
+        if progress_callback:
+            progress_callback(termines, num_matches, f"Simulation de {num_matches} matchs...")
+
+        # Les matchs sont joués en parallèle and arrivent dans l'ordre où ils se terminent
+        with JournalMatchs(journal, reprendre, ecraser=ecraser) if journal else nullcontext() as sortie:
+            for match, gagnant, nombre_coups, partie in jouer_matchs(difficulte_ia1, difficulte_ia2,
+                                                                     num_matches, processus, graine,
+                                                                     matchs=a_jouer):
+                if sortie is not None:
+                    sortie.ecrire(_enregistrement_match(graine, match, difficulte_ia1, difficulte_ia2,
+                                                        gagnant, nombre_coups, partie))
+                termines += 1
+
+                # Vérifier que le résultat est valide (0, 1 or 2)
+                if gagnant not in (0, 1, 2):
+                    print(f"Erreur: résultat invalide {gagnant}, considéré comme match nul")
+                    gagnant = 0
+
+                if gagnant == 0:
+                    resultat = "Match nul"
+                else:
+                    resultat = f"{ia1_name if gagnant == 1 else ia2_name} gagne"
+                print(f"- Match {match}/{num_matches} : {resultat} en {nombre_coups} coups")
+                matchs.append((match, gagnant, nombre_coups))
+
+                # Mise à jour de la progression après le match
+                if progress_callback:
+                    status = f"Match {match}/{num_matches} terminé: {resultat} en {nombre_coups} coups"
+                    progress_callback(termines, num_matches, status)
+
+        if journal:
+            matchs = _matchs_du_journal(journal, num_matches)
+        scores, total_coups = _agreger_matchs(matchs)
+        print("\nRésultats finaux:")
+        total = sum(scores.values())
+        if total > 0:  # Éviter division par zéro
+            moyenne_coups = total_coups / total
+            print(f"- {ia1_name}: {scores[1]} victoires ({scores[1]/total*100:.1f}%)")
+            print(f"- {ia2_name}: {scores[2]} victoires ({scores[2]/total*100:.1f}%)")
+            print(f"- Matchs nuls: {scores[0]} ({scores[0]/total*100:.1f}%)")
+            print(f"- Moyenne de coups par match: {moyenne_coups:.1f}")
+        else:
+            print("Aucun match n'a été complété avec succès.")
+            moyenne_coups = 0
+        print("----------------------------------")
+        
+        # Appel à la fonction de rappel pour afficher les résultats finaux
+        if result_callback:
+            # Ajouter la moyenne de coups à la fonction de rappel
+            result_callback(scores, moyenne_coups)
+        
+    except Exception as e:
+        print(f"Erreur pendant les simulations: {str(e)}")
+        if progress_callback:
+            progress_callback(termines, num_matches, f"Erreur: {str(e)}")
+
+# Réglages d'une configuration de tournoi : nom dans la description -> (clé des réglages de
+# simulate_ai_vs_ai, conversion de la valeur)
+REGLAGES_TOURNOI = {
+    'profondeur': ('profondeur_max', int),
+    'temps': ('budget_temps', float),
+    'noeuds': ('budget_noeuds', int),
+    'evaluation': ('chemins_historiques', {'standard': False, 'historique': True}.__getitem__),
+}
+
+# Durée relative d'un coup de chaque niveau, pour ordonner les parties d'un tournoi avant
+# d'en avoir mesuré (voir _cout_coup)
+COUT_COUP_NIVEAUX = {DIFFICULTY_EASY: 0.001, DIFFICULTY_MEDIUM: 0.002, DIFFICULTY_HARD: 0.003,
+                     DIFFICULTY_MCTS: 0.15}
+
+# Estimation des Elo : parties nulles fictives ajoutées à chaque paire (sans elles, une paire
+# gagnée or perdue à chaque partie donnerait un écart infini), nombre d'itérations de
+# l'algorithme MM, tirages du bootstrap and niveau de confiance des intervalles
+PARTIES_FICTIVES_ELO = 1
+ITERATIONS_ELO = 1000
+TIRAGES_ELO = 1000
+CONFIANCE_ELO = 0.95
+
+def lire_configuration(texte):
+    """
+    Configuration d'IA de tournoi décrite par texte : un niveau (clé de NIVEAUX) suivi de
+    réglages clé=valeur séparés par ':', parmi profondeur (profondeur_max), temps
+    (budget_temps en secondes), noeuds (budget_noeuds : nœuds minimax or parties simulées
+    MCTS) and evaluation (standard or historique, voir CHEMINS_ALTERNATIFS_HISTORIQUE).
+    Par exemple "hard", "hard:profondeur=3" or "mcts:noeuds=300:temps=0.5".
+    Renvoie {'nom': texte, 'niveau': difficulté, 'reglages': réglages de simulate_ai_vs_ai} ;
+    lève ValueError si le texte n'est pas une configuration.
+    """
+    niveau, *reglages = texte.split(':')
+    if niveau not in NIVEAUX:
+        raise ValueError(f"{texte} : niveau inconnu {niveau!r} (parmi {', '.join(NIVEAUX)})")
+    parametres = {}
+    for reglage in reglages:
+        nom, egal, valeur = reglage.partition('=')
+        if not egal or nom not in REGLAGES_TOURNOI:
+            raise ValueError(f"{texte} : réglage inconnu {reglage!r} (parmi {', '.join(REGLAGES_TOURNOI)})")
+        cle, conversion = REGLAGES_TOURNOI[nom]
+        try:
+            valeur = conversion(valeur)
+        except (KeyError, ValueError):
+            raise ValueError(f"{texte} : valeur invalide pour {nom}") from None
+        if nom != 'evaluation' and valeur <= 0:
+            raise ValueError(f"{texte} : {nom} doit être positif")
+        parametres[cle] = valeur
+    return {'nom': texte, 'niveau': NIVEAUX[niveau], 'reglages': parametres}
+
+def _cout_coup(configuration):
+    """Durée relative estimée d'un coup d'une configuration de tournoi"""
+    niveau, reglages = configuration['niveau'], configuration['reglages']
+    cout = COUT_COUP_NIVEAUX[niveau]
+    if niveau == DIFFICULTY_MCTS:
+        cout *= min(reglages.get('budget_noeuds', PLAYOUTS_MCTS), PLAYOUTS_MCTS) / PLAYOUTS_MCTS
+    elif 'profondeur_max' in reglages:
+        cout *= 4 ** max(0, reglages['profondeur_max'] - 3)
+    if 'budget_temps' in reglages:
+        cout = min(cout, reglages['budget_temps'])
+    return cout
+
+def _jouer_partie_tournoi(configuration_j1, configuration_j2, graine):
+    """Partie d'un tournoi (voir _jouer_match) : configuration_j1 joue avec le joueur 1"""
+    return _jouer_match(configuration_j1['niveau'], configuration_j2['niveau'], graine,
+                        reglages={1: configuration_j1['reglages'], 2: configuration_j2['reglages']})
+
+def jouer_tournoi(configurations, parties, processus=None, graine=None):
+    """
+    Joue un tournoi à la ronde entre configurations (voir lire_configuration) : parties
+    parties par paire, couleurs alternées, and renvoie (générateur) les résultats
+    (indice de la configuration joueur 1, indice de la configuration joueur 2, gagnant,
+    nombre de coups, partie) au fur and à mesure qu'ils se terminent.
+
+    La partie k d'une paire est jouée avec la graine "graine:nom1:nom2:k" (noms dans
+    l'ordre alphabétique, nom1 joueur 1 aux parties impaires) : sans budget de temps, une
+    même graine donne les mêmes résultats quel que soit l'ordre des configurations or le
+    nombre de processus. Les parties les plus longues sont lancées d'abord, pour que les
+    processus finissent ensemble : la durée d'une partie est estimée par la moyenne des
+    parties déjà terminées de sa paire, à défaut par le coût des coups de ses deux
+    configurations (_cout_coup). Les paramètres processus and graine sont ceux de jouer_matchs.
+    """
+    if graine is None:
+        graine = random.randrange(2 ** 32)
+    restantes = {}
+    for a in range(len(configurations)):
+        for b in range(a + 1, len(configurations)):
+            premier, second = sorted((a, b), key=lambda indice: configurations[indice]['nom'])
+            restantes[premier, second] = deque(range(1, parties + 1))
+    durees = {paire: [] for paire in restantes}
+
+    def duree_estimee(paire):
+        if durees[paire]:
+            return sum(durees[paire]) / len(durees[paire])
+        return sum(_cout_coup(configurations[indice]) for indice in paire)
+
+    def prochaine_partie():
+        """(indice joueur 1, indice joueur 2, graine) de la prochaine partie, or None"""
+        a_jouer = [paire for paire, numeros in restantes.items() if numeros]
+        if not a_jouer:
+            return None
+        premier, second = max(a_jouer, key=duree_estimee)
+        numero = restantes[premier, second].popleft()
+        graine_partie = f"{graine}:{configurations[premier]['nom']}:{configurations[second]['nom']}:{numero}"
+        return (premier, second, graine_partie) if numero % 2 else (second, premier, graine_partie)
+
+    def resultat(j1, j2, valeurs):
+        gagnant, coups, partie = valeurs
+        durees[tuple(sorted((j1, j2), key=lambda indice: configurations[indice]['nom']))].append(partie['duree'])
+        return j1, j2, gagnant, coups, partie
+
+    total = len(restantes) * parties
+    if processus is None:
+        processus = os.cpu_count() or 1
+    processus = max(1, min(processus, total))
+
+    if processus == 1:
+        while (suivante := prochaine_partie()) is not None:
+            j1, j2, graine_partie = suivante
+            yield resultat(j1, j2, _jouer_partie_tournoi(configurations[j1], configurations[j2], graine_partie))
+        return
+
+    with ProcessPoolExecutor(max_workers=processus, initializer=_initialiser_processus,
+                             initargs=(CHEMINS_ALTERNATIFS_HISTORIQUE, chemin_livre_ouvertures, PLAYOUTS_MCTS)) as pool:
+        en_cours = {}
+
+        def lancer():
+            # Deux parties par processus : l'un n'attend pas la suivante quand il en termine une
+            while len(en_cours) < 2 * processus and (suivante := prochaine_partie()) is not None:
+                j1, j2, graine_partie = suivante
+                en_cours[pool.submit(_jouer_partie_tournoi, configurations[j1], configurations[j2],
+                                     graine_partie)] = (j1, j2)
+
+        try:
+            lancer()
+            while en_cours:
+                terminees, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+                for future in terminees:
+                    j1, j2 = en_cours.pop(future)
+                    yield resultat(j1, j2, future.result())
+                lancer()
+        finally:
+            # Tournoi interrompu : ne pas lancer les parties restantes
+            for future in en_cours:
+                future.cancel()
+
+def _ajuster_elo(nombre, rencontres):
+    """
+    Elo (moyenne nulle) des nombre configurations d'après rencontres, dictionnaire
+    (a, b) -> (points de a, parties) : maximum de vraisemblance du modèle de Bradley-Terry
+    (l'espérance de a contre b est 1 / (1 + 10 ** ((Elo b - Elo a) / 400)), un nul valant un
+    demi-point), par l'algorithme MM de Hunter, avec PARTIES_FICTIVES_ELO parties nulles
+    fictives par paire.
+    """
+    points = [0.0] * nombre
+    adversaires = [[] for _ in range(nombre)]
+    for (a, b), (points_a, parties) in rencontres.items():
+        parties += PARTIES_FICTIVES_ELO
+        points_a += PARTIES_FICTIVES_ELO / 2
+        points[a] += points_a
+        points[b] += parties - points_a
+        adversaires[a].append((b, parties))
+        adversaires[b].append((a, parties))
+    forces = [1.0] * nombre
+    for _ in range(ITERATIONS_ELO):
+        nouvelles = [points[i] / sum(parties / (forces[i] + forces[j]) for j, parties in adversaires[i])
+                     if adversaires[i] else 1.0 for i in range(nombre)]
+        echelle = math.exp(sum(math.log(force) for force in nouvelles) / nombre)
+        nouvelles = [force / echelle for force in nouvelles]
+        ecart = max(abs(nouvelle / force - 1) for nouvelle, force in zip(nouvelles, forces))
+        forces = nouvelles
+        if ecart < 1e-9:
+            break
+    return [400 * math.log10(force) for force in forces]
+
+def classement_elo(nombre, resultats, graine=None):
+    """
+    Elo and intervalles de confiance des nombre configurations d'un tournoi d'après
+    resultats, liste de (indice joueur 1, indice joueur 2, gagnant) : renvoie une liste
+    de (Elo, borne basse, borne haute) au niveau CONFIANCE_ELO.
+    Les intervalles viennent d'un bootstrap paramétrique (TIRAGES_ELO tournois rejoués
+    avec les espérances des Elo estimés and la proportion de nuls de chaque paire,
+    générateur random.Random(graine)) plutôt que d'un tirage avec remise des parties,
+    qui ne ferait jamais varier une paire gagnée à chaque partie.
+    """
+    points_par_paire = {}
+    for j1, j2, gagnant in resultats:
+        a, b = min(j1, j2), max(j1, j2)
+        gagnant_a = gagnant == (1 if a == j1 else 2)
+        points_par_paire.setdefault((a, b), []).append(1.0 if gagnant_a else 0.5 if gagnant == 0 else 0.0)
+    elos = _ajuster_elo(nombre, {paire: (sum(points), len(points))
+                                 for paire, points in points_par_paire.items()})
+
+    # Pour chaque paire : parties, probabilités de gain de a and de nul
+    modele = {}
+    for (a, b), points in points_par_paire.items():
+        esperance = 1 / (1 + 10 ** ((elos[b] - elos[a]) / 400))
+        nuls = min(points.count(0.5) / len(points), 2 * esperance, 2 * (1 - esperance))
+        modele[a, b] = (len(points), esperance - nuls / 2, nuls)
+    alea = random.Random(graine)
+    tirages = [[] for _ in range(nombre)]
+    for _ in range(TIRAGES_ELO):
+        rencontres = {}
+        for paire, (parties, gain, nul) in modele.items():
+            points = 0.0
+            for _ in range(parties):
+                tirage = alea.random()
+                points += 1.0 if tirage < gain else 0.5 if tirage < gain + nul else 0.0
+            rencontres[paire] = (points, parties)
+        for indice, elo in enumerate(_ajuster_elo(nombre, rencontres)):
+            tirages[indice].append(elo)
+    queue = (1 - CONFIANCE_ELO) / 2
+    intervalles = []
+    for elo, valeurs in zip(elos, tirages):
+        valeurs.sort()
+        bas = valeurs[int(queue * (len(valeurs) - 1))]
+        haut = valeurs[int(math.ceil((1 - queue) * (len(valeurs) - 1)))]
+        intervalles.append((elo, bas, haut))
+    return intervalles
+
+def run_tournoi(configurations, parties, processus=None, graine=None):
+    """
+    Joue un tournoi à la ronde (jouer_tournoi), affiche chaque partie terminée puis le
+    tableau croisé (points de la ligne contre la colonne) and le classement Elo avec ses
+    intervalles de confiance (classement_elo).
+    Renvoie un résumé {'graine', 'configurations', 'parties', 'tableau', 'elo'} : noms des
+    configurations, parties (indice joueur 1, indice joueur 2, gagnant, nombre de coups),
+    tableau[a][b] = (points de a contre b, parties) and (Elo, borne basse, borne haute)
+    de chaque configuration.
+    """
+    noms = [configuration['nom'] for configuration in configurations]
+    if len(noms) < 2:
+        raise ValueError("un tournoi demande au moins deux configurations")
+    if len(set(noms)) != len(noms):
+        raise ValueError("configurations en double : " + ", ".join(sorted({nom for nom in noms if noms.count(nom) > 1})))
+    if parties < 1:
+        raise ValueError("au moins une partie par paire")
+    if graine is None:
+        graine = random.randrange(2 ** 32)
+    total = len(noms) * (len(noms) - 1) // 2 * parties
+    print(f"\nTournoi à la ronde : {len(noms)} configurations, {parties} parties par paire, "
+          f"{total} parties (graine {graine})...")
+
+    resultats = []
+    tableau = [[(0.0, 0)] * len(noms) for _ in noms]
+    for termine, (j1, j2, gagnant, coups, partie) in enumerate(jouer_tournoi(configurations, parties, processus,
+                                                                             graine), 1):
+        resultats.append((j1, j2, gagnant, coups))
+        points_j1 = 1.0 if gagnant == 1 else 0.5 if gagnant == 0 else 0.0
+        for a, b, points in ((j1, j2, points_j1), (j2, j1, 1 - points_j1)):
+            tableau[a][b] = (tableau[a][b][0] + points, tableau[a][b][1] + 1)
+        issue = "match nul" if gagnant == 0 else f"{noms[j1] if gagnant == 1 else noms[j2]} gagne"
+        print(f"- Partie {termine}/{total} : {noms[j1]} contre {noms[j2]} : {issue} en {coups} coups "
+              f"({partie['duree']:.2f} s)")
+
+    elo = classement_elo(len(noms), [(j1, j2, gagnant) for j1, j2, gagnant, _ in resultats], graine)
+    largeur = max(len(nom) for nom in noms)
+    colonnes = [max(len(nom), 9) for nom in noms]
+    print("\nTableau croisé (points de la ligne contre la colonne):")
+    print(" " * largeur + " | " + " | ".join(nom.rjust(colonne) for nom, colonne in zip(noms, colonnes))
+          + " |     Total")
+    for a, nom in enumerate(noms):
+        cases = ["-".rjust(colonne) if a == b else f"{tableau[a][b][0]:g}/{tableau[a][b][1]}".rjust(colonne)
+                 for b, colonne in enumerate(colonnes)]
+        points = sum(case[0] for case in tableau[a])
+        joues = sum(case[1] for case in tableau[a])
+        print(nom.ljust(largeur) + " | " + " | ".join(cases) + f" | {f'{points:g}/{joues}':>9}")
+
+    print(f"\nClassement Elo (moyenne 0, intervalles à {CONFIANCE_ELO:.0%}):")
+    for rang, a in enumerate(sorted(range(len(noms)), key=lambda indice: -elo[indice][0]), 1):
+        valeur, bas, haut = elo[a]
+        points = sum(case[0] for case in tableau[a])
+        joues = sum(case[1] for case in tableau[a])
+        print(f"{rang:2}. {noms[a].ljust(largeur)} {valeur:+7.0f}  [{bas:+.0f}, {haut:+.0f}]  "
+              f"{points:g}/{joues} ({points / joues:.1%})")
+    print("----------------------------------")
+    return {
+        'graine': graine,
+        'configurations': noms,
+        'parties': resultats,
+        'tableau': tableau,
+        'elo': elo,
+    }
+
+def _entree_livre(etat, difficulte, profondeur):
+    """
+    Entrée du livre d'ouvertures pour la position etat au niveau donné : recherche où les
+    murs sont des coups, à la profondeur donnée. Renvoie (clé, code du coup, score, profondeur).
+    """
+    joueur_num = etat.tour
+    coup, type_coup = meilleur_coup_ia(etat, difficulte, joueur_num, profondeur_max=profondeur,
+                                       murs_dans_recherche=True)
+    code = code_mur(coup) if type_coup == "mur" else coup[0] * GRID_SIZE + coup[1]
+    apres = etat.copie()
+    apres.jouer_coup(joueur_num, code)
+    score = minimax(apres, profondeur - 1, float('-inf'), float('inf'), False,
+                    joueur_principal=joueur_num, difficulte=difficulte, avec_murs=True)
+    return _cle_recherche(etat, joueur_num, difficulte), code, score, profondeur
+
+def construire_livre_ouvertures(demi_coups=4, profondeur=5, processus=None,
+                                difficultes=(DIFFICULTY_MEDIUM, DIFFICULTY_HARD)):
+    """
+    Construit les entrées d'un livre d'ouvertures (voir ecrire_livre_ouvertures) : chaque
+    position des demi_coups premiers demi-coups est cherchée à chaque niveau, en parallèle.
+    Depuis une position, les positions suivantes sont celles de tous les déplacements du
+    joueur qui a la main and des murs choisis par le livre, si bien qu'une partie reste dans
+    le livre tant que personne ne pose d'autre mur.
+    """
+    couche = [GameState()]
+    vues = {couche[0].cle}
+    entrees = {}
+    with ProcessPoolExecutor(max_workers=processus, initializer=_initialiser_processus,
+                             initargs=(CHEMINS_ALTERNATIFS_HISTORIQUE, None, PLAYOUTS_MCTS)) as pool:
+        for demi_coup in range(demi_coups):
+            debut = time.perf_counter()
+            futures = {pool.submit(_entree_livre, etat, difficulte, profondeur): indice
+                       for indice, etat in enumerate(couche) for difficulte in difficultes}
+            coups_suivants = [deplacements_possibles(etat, etat.tour) for etat in couche]
+            for future in as_completed(futures):
+                cle, coup, score, profondeur_entree = future.result()
+                entrees[cle] = (coup, score, profondeur_entree)
+                if coup >= ENTREE_MUR_H and coup not in coups_suivants[futures[future]]:
+                    coups_suivants[futures[future]].append(coup)
+            print(f"Demi-coup {demi_coup + 1} : {len(couche)} positions "
+                  f"({time.perf_counter() - debut:.1f} s)")
+
+            suivante = []
+            for etat, coups in zip(couche, coups_suivants):
+                for coup in coups:
+                    position = etat.copie()
+                    position.jouer_coup(etat.tour, coup)
+                    if position.cle not in vues:
+                        vues.add(position.cle)
+                        suivante.append(position)
+            couche = suivante
+    return entrees
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande (python -m quoridor_engine)"""
+    global CHEMINS_ALTERNATIFS_HISTORIQUE
+    parser = argparse.ArgumentParser(prog="python -m quoridor_engine",
+                                     description="Moteur de Quoridor sans interface graphique")
+    commandes = parser.add_subparsers(dest='commande', required=True)
+
+    batch = commandes.add_parser('batch', help="série de matchs IA contre IA")
+    batch.add_argument('--ia1', choices=NIVEAUX, default='medium', help="niveau de l'IA1 (joueur 1)")
+    batch.add_argument('--ia2', choices=NIVEAUX, default='medium', help="niveau de l'IA2 (joueur 2)")
+    batch.add_argument('-n', '--matchs', type=int, default=100, help="nombre de matchs")
+    batch.add_argument('--jobs', type=int, default=None,
+                       help="nombre de processus de calcul (par défaut le nombre de cœurs)")
+    batch.add_argument('--graine', type=int, default=None, help="graine de la série (reproductible)")
+    batch.add_argument('--sortie', help="fichier JSON où écrire les résultats")
+    batch.add_argument('--statistiques', action='store_true',
+                       help="compte nœuds, coupures, parcours de chemins and durées par phase de chaque niveau")
+    batch.add_argument('--chemins-historiques', action='store_true',
+                       help="mesure des chemins alternatifs d'origine (voir CHEMINS_ALTERNATIFS_HISTORIQUE)")
+    batch.add_argument('--sans-livre', action='store_true', help="sans livre d'ouvertures")
+    batch.add_argument('--journal', help="fichier JSONL où ajouter chaque match terminé (série reprenable)")
+    batch.add_argument('--reprendre', '--resume', action='store_true',
+                       help="poursuit la série du journal : matchs déjà joués ignorés, résultats recalculés")
+    batch.add_argument('--ecraser', '--overwrite', action='store_true',
+                       help="remplace le journal s'il contient déjà une série")
+    batch.add_argument('--playouts-mcts', type=int, default=None,
+                       help=f"parties simulées par coup du niveau mcts (par défaut {PLAYOUTS_MCTS})")
+
+    rejouer = commandes.add_parser('rejouer', help="rejoue à l'identique un match d'une série and affiche ses coups")
+    rejouer.add_argument('--match', type=int, required=True, help="numéro du match dans la série")
+    rejouer.add_argument('--journal', help="journal de la série (niveaux and graine lus dans l'enregistrement du match)")
+    rejouer.add_argument('--ia1', choices=NIVEAUX, default='medium', help="niveau de l'IA1 (sans --journal)")
+    rejouer.add_argument('--ia2', choices=NIVEAUX, default='medium', help="niveau de l'IA2 (sans --journal)")
+    rejouer.add_argument('--graine', type=int, help="graine de la série (sans --journal)")
+    rejouer.add_argument('--statistiques', action='store_true', help="compteurs de recherche de chaque niveau")
+    rejouer.add_argument('--chemins-historiques', action='store_true',
+                         help="mesure des chemins alternatifs d'origine (sans --journal)")
+    rejouer.add_argument('--sans-livre', action='store_true', help="sans livre d'ouvertures (sans --journal)")
+    rejouer.add_argument('--playouts-mcts', type=int, default=None,
+                         help=f"parties simulées par coup du niveau mcts (sans --journal, par défaut {PLAYOUTS_MCTS})")
+
+    tournoi = commandes.add_parser('tournoi', help="tournoi à la ronde entre configurations d'IA, avec classement Elo")
+    tournoi.add_argument('configurations', nargs='+', metavar='configuration',
+                         help="niveau suivi de réglages, par exemple hard, hard:profondeur=3, medium:temps=0.5, "
+                              "mcts:noeuds=300 or hard:evaluation=historique (voir lire_configuration)")
+    tournoi.add_argument('-n', '--parties', type=int, default=10, help="nombre de parties par paire")
+    tournoi.add_argument('--jobs', type=int, default=None,
+                         help="nombre de processus de calcul (par défaut le nombre de cœurs)")
+    tournoi.add_argument('--graine', type=int, default=None, help="graine du tournoi (reproductible)")
+    tournoi.add_argument('--sortie', help="fichier JSON où écrire les résultats")
+    tournoi.add_argument('--sans-livre', action='store_true', help="sans livre d'ouvertures")
+    tournoi.add_argument('--playouts-mcts', type=int, default=None,
+                         help=f"parties simulées par coup du niveau mcts (par défaut {PLAYOUTS_MCTS})")
+
+    livre = commandes.add_parser('livre', help="construit le livre d'ouvertures")
+    livre.add_argument('--demi-coups', type=int, default=4, help="nombre de demi-coups couverts")
+    livre.add_argument('--profondeur', type=int, default=5, help="profondeur de recherche des positions")
+    livre.add_argument('--jobs', type=int, default=None,
+                       help="nombre de processus de calcul (par défaut le nombre de cœurs)")
+    livre.add_argument('--sortie', default=chemin_livre_ouvertures, help="fichier du livre")
+
+    args = parser.parse_args(argv)
+    if args.commande == 'batch':
+        if args.reprendre and not args.journal:
+            parser.error("--reprendre nécessite --journal")
+        if args.reprendre and args.ecraser:
+            parser.error("--reprendre and --ecraser sont incompatibles")
+        if args.chemins_historiques:
+            CHEMINS_ALTERNATIFS_HISTORIQUE = True
+        if args.sans_livre:
+            configurer_livre_ouvertures(None)
+        if args.playouts_mcts is not None:
+            configurer_mcts(args.playouts_mcts)
+        try:
+            resume = run_batch_simulations(NIVEAUX[args.ia1], NIVEAUX[args.ia2], args.matchs,
+                                           processus=args.jobs, graine=args.graine,
+                                           statistiques=args.statistiques, journal=args.journal,
+                                           reprendre=args.reprendre, ecraser=args.ecraser)
+        except ValueError as erreur:
+            parser.error(str(erreur))
+        if args.sortie:
+            scores = resume['scores']
+            donnees = {
+                'ia1': args.ia1,
+                'ia2': args.ia2,
+                'graine': resume['graine'],
+                'victoires_ia1': scores[1],
+                'victoires_ia2': scores[2],
+                'nuls': scores[0],
+                'moyenne_coups': resume['moyenne_coups'],
+                'matchs': [{'match': match, 'gagnant': gagnant, 'coups': coups}
+                           for match, gagnant, coups in resume['matchs']],
+            }
+            if 'statistiques' in resume:
+                donnees['statistiques'] = {nom: stats.en_dict()
+                                           for nom, stats in resume['statistiques'].items()}
+            with open(args.sortie, 'w', encoding='utf-8') as fichier:
+                json.dump(donnees, fichier, indent=2)
+                fichier.write('\n')
+    elif args.commande == 'rejouer':
+        enregistrement = None
+        if args.journal:
+            enregistrement = next((enregistrement for enregistrement in lire_journal(args.journal)
+                                   if enregistrement['match'] == args.match), None)
+            if enregistrement is None:
+                parser.error(f"match {args.match} absent de {args.journal}")
+            args.ia1, args.ia2, args.graine = enregistrement['ia1'], enregistrement['ia2'], enregistrement['serie']
+        elif args.graine is None:
+            parser.error("--graine or --journal est nécessaire")
+        if args.chemins_historiques:
+            CHEMINS_ALTERNATIFS_HISTORIQUE = True
+        if args.sans_livre:
+            configurer_livre_ouvertures(None)
+        if args.playouts_mcts is not None:
+            configurer_mcts(args.playouts_mcts)
+        if enregistrement is not None and 'reglages' in enregistrement:
+            # Réglages du moteur de la série, plutôt que ceux de la ligne de commande
+            _appliquer_reglages_moteur(enregistrement['reglages'])
+            if _reglages_moteur() != enregistrement['reglages']:
+                parser.error(f"réglages de la série {enregistrement['reglages']} impossibles à rétablir "
+                             f"(livre d'ouvertures absent ?)")
+        gagnant, coups, partie = _jouer_match(NIVEAUX[args.ia1], NIVEAUX[args.ia2], f"{args.graine}:{args.match}",
+                                              args.statistiques)
+        for demi_coup, (joueur, type_coup, coup) in enumerate(partie['deroulement'], 1):
+            if type_coup == "mur":
+                coup = f"{coup['orientation']} x={coup['x']} y={coup['y']}"
+            print(f"{demi_coup:4}. J{joueur} {type_coup} {coup if coup is not None else ''}")
+        print(f"Match {args.match} ({args.ia1} contre {args.ia2}, graine {args.graine}:{args.match}) : "
+              f"{'match nul' if gagnant == 0 else f'J{gagnant} gagne'} en {coups} coups, "
+              f"murs posés {partie['murs_ia1']}/{partie['murs_ia2']}, {partie['duree']:.2f} s")
+        if enregistrement is not None:
+            identique = (enregistrement['gagnant'], enregistrement['coups']) == (gagnant, coups)
+            print("Identique au journal" if identique else
+                  f"Différent du journal : J{enregistrement['gagnant']} en {enregistrement['coups']} coups")
+        for difficulte, stats in sorted(partie.get('statistiques', {}).items()):
+            print(f"\nStatistiques de recherche - {_nom_niveau(difficulte)}:")
+            for ligne in stats.resume():
+                print(f"- {ligne}")
+    elif args.commande == 'tournoi':
+        if args.sans_livre:
+            configurer_livre_ouvertures(None)
+        if args.playouts_mcts is not None:
+            configurer_mcts(args.playouts_mcts)
+        try:
+            configurations = [lire_configuration(texte) for texte in args.configurations]
+            resume = run_tournoi(configurations, args.parties, processus=args.jobs, graine=args.graine)
+        except ValueError as erreur:
+            parser.error(str(erreur))
+        if args.sortie:
+            noms = resume['configurations']
+            donnees = {
+                'graine': resume['graine'],
+                'parties_par_paire': args.parties,
+                'classement': [{'configuration': nom, 'elo': round(elo, 1), 'intervalle': [round(bas, 1), round(haut, 1)],
+                                'points': sum(points for points, _ in ligne),
+                                'parties': sum(parties for _, parties in ligne)}
+                               for nom, (elo, bas, haut), ligne in zip(noms, resume['elo'], resume['tableau'])],
+                'tableau': {nom: {adversaire: {'points': points, 'parties': parties}
+                                  for adversaire, (points, parties) in zip(noms, ligne) if adversaire != nom}
+                            for nom, ligne in zip(noms, resume['tableau'])},
+                'parties': [{'j1': noms[j1], 'j2': noms[j2], 'gagnant': gagnant, 'coups': coups}
+                            for j1, j2, gagnant, coups in resume['parties']],
+            }
+            with open(args.sortie, 'w', encoding='utf-8') as fichier:
+                json.dump(donnees, fichier, indent=2)
+                fichier.write('\n')
+    elif args.commande == 'livre':
+        entrees = construire_livre_ouvertures(args.demi_coups, args.profondeur, args.jobs)
+        ecrire_livre_ouvertures(args.sortie, entrees)
+        print(f"{len(entrees)} positions écrites dans {args.sortie}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
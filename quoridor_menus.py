@@ -5,25 +5,11 @@ import os
 import importlib.util
 import threading
 
-# Import our game module
-try:
-    # Add the directory to path so we can import from it
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Import the game module (Projet IA.py)
-    spec = importlib.util.spec_from_file_location(
-        "quoridor_game", 
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "Projet IA.py")
-    )
-    quoridor_game = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(quoridor_game)
-    
-    # Verify that the necessary function exists
-    if not hasattr(quoridor_game, "launch_game"):
-        print("Error: launch_game function not found in the game module")
-except Exception as e:
-    print(f"Error importing game module: {e}")
-    quoridor_game = None
+# Add the directory to path so we can import from it
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Batch simulations run in the engine, without the game module
+import quoridor_engine
 
 class QuoridorMenuApp:
     def __init__(self, root):
@@ -43,6 +29,7 @@ class QuoridorMenuApp:
         self.DIFFICULTY_EASY = 2
         self.DIFFICULTY_MEDIUM = 5
         self.DIFFICULTY_HARD = 7
+        self.DIFFICULTY_MCTS = 9
         
         # Game state variables
         self.selected_mode = None
@@ -183,6 +170,13 @@ class QuoridorMenuApp:
                               command=lambda: self.set_difficulty_and_start(self.DIFFICULTY_HARD))
         hard_button.pack(pady=10)
         
+        mcts_button = tk.Button(button_frame, text="MCTS", 
+                              font=('Nova Square', 16),
+                              bg="#FFD700", fg="#0a1428",
+                              width=button_width, height=button_height,
+                              command=lambda: self.set_difficulty_and_start(self.DIFFICULTY_MCTS))
+        mcts_button.pack(pady=10)
+        
         # Back button
         back_button = tk.Button(self.root, text="Retour", 
                               font=('Nova Square', 14),
@@ -235,6 +229,13 @@ class QuoridorMenuApp:
                            command=lambda: self.set_ia1_difficulty(self.DIFFICULTY_HARD))
         ia1_hard.grid(row=0, column=2, padx=10)
         
+        ia1_mcts = tk.Button(ia1_frame, text="MCTS", 
+                           font=('Nova Square', 14),
+                           bg="#FFD700", fg="#0a1428",
+                           width=button_width, height=button_height,
+                           command=lambda: self.set_ia1_difficulty(self.DIFFICULTY_MCTS))
+        ia1_mcts.grid(row=0, column=3, padx=10)
+        
         # Title for IA2
         title_label2 = tk.Label(self.root, text="Difficulté IA2 (bleu)", 
                               font=('Nova Square', 36, 'bold'), 
@@ -267,6 +268,13 @@ class QuoridorMenuApp:
                            command=lambda: self.set_ia2_difficulty_and_start(self.DIFFICULTY_HARD))
         ia2_hard.grid(row=0, column=2, padx=10)
         
+        ia2_mcts = tk.Button(ia2_frame, text="MCTS", 
+                           font=('Nova Square', 14),
+                           bg="#FFD700", fg="#0a1428",
+                           width=button_width, height=button_height,
+                           command=lambda: self.set_ia2_difficulty_and_start(self.DIFFICULTY_MCTS))
+        ia2_mcts.grid(row=0, column=3, padx=10)
+        
         # Back button
         back_button = tk.Button(self.root, text="Retour", 
                               font=('Nova Square', 14),
@@ -322,6 +330,11 @@ class QuoridorMenuApp:
                                 activebackground="#0a1428", activeforeground="white")
         ia1_hard.pack(side=tk.LEFT, padx=10)
         
+        ia1_mcts = tk.Radiobutton(ia1_frame, text="MCTS", variable=ia1_var, value=str(self.DIFFICULTY_MCTS),
+                                font=('Nova Square', 14), bg="#0a1428", fg="white", selectcolor="#0a1428",
+                                activebackground="#0a1428", activeforeground="white")
+        ia1_mcts.pack(side=tk.LEFT, padx=10)
+        
         # IA2 difficulty selection
         tk.Label(main_frame, text="IA 2 (Bleu):", font=('Nova Square', 16), 
                fg="white", bg="#0a1428").grid(row=1, column=0, sticky='w', pady=10)
@@ -346,6 +359,11 @@ class QuoridorMenuApp:
                                 activebackground="#0a1428", activeforeground="white")
         ia2_hard.pack(side=tk.LEFT, padx=10)
         
+        ia2_mcts = tk.Radiobutton(ia2_frame, text="MCTS", variable=ia2_var, value=str(self.DIFFICULTY_MCTS),
+                                font=('Nova Square', 14), bg="#0a1428", fg="white", selectcolor="#0a1428",
+                                activebackground="#0a1428", activeforeground="white")
+        ia2_mcts.pack(side=tk.LEFT, padx=10)
+        
         # Number of matches
         num_matches_frame = tk.Frame(main_frame, bg="#0a1428")
         num_matches_frame.grid(row=2, column=0, columnspan=2, pady=30)
@@ -460,7 +478,8 @@ class QuoridorMenuApp:
         difficulty_names = {
             self.DIFFICULTY_EASY: "Facile",
             self.DIFFICULTY_MEDIUM: "Intermédiaire",
-            self.DIFFICULTY_HARD: "Difficile"
+            self.DIFFICULTY_HARD: "Difficile",
+            self.DIFFICULTY_MCTS: "MCTS"
         }
         ia1_name = difficulty_names.get(ia1_difficulty, "Inconnu")
         ia2_name = difficulty_names.get(ia2_difficulty, "Inconnu")
@@ -539,15 +558,10 @@ class QuoridorMenuApp:
         self.batch_thread.start()
         
     def run_batch_simulation(self, game_params):
-        """Run the batch simulation by calling the Pygame module"""
+        """Run the batch simulation in the engine"""
         try:
-            # We're checking if the quoridor_game module is available
-            if not hasattr(quoridor_game, "run_batch_simulations_with_progress"):
-                self.progress_label.config(text="Erreur: fonction de simulation introuvable")
-                return
-                
             # Run the batch simulation with progress updates
-            quoridor_game.run_batch_simulations_with_progress(
+            quoridor_engine.run_batch_simulations_with_progress(
                 game_params['ai1_difficulty'],
                 game_params['ai2_difficulty'],
                 game_params['num_matches'],
@@ -582,7 +596,8 @@ class QuoridorMenuApp:
         difficulty_names = {
             self.DIFFICULTY_EASY: "Facile",
             self.DIFFICULTY_MEDIUM: "Intermédiaire",
-            self.DIFFICULTY_HARD: "Difficile"
+            self.DIFFICULTY_HARD: "Difficile",
+            self.DIFFICULTY_MCTS: "MCTS"
         }
         ia1_name = difficulty_names.get(self.selected_ai1_difficulty, "IA1")
         ia2_name = difficulty_names.get(self.selected_ai2_difficulty, "IA2")
@@ -660,5 +675,12 @@ if __name__ == "__main__":
     
     # Launch the game with the selected options if Tkinter menu was closed properly
     # and not closed by clicking the window's X button
-    if game_params and quoridor_game:
+    if game_params:
+        # Import the game module (Projet IA.py)
+        spec = importlib.util.spec_from_file_location(
+            "quoridor_game",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "Projet IA.py")
+        )
+        quoridor_game = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(quoridor_game)
         quoridor_game.launch_game(game_params)